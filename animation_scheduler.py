@@ -0,0 +1,90 @@
+"""
+Galactic Onslaught - Animation Scheduler Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the animation scheduler class, which plays the sprite animations of
+every entity of the game from a single place. An animation is a timeline, a tuple of
+(ticks, sprite) keyframes read from a table of the entity type: the first keyframe is shown
+as soon as the animation starts, and every other keyframe is shown the given number of ticks
+after the start. A keyframe without a sprite removes the entity from the game.
+
+The next keyframe of every running animation is scheduled on a timer wheel, so a tick only
+visits the animations that change sprite on that tick, however many explosions are running.
+Starting an animation on an entity replaces the animation it was playing. The scheduler is
+advanced by the simulation ticks, which stop while the game is paused, so the animations
+pause with the game.
+
+Implementation:
+This module is imported by the simulation module. The Simulation class advances an
+AnimationScheduler on every tick, and the SpaceFighter and AlienShip classes start the
+animations of their timeline tables on it.
+"""
+
+# Import modules
+from timer_wheel import TimerWheel
+
+class AnimationScheduler:
+    """
+    The AnimationScheduler class plays the timeline animations of the entities on the simulation ticks.
+
+    Attributes:
+    - wheel: An instance of TimerWheel holding the next keyframe of every running animation.
+    - active: A dictionary mapping every animated entity to its [timeline, keyframe index, start tick] state.
+    """
+
+    def __init__(self):
+        self.wheel = TimerWheel()
+        self.active = {}
+
+    def __len__(self):
+        return len(self.active)
+
+    def start(self, entity, name, tick):
+        """The start method starts the animation of an entity on a tick, replacing the one it was playing."""
+        state = [entity.timelines[name], 0, tick]
+        self.active[entity] = state
+        self.show_keyframe(entity, state)
+
+    def show_keyframe(self, entity, state):
+        """The show_keyframe method shows the current keyframe of an animation and schedules the next one."""
+        timeline, index, start_tick = state
+        sprite = timeline[index][1]
+
+        # A keyframe without a sprite removes the entity from the game
+        if sprite is None:
+            entity.removed = True
+        else:
+            entity.current_sprite = sprite
+
+        # Forget the animation after its last keyframe
+        if index + 1 == len(timeline):
+            del self.active[entity]
+            return
+
+        state[1] = index + 1
+        self.wheel.schedule(start_tick + timeline[index + 1][0], (entity, state))
+
+    def advance(self, tick):
+        """The advance method shows the keyframes due on a tick and returns the number of entities removed."""
+        removed = 0
+
+        for entity, state in self.wheel.pop_due(tick):
+            # The keyframes of an animation replaced by another one are dropped when they come up
+            if self.active.get(entity) is not state:
+                continue
+
+            self.show_keyframe(entity, state)
+            removed += entity.removed
+
+        return removed
+
+    def clear(self):
+        """The clear method stops every animation."""
+        self.wheel.clear()
+        self.active.clear()
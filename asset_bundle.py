@@ -0,0 +1,225 @@
+"""
+Galactic Onslaught - Asset Bundle Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the asset bundle class, which packs every image under assets/img into
+a single file of pre-decoded images. Opaque images are stored as raw PPM images and images
+with an alpha channel as PNG images with uncompressed data and no row filters, so Tk loads
+both without inflating or unfiltering any pixels. The bundle starts with a manifest that
+lists the offset, size and format of every image, together with the size, modification
+time and SHA-256 checksum of the PNG file it was built from.
+
+When the game starts, the bundle is read with a single file read. If a PNG file was added,
+removed or changed since the bundle was built, the game loads the PNG files as before and
+rebuilds the bundle in a background thread for the next run.
+
+Implementation:
+This module is imported by the main game module, which loads the bundle and hands it to the
+sprite registry and the collision module. The bundle can also be built by hand with
+"python asset_bundle.py".
+"""
+
+# Import modules
+import hashlib
+import json
+import os
+import struct
+import threading
+import zlib
+from png_reader import PNG_SIGNATURE, read_png_data
+from sprite_registry import ASSETS_DIRECTORY, SpriteRegistry, sprites
+
+# File containing the asset bundle
+BUNDLE_FILE = "assets/assets.bundle"
+
+# First bytes of a bundle file, followed by the length of the manifest
+BUNDLE_MAGIC = b"GOBUNDLE1"
+
+def encode_ppm(width, height, rows):
+    """The encode_ppm function returns a binary PPM image of the RGB bytes of RGBA rows."""
+    pixels = bytearray()
+    for row in rows:
+        # Drop the alpha byte of every pixel
+        rgba = bytes(row)
+        rgb = bytearray(width * 3)
+        rgb[0::3] = rgba[0::4]
+        rgb[1::3] = rgba[1::4]
+        rgb[2::3] = rgba[2::4]
+        pixels += rgb
+
+    return b"P6\n%d %d\n255\n" % (width, height) + bytes(pixels)
+
+def decode_ppm(data):
+    """The decode_ppm function returns the width, height and RGBA rows of a PPM image made by encode_ppm."""
+    _, size, _, pixels = data.split(b"\n", 3)
+    width, height = (int(value) for value in size.split())
+
+    rows = []
+    stride = width * 3
+    for y in range(height):
+        rgb = pixels[y * stride:(y + 1) * stride]
+        rgba = bytearray(b"\xff" * (width * 4))
+        rgba[0::4] = rgb[0::3]
+        rgba[1::4] = rgb[1::3]
+        rgba[2::4] = rgb[2::3]
+        rows.append(bytes(rgba))
+
+    return width, height, rows
+
+def png_chunk(chunk_type, data):
+    """The png_chunk function returns a PNG chunk with its length and CRC."""
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+def encode_stored_png(width, height, rows):
+    """The encode_stored_png function returns an RGBA PNG image with unfiltered, uncompressed data."""
+    # Filter type 0 on every row and compression level 0 store the pixels as they are
+    raw = b"".join(b"\x00" + bytes(row) for row in rows)
+
+    return (
+        PNG_SIGNATURE +
+        png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)) +
+        png_chunk(b"IDAT", zlib.compress(raw, 0)) +
+        png_chunk(b"IEND", b""))
+
+def file_checksum(file):
+    """The file_checksum function returns the SHA-256 checksum of a file."""
+    with open(file, "rb") as source_file:
+        return hashlib.sha256(source_file.read()).hexdigest()
+
+def build_bundle(directory=ASSETS_DIRECTORY, bundle_file=BUNDLE_FILE):
+    """The build_bundle function packs every image under a directory into a bundle file."""
+    manifest = {}
+    blobs = []
+    offset = 0
+
+    for file in SpriteRegistry(directory).asset_files():
+        with open(file, "rb") as source_file:
+            source = source_file.read()
+        status = os.stat(file)
+
+        width, height, rows = read_png_data(source, file)
+
+        # Opaque images do not need an alpha channel, so they are stored as PPM images
+        opaque = all(bytes(row)[3::4] == b"\xff" * width for row in rows)
+        blob = encode_ppm(width, height, rows) if opaque else encode_stored_png(width, height, rows)
+
+        manifest[file] = {
+            "format": "ppm" if opaque else "png",
+            "offset": offset,
+            "length": len(blob),
+            "width": width,
+            "height": height,
+            "source_size": status.st_size,
+            "source_mtime_ns": status.st_mtime_ns,
+            "source_sha256": hashlib.sha256(source).hexdigest()
+        }
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps(manifest, indent=1).encode("utf-8")
+
+    # The bundle is swapped in a single step, so a running game never reads it half written
+    temporary_file = bundle_file + ".tmp"
+    with open(temporary_file, "wb") as output:
+        output.write(BUNDLE_MAGIC + struct.pack(">I", len(header)) + header)
+        for blob in blobs:
+            output.write(blob)
+
+    os.replace(temporary_file, bundle_file)
+    return manifest
+
+class AssetBundle:
+    """
+    The AssetBundle class holds the pre-decoded images of a bundle file in memory.
+
+    Parameters:
+    - bundle_file: The path of the bundle file (default is BUNDLE_FILE).
+
+    Attributes:
+    - bundle_file: The path of the bundle file.
+    - manifest: A dictionary mapping each image path to its entry in the bundle.
+    - data: The images of the bundle, one after another.
+    """
+
+    def __init__(self, bundle_file=BUNDLE_FILE):
+        self.bundle_file = bundle_file
+
+        # The whole bundle is read at once
+        with open(bundle_file, "rb") as input_file:
+            content = input_file.read()
+
+        if not content.startswith(BUNDLE_MAGIC):
+            raise ValueError(f"{bundle_file} is not an asset bundle")
+
+        start = len(BUNDLE_MAGIC)
+        (header_length,) = struct.unpack(">I", content[start:start + 4])
+        start += 4
+        self.manifest = json.loads(content[start:start + header_length])
+        self.data = memoryview(content)[start + header_length:]
+
+    def __contains__(self, file):
+        return file in self.manifest
+
+    def image_data(self, file):
+        """The image_data method returns the PPM or PNG data of an image, ready for PhotoImage(data=...)."""
+        entry = self.manifest[file]
+        return bytes(self.data[entry["offset"]:entry["offset"] + entry["length"]])
+
+    def pixel_rows(self, file):
+        """The pixel_rows method returns the width, height and RGBA rows of an image."""
+        data = self.image_data(file)
+
+        if self.manifest[file]["format"] == "ppm":
+            return decode_ppm(data)
+
+        return read_png_data(data, file)
+
+    def stale_files(self, files):
+        """The stale_files method returns the images added, removed or changed since the bundle was built."""
+        stale = sorted(set(self.manifest) ^ set(files))
+
+        for file in set(self.manifest) & set(files):
+            entry = self.manifest[file]
+            status = os.stat(file)
+
+            # The checksum is only computed when the size or the modification time changed
+            if (status.st_size, status.st_mtime_ns) != (entry["source_size"], entry["source_mtime_ns"]):
+                if file_checksum(file) != entry["source_sha256"]:
+                    stale.append(file)
+
+        return stale
+
+def rebuild_in_background(bundle_file=BUNDLE_FILE):
+    """The rebuild_in_background function rebuilds the bundle in a background thread."""
+    thread = threading.Thread(target=build_bundle, kwargs={"bundle_file": bundle_file}, daemon=True)
+    thread.start()
+    return thread
+
+def load_bundle(bundle_file=BUNDLE_FILE):
+    """
+    The load_bundle function returns the asset bundle, or None if the PNG files should be loaded.
+    A missing, unreadable or outdated bundle is rebuilt in a background thread for the next run.
+    """
+    try:
+        bundle = AssetBundle(bundle_file)
+    except (OSError, ValueError):
+        rebuild_in_background(bundle_file)
+        return None
+
+    if bundle.stale_files(sprites.asset_files()):
+        rebuild_in_background(bundle_file)
+        return None
+
+    return bundle
+
+if __name__ == "__main__":
+    # Build the bundle by hand (python asset_bundle.py)
+    built = build_bundle()
+    total = sum(entry["length"] for entry in built.values())
+    print(f"Packed {len(built)} images ({total / 1024:.0f} KB) into {BUNDLE_FILE}")
@@ -0,0 +1,112 @@
+"""
+Galactic Onslaught - Asset Preloader Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the asset preloader class, which prepares the images and collision
+masks of the next screen while the current screen is idle. A background thread reads the
+image files and builds their collision masks, and the Tk thread, which is the only thread
+allowed to create Tk images, turns one read file into a PhotoImage at a time whenever it
+polls the results. The images end up in the sprite registry, so the next screen finds them
+already loaded instead of decoding them when it is shown.
+
+Implementation:
+This module is imported by the main game module. The GameSession class preloads the game
+images and masks while the start menu is shown, and closes the preloader with the window.
+"""
+
+# Import modules
+import base64
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import collision
+from sprite_registry import sprites
+
+class AssetPreloader:
+    """
+    The AssetPreloader class loads images and collision masks ahead of time.
+
+    Parameters:
+    - master: The Tkinter widget used to poll the read files.
+    - registry: The sprite registry the images are loaded into (default is sprites).
+    - poll_interval: The milliseconds between two polls, each loading one image (default is 10).
+
+    Attributes:
+    - master: The Tkinter widget used to poll the read files.
+    - registry: The sprite registry the images are loaded into.
+    - executor: The single thread executor reading the files.
+    - results: A queue of (file, data) tuples read and waiting for the Tk thread.
+    - pending: The set of files submitted and not loaded yet.
+    - loaded: The number of images loaded by the preloader.
+    """
+
+    def __init__(self, master, registry=sprites, poll_interval=10):
+        self.master = master
+        self.registry = registry
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preloader")
+        self.results = queue.Queue()
+        self.pending = set()
+        self.loaded = 0
+        self.after_id = None
+
+    def preload(self, image_files, mask_files=()):
+        """The preload method starts loading the images and collision masks that are not loaded yet."""
+        for file in image_files:
+            if file not in self.registry.images and file not in self.pending:
+                self.pending.add(file)
+                self.executor.submit(self.read_image, file)
+
+        for file in mask_files:
+            self.executor.submit(collision.get_mask, file)
+
+        if self.pending and self.after_id is None:
+            self.after_id = self.master.after(self.poll_interval, self.poll)
+
+    def read_image(self, file):
+        """The read_image method reads an image file on the background thread."""
+        # Bundled images are already in memory and need no reading
+        data = self.registry.bundle_data(file)
+        if data is not None:
+            self.results.put((file, data))
+            return
+
+        try:
+            with open(file, "rb") as image_file:
+                data = base64.b64encode(image_file.read()).decode("ascii")
+        except OSError:
+            # The image is loaded from its file when it is needed, which reports the error
+            data = None
+
+        self.results.put((file, data))
+
+    def poll(self):
+        """The poll method loads one read image on the Tk thread and polls again while images are pending."""
+        self.after_id = None
+
+        try:
+            file, data = self.results.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            # The image may have been loaded directly if it was needed before it was read
+            if data is not None and file not in self.registry.images:
+                self.registry.load_data(file, data)
+                self.loaded += 1
+            self.pending.discard(file)
+
+        if self.pending:
+            self.after_id = self.master.after(self.poll_interval, self.poll)
+
+    def close(self):
+        """The close method stops polling and lets the background thread finish its work."""
+        if self.after_id is not None:
+            self.master.after_cancel(self.after_id)
+            self.after_id = None
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,70 @@
+"""
+Galactic Onslaught - Background Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the scrolling background class, which scrolls one or more background
+layers vertically, each at its own speed for a parallax effect. Every layer is drawn with
+two copies of its image, one above the other, sharing a canvas tag. The class keeps the
+scroll offset of each layer itself, so it never asks Tk where the images are: scrolling
+a layer is a single canvas.move call on its tag, which also wraps the images back to the
+top once they have scrolled a full image height.
+
+Implementation:
+This module is imported by the main game module. The Game class creates a ScrollingBackground
+with the game background image as its only layer and scrolls it on every frame.
+"""
+
+# Import modules
+import constants
+
+class ScrollingBackground:
+    """
+    The ScrollingBackground class scrolls layers of background images without querying the canvas.
+
+    Parameters:
+    - canvas: The Tkinter canvas widget the layers are drawn on.
+    - height: The height of the layer images (default is GAME_HEIGHT).
+
+    Attributes:
+    - canvas: The Tkinter canvas widget the layers are drawn on.
+    - height: The height of the layer images.
+    - layers: A list of [tag, speed_factor, offset] lists, from the back layer to the front layer.
+    """
+
+    def __init__(self, canvas, height=constants.GAME_HEIGHT):
+        self.canvas = canvas
+        self.height = height
+        self.layers = []
+
+    def add_layer(self, image, speed_factor=1.0):
+        """The add_layer method adds a layer in front of the others, scrolling at speed_factor times the scroll distance."""
+        tag = f"background-{len(self.layers)}"
+
+        # Two copies of the image, one on screen and one right above it, for seamless scrolling
+        self.canvas.create_image(0, 0, anchor="nw", image=image, tags=tag)
+        self.canvas.create_image(0, -self.height, anchor="nw", image=image, tags=tag)
+
+        self.layers.append([tag, speed_factor, 0.0])
+        return tag
+
+    def scroll(self, distance):
+        """The scroll method scrolls every layer by its share of the distance and returns the number of canvas calls."""
+        calls = 0
+
+        for layer in self.layers:
+            tag, speed_factor, offset = layer
+
+            # Once the images have scrolled a full height, they wrap back to their first position
+            new_offset = (offset + distance * speed_factor) % self.height
+            if new_offset != offset:
+                self.canvas.move(tag, 0, new_offset - offset)
+                layer[2] = new_offset
+                calls += 1
+
+        return calls
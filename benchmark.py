@@ -0,0 +1,297 @@
+"""
+Galactic Onslaught - Benchmark Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the benchmark suite of the game engine. It runs scripted scenarios on
+the headless simulation with a fixed random seed, so every run simulates exactly the same
+game: an idle wave, a level 20 wave, a held fire key, heavy overlap on swept_collision and,
+when NumPy is installed, a horde wave. Each scenario reports its ticks per second, the time
+spent in each phase of a tick, its peak memory and the Python bytecode instructions it runs
+per tick, and is compared against a baseline JSON file to catch performance regressions
+before a build is shipped.
+
+The timings depend on the load of the machine, so a slowdown smaller than the tolerance can
+go unnoticed. The instruction count does not: the scenarios are seeded, so it only changes
+when the code does, and it is checked with a much smaller tolerance. The NumPy work of the
+horde wave runs in C and is only covered by the timings.
+
+Implementation:
+The benchmark is started from the main game module with "python game_solution.py --bench",
+or directly with "python benchmark.py". The --save-baseline option stores the results as
+the new baseline, --tolerance sets the slowdown allowed before a scenario fails and
+--instruction-tolerance the growth of its instructions per tick.
+"""
+
+# Import modules
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from entity_store import numpy_available
+from simulation import Simulation, PHASES
+
+# File storing the baseline results
+BENCHMARK_BASELINE_FILE = "benchmark_baseline.json"
+
+# Seed of the random number generator of every scenario
+BENCHMARK_SEED = 2023
+
+# Number of timing runs of each scenario, the fastest run is kept to filter out noise
+BENCHMARK_REPEATS = 5
+
+# Slowdown (or memory growth) allowed against the baseline before a scenario fails
+BENCHMARK_TOLERANCE = 0.25
+
+# Growth of the instructions per tick allowed against the baseline before a scenario fails
+BENCHMARK_INSTRUCTION_TOLERANCE = 0.05
+
+def create_simulation(level=0):
+    """The create_simulation function creates a seeded simulation that starts at the given level."""
+    # The waves are the regular ones whether NumPy is installed or not, the horde_wave
+    # scenario spawns its horde wave itself
+    simulation = Simulation(seed=BENCHMARK_SEED, horde_waves=False)
+
+    # The player cannot lose, so every scenario runs for its full number of ticks
+    simulation.lives = 10**9
+
+    # The first tick levels up to the next level and spawns its wave
+    simulation.level = level
+    return simulation
+
+# Each scenario returns a dictionary with the simulation, the number of ticks to run and
+# optionally a player_input function called before every tick, or a check function that
+# replaces the simulation tick and the number of pixel collision checks it runs.
+
+def idle_wave():
+    """The idle_wave scenario simulates the first wave without any player input."""
+    return {"simulation": create_simulation(), "ticks": 1200}
+
+def level_20_wave():
+    """The level_20_wave scenario simulates the wave of level 20 without any player input."""
+    return {"simulation": create_simulation(19), "ticks": 1200}
+
+def held_fire_key():
+    """The held_fire_key scenario holds the fire key while sweeping the space fighter left and right."""
+    simulation = create_simulation(9)
+
+    def player_input(tick):
+        # The key repeat of the operating system fires about 30 shots per second
+        if tick % 2 == 0:
+            simulation.apply_input("shoot")
+
+        # The movement keys steer the space fighter as they do in the game, switching every second
+        if (tick // 60) % 2 == 0:
+            simulation.apply_input("steer", -1, 0)
+        else:
+            simulation.apply_input("steer", 1, 0)
+
+    return {"simulation": simulation, "ticks": 1200, "player_input": player_input}
+
+def pixel_overlap():
+    """The pixel_overlap scenario checks the space fighter against a moving alien ship at every overlapping offset."""
+    simulation = create_simulation()
+    simulation.step()
+
+    space_fighter = simulation.space_fighter
+    alien_ship = next(iter(simulation.alien_ships))
+
+    # Offsets where the swept boxes overlap, so every pair reaches the mask test
+    offsets = [(dx, dy) for dx in range(-95, 150, 7) for dy in range(-95, 150, 7)]
+
+    def check(_):
+        for dx, dy in offsets:
+            # The alien ship moved down by its speed during the tick, as in the game
+            alien_ship.x = alien_ship.previous_x = space_fighter.x + dx
+            alien_ship.y = space_fighter.y + dy
+            alien_ship.previous_y = alien_ship.y - alien_ship.speed
+            simulation.swept_collision(space_fighter, alien_ship)
+
+    return {"simulation": simulation, "ticks": 60, "check": check, "checks_per_tick": len(offsets)}
+
+def horde_wave():
+    """The horde_wave scenario simulates a horde wave of 3000 alien ships stored in NumPy arrays."""
+    simulation = create_simulation()
+    simulation.step()
+    simulation.spawn_horde(3000)
+    return {"simulation": simulation, "ticks": 600}
+
+# Scenarios of the benchmark suite, in the order they run
+SCENARIOS = {
+    "idle_wave": idle_wave,
+    "level_20_wave": level_20_wave,
+    "held_fire_key": held_fire_key,
+    "pixel_overlap": pixel_overlap,
+    "horde_wave": horde_wave
+}
+
+def run_ticks(scenario):
+    """The run_ticks function runs a scenario and returns its duration and phase times in seconds."""
+    simulation = scenario["simulation"]
+    player_input = scenario.get("player_input")
+    check = scenario.get("check")
+    phase_times = dict.fromkeys(PHASES, 0.0)
+
+    start = time.perf_counter()
+    for tick in range(scenario["ticks"]):
+        if player_input is not None:
+            player_input(tick)
+
+        # The pixel_overlap scenario only measures its own collision checks
+        if check is not None:
+            check(tick)
+            continue
+
+        simulation.step()
+        for phase, seconds in simulation.phase_times.items():
+            phase_times[phase] += seconds
+
+    return time.perf_counter() - start, phase_times
+
+def count_instructions(scenario):
+    """The count_instructions function runs a scenario and returns the number of bytecode instructions it ran."""
+    instructions = 0
+
+    def trace_call(frame, event, arg):
+        frame.f_trace_opcodes = True
+        frame.f_trace_lines = False
+        return trace_opcode
+
+    def trace_opcode(frame, event, arg):
+        nonlocal instructions
+        if event == "opcode":
+            instructions += 1
+        return trace_opcode
+
+    sys.settrace(trace_call)
+    try:
+        run_ticks(scenario)
+    finally:
+        sys.settrace(None)
+
+    return instructions
+
+def run_scenario(name):
+    """
+    The run_scenario function times the fastest of several runs of a scenario, then measures
+    its peak memory and counts its instructions in two more runs.
+    """
+    scenario = SCENARIOS[name]()
+    ticks = scenario["ticks"]
+    checks = scenario.get("checks_per_tick")
+    duration, phase_times = min((run_ticks(SCENARIOS[name]()) for _ in range(BENCHMARK_REPEATS)), key=lambda run: run[0])
+
+    # Measure the memory in a second run, as tracing the allocations slows down the timings
+    tracemalloc.start()
+    run_ticks(SCENARIOS[name]())
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Count the instructions in a third run, as tracing them is even slower
+    instructions = count_instructions(SCENARIOS[name]())
+
+    result = {
+        "ticks": ticks,
+        "seconds": round(duration, 4),
+        "ticks_per_second": round(ticks / duration, 1),
+        "phase_ms_per_tick": {phase: round(seconds * 1000 / ticks, 4) for phase, seconds in phase_times.items()},
+        "peak_memory_kb": round(peak_memory / 1024, 1),
+        "instructions_per_tick": round(instructions / ticks)
+    }
+
+    if checks is not None:
+        result["pixel_collisions_per_second"] = round(ticks * checks / duration, 1)
+
+    return result
+
+def read_baseline(file):
+    """The read_baseline function returns the stored baseline results, or an empty dictionary."""
+    if not os.path.exists(file):
+        return {}
+
+    with open(file, "r", encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)
+
+def compare(name, result, baseline, tolerance, instruction_tolerance):
+    """The compare function returns the regressions of a scenario against its baseline."""
+    regressions = []
+    expected = baseline.get(name)
+    if expected is None:
+        return regressions
+
+    if result["ticks_per_second"] < expected["ticks_per_second"] * (1 - tolerance):
+        regressions.append(
+            f"{name}: {result['ticks_per_second']} ticks/s, baseline {expected['ticks_per_second']} ticks/s")
+
+    if result["peak_memory_kb"] > expected["peak_memory_kb"] * (1 + tolerance):
+        regressions.append(
+            f"{name}: {result['peak_memory_kb']} KB peak memory, baseline {expected['peak_memory_kb']} KB")
+
+    if "instructions_per_tick" in expected and (
+            result["instructions_per_tick"] > expected["instructions_per_tick"] * (1 + instruction_tolerance)):
+        regressions.append(
+            f"{name}: {result['instructions_per_tick']} instructions per tick, "
+            f"baseline {expected['instructions_per_tick']} instructions per tick")
+
+    return regressions
+
+def main(argv=None):
+    """The main function runs the benchmark suite and returns the exit code (1 if a scenario regressed)."""
+    parser = argparse.ArgumentParser(description="Benchmark the Galactic Onslaught game engine.")
+    parser.add_argument("--bench", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--baseline", default=BENCHMARK_BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE, help="allowed slowdown (0.25 is 25%%)")
+    parser.add_argument(
+        "--instruction-tolerance",
+        type=float,
+        default=BENCHMARK_INSTRUCTION_TOLERANCE,
+        help="allowed growth of the instructions per tick (0.05 is 5%%)")
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run (default is all)")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    if not numpy_available() and "horde_wave" in names:
+        print("Skipping horde_wave, NumPy is not installed")
+        names.remove("horde_wave")
+
+    baseline = read_baseline(args.baseline)
+    results = {}
+    regressions = []
+
+    for name in names:
+        result = run_scenario(name)
+        results[name] = result
+        regressions += compare(name, result, baseline, args.tolerance, args.instruction_tolerance)
+
+        phases = ", ".join(f"{phase} {ms:.3f}" for phase, ms in result["phase_ms_per_tick"].items())
+        expected = baseline.get(name)
+        change = ""
+        if expected:
+            change = f" ({result['ticks_per_second'] / expected['ticks_per_second'] - 1:+.0%} vs baseline)"
+
+        print(f"{name:<16} {result['ticks_per_second']:>10.1f} ticks/s{change}")
+        print(f"{'':<16} ms per tick: {phases}")
+        print(f"{'':<16} peak memory: {result['peak_memory_kb']} KB")
+        print(f"{'':<16} instructions per tick: {result['instructions_per_tick']}")
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(baseline, baseline_file, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
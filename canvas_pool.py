@@ -0,0 +1,129 @@
+"""
+Galactic Onslaught - Canvas Pool Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the canvas item pool class, which reuses the canvas image items of
+short lived sprites such as the lasers. Instead of creating a new canvas item for every
+shot and deleting it when the laser leaves the screen, a released item is hidden and kept
+in the pool, and it is moved back into place and shown the next time a laser is fired.
+The number of canvas items therefore stays bounded however long the game runs. Every item
+of a pool can share a canvas tag, so the lasers that move together are moved with a single
+canvas call.
+
+Implementation:
+This module is imported by the main game module. The Game class creates one pool for each
+laser sprite and acquires and releases pool items while it renders the lasers. The pool
+stats are shown in the frame profiler, and the pools of a horde wave are cleared once the
+wave is gone.
+"""
+
+class CanvasItemPool:
+    """
+    The CanvasItemPool class keeps a fixed number of reusable canvas image items.
+
+    Parameters:
+    - canvas: The Tkinter canvas widget the items belong to.
+    - image: The image displayed by the items of the pool.
+    - capacity: The maximum number of items kept by the pool (default is 256).
+    - tag: The canvas tag of every item of the pool, so they can be moved together (default is None).
+
+    Attributes:
+    - canvas: The Tkinter canvas widget the items belong to.
+    - image: The image displayed by the items of the pool.
+    - capacity: The maximum number of items kept by the pool.
+    - free_items: A list of the hidden items ready to be reused.
+    - items: The number of items kept by the pool, in use or free.
+    - in_use: The number of items currently acquired.
+    - frame_high_water_mark: The highest number of items in use during the current frame.
+    - high_water_mark: The highest number of items in use since the pool was created.
+    - created: The number of canvas items created by the pool.
+    - reused: The number of times a hidden item was reused.
+    - overflow: The number of items created beyond the capacity, deleted on release.
+    - calls: The number of canvas calls made by the pool.
+    """
+
+    def __init__(self, canvas, image, capacity=256, tag=None):
+        self.canvas = canvas
+        self.image = image
+        self.capacity = capacity
+        self.tag = tag
+
+        self.free_items = []
+        self.items = 0
+        self.in_use = 0
+        self.frame_high_water_mark = 0
+        self.high_water_mark = 0
+        self.created = 0
+        self.reused = 0
+        self.overflow = 0
+        self.calls = 0
+
+    def begin_frame(self):
+        """The begin_frame method starts a new frame for the high-water mark statistics."""
+        self.frame_high_water_mark = self.in_use
+
+    def acquire(self, x, y):
+        """The acquire method returns a visible item at (x, y), reusing a hidden item if possible."""
+        if self.free_items:
+            item = self.free_items.pop()
+            self.canvas.coords(item, x, y)
+            self.canvas.itemconfig(item, state="normal")
+            self.reused += 1
+            self.calls += 2
+
+        else:
+            item = self.canvas.create_image(x, y, anchor="center", image=self.image, tags=self.tag)
+            self.created += 1
+            self.calls += 1
+
+            # Items beyond the capacity are not kept by the pool
+            if self.items < self.capacity:
+                self.items += 1
+            else:
+                self.overflow += 1
+
+        self.in_use += 1
+        self.frame_high_water_mark = max(self.frame_high_water_mark, self.in_use)
+        self.high_water_mark = max(self.high_water_mark, self.in_use)
+
+        return item
+
+    def release(self, item):
+        """The release method hides an item and keeps it for reuse, or deletes it if the pool is full."""
+        self.in_use -= 1
+        self.calls += 1
+
+        if len(self.free_items) + self.in_use < self.items:
+            self.canvas.itemconfig(item, state="hidden")
+            self.free_items.append(item)
+        else:
+            self.canvas.delete(item)
+
+    def clear(self):
+        """The clear method deletes the hidden items of the pool."""
+        for item in self.free_items:
+            self.canvas.delete(item)
+            self.calls += 1
+
+        self.items -= len(self.free_items)
+        self.free_items = []
+
+    def stats(self):
+        """The stats method returns the usage statistics of the pool."""
+        return {
+            "capacity": self.capacity,
+            "items": self.items,
+            "in_use": self.in_use,
+            "free": len(self.free_items),
+            "frame_high_water_mark": self.frame_high_water_mark,
+            "high_water_mark": self.high_water_mark,
+            "created": self.created,
+            "reused": self.reused,
+            "overflow": self.overflow
+        }
@@ -0,0 +1,244 @@
+"""
+Galactic Onslaught - Collision Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the collision mask class, which stores the solid pixels of a sprite
+as one Python integer per row. Masks are built once per sprite file with the PNG reader,
+so a pixel perfect collision test becomes a bitwise AND of integers and does not need a
+Tk window at all. It also contains the spatial hash class, a uniform grid
+used as the broad phase, so only entities in neighbouring cells reach the mask test.
+
+Collisions are swept along the path the entities travelled during the tick, so a fast laser
+cannot jump over an alien ship between two checks. The swept bounding boxes of two entities
+give the part of the tick during which they can overlap, and the masks are only compared at
+positions within that part, at steps no longer than the smaller mask.
+
+Implementation:
+This module is imported by the simulation module. The sprite files of the space fighter,
+the alien ships and the lasers are passed to build_masks when the entities are created,
+and the Simulation class looks the masks up with get_mask when it checks for collisions.
+The Simulation class fills a spatial hash with every entity on each tick and queries it
+for the candidate pairs of each collision check.
+"""
+
+# Import modules
+import math
+from png_reader import read_png
+
+# Masks cached by sprite file, so every entity using a sprite shares one mask
+_masks = {}
+
+# Asset bundle the masks are read from, or None to read the PNG files
+_bundle = None
+
+class CollisionMask:
+    """
+    The CollisionMask class represents the solid pixels of a sprite.
+
+    Parameters:
+    - width: The width of the sprite in pixels.
+    - height: The height of the sprite in pixels.
+    - rows: A list with one integer per row, where bit x is set if pixel x is solid.
+
+    Attributes:
+    - width: The width of the sprite in pixels.
+    - height: The height of the sprite in pixels.
+    - rows: A list with one integer per row, where bit x is set if pixel x is solid.
+    """
+
+    def __init__(self, width, height, rows):
+        self.width = width
+        self.height = height
+        self.rows = rows
+
+    @classmethod
+    def from_png(cls, file):
+        """The from_png method builds a mask from the pixels of a PNG file, or of its copy in the asset bundle."""
+        if _bundle is not None and file in _bundle:
+            return cls.from_rows(*_bundle.pixel_rows(file))
+
+        return cls.from_rows(*read_png(file))
+
+    @classmethod
+    def from_rows(cls, width, height, pixel_rows):
+        """The from_rows method builds a mask from the RGBA bytes of every row of an image."""
+        rows = []
+
+        for pixel_row in pixel_rows:
+            bits = 0
+            for x in range(width):
+                # Pixels that are not black are solid, as in the original pixel check
+                if pixel_row[x * 4] or pixel_row[x * 4 + 1] or pixel_row[x * 4 + 2]:
+                    bits |= 1 << x
+            rows.append(bits)
+
+        return cls(width, height, rows)
+
+    def overlaps(self, x1, y1, other, x2, y2):
+        """The overlaps method checks if this mask at (x1, y1) overlaps another at (x2, y2)."""
+
+        # Bounding box check
+        if not (x1 < x2 + other.width and x1 + self.width > x2 and y1 < y2 + other.height and y1 + self.height > y2):
+            return False  # No collision
+
+        # Get the overlapping rows
+        y_overlap = max(y1, y2)
+        y_end = min(y1 + self.height, y2 + other.height)
+
+        # Line up the columns of both masks before comparing the rows
+        shift = x2 - x1
+        rows1 = self.rows
+        rows2 = other.rows
+
+        for y in range(y_overlap, y_end):
+            row1 = rows1[y - y1]
+            row2 = rows2[y - y2]
+
+            if shift >= 0:
+                if (row1 >> shift) & row2:
+                    return True  # Collision detected
+            elif row1 & (row2 >> -shift):
+                return True  # Collision detected
+
+        return False  # No collision
+
+    def sweep(self, x1, y1, dx1, dy1, other, x2, y2, dx2, dy2):
+        """
+        The sweep method checks if this mask moving from (x1, y1) by (dx1, dy1) overlaps another
+        moving from (x2, y2) by (dx2, dy2) at any time during the move.
+        """
+        # Seen from the other mask, this mask moves by the difference of both moves
+        dx = dx1 - dx2
+        dy = dy1 - dy2
+
+        # A move no longer than the smaller mask cannot jump over anything, so only the end of the
+        # move needs a check, as for masks moving together
+        step_width = min(self.width, other.width)
+        step_height = min(self.height, other.height)
+        if abs(dx) <= step_width and abs(dy) <= step_height:
+            return self.overlaps(x1 + dx1, y1 + dy1, other, x2 + dx2, y2 + dy2)
+
+        interval = swept_interval(x1 - x2, y1 - y2, self.width, self.height, dx, dy, other.width, other.height)
+        if interval is None:
+            return False  # The bounding boxes never overlap
+
+        # Steps no longer than the smaller mask cover its whole path between the first and last overlap.
+        # The start of the overlap is only a touching position, or the end of the previous move, and
+        # an end before the end of the move is a touching position too, so neither is checked.
+        start, end = interval
+        steps = max(1, math.ceil(max(abs(dx) / step_width, abs(dy) / step_height) * (end - start)))
+        divisions = steps if end == 1.0 else steps + 1
+
+        for step in range(steps, 0, -1):
+            time = 1.0 if step == divisions else start + (end - start) * step / divisions
+            if self.overlaps(
+                int(x1 + dx1 * time),
+                int(y1 + dy1 * time),
+                other,
+                int(x2 + dx2 * time),
+                int(y2 + dy2 * time)):
+                return True  # Collision detected
+
+        return False  # No collision
+
+def swept_interval(x, y, width, height, dx, dy, other_width, other_height):
+    """
+    The swept_interval function returns the (start, end) fraction of a move during which a box at (x, y)
+    moving by (dx, dy) overlaps a box at (0, 0), or None if it never does.
+    """
+    start = 0.0
+    end = 1.0
+
+    for position, size, distance, other_size in ((x, width, dx, other_width), (y, height, dy, other_height)):
+        if distance == 0:
+            # A box that does not move along this axis overlaps along it for the whole move or never
+            if not (position < other_size and position + size > 0):
+                return None
+            continue
+
+        # Times the box starts and stops overlapping along this axis
+        first = (-size - position) / distance
+        last = (other_size - position) / distance
+        if first > last:
+            first, last = last, first
+
+        start = max(start, first)
+        end = min(end, last)
+        if start > end:
+            return None
+
+    return start, end
+
+def get_mask(file):
+    """The get_mask function returns the cached collision mask of a sprite file, building it if needed."""
+    mask = _masks.get(file)
+
+    if mask is None:
+        mask = CollisionMask.from_png(file)
+        _masks[file] = mask
+
+    return mask
+
+def use_bundle(bundle):
+    """The use_bundle function reads the pixels of the sprites from an asset bundle instead of their PNG files."""
+    global _bundle
+    _bundle = bundle
+
+def build_masks(sprite_files):
+    """The build_masks function builds the collision masks of a dictionary of sprite files."""
+    for file in sprite_files.values():
+        get_mask(file)
+
+class SpatialHash:
+    """
+    The SpatialHash class is a uniform grid used as the broad phase of the collision checks.
+    Every entity is inserted into the cells covered by its bounding box, so a query only
+    returns the entities of a layer that share a cell with the queried box.
+
+    Parameters:
+    - cell_size: The width and height of a grid cell in pixels (default is 150).
+
+    Attributes:
+    - cell_size: The width and height of a grid cell in pixels.
+    - cells: A dictionary mapping (layer, column, row) keys to the entities in that cell.
+    """
+
+    def __init__(self, cell_size=150):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """The clear method empties the grid for the next tick."""
+        self.cells.clear()
+
+    def insert(self, layer, item, x, y, width, height):
+        """The insert method adds an entity to every cell covered by its bounding box."""
+        size = self.cell_size
+
+        for column in range(x // size, (x + width - 1) // size + 1):
+            for row in range(y // size, (y + height - 1) // size + 1):
+                key = (layer, column, row)
+                cell = self.cells.get(key)
+
+                if cell is None:
+                    self.cells[key] = [item]
+                else:
+                    cell.append(item)
+
+    def query(self, layer, x, y, width, height):
+        """The query method returns the entities of a layer that share a cell with a bounding box."""
+        size = self.cell_size
+        found = {}
+
+        for column in range(x // size, (x + width - 1) // size + 1):
+            for row in range(y // size, (y + height - 1) // size + 1):
+                for item in self.cells.get((layer, column, row), ()):
+                    found[item] = None # A dictionary keeps the order and drops duplicates
+
+        return list(found)
@@ -16,6 +16,12 @@ GAME_TITLE = "Galactic Onslaught" # Game title
 GAME_WIDTH = 1440 # Game window width
 GAME_HEIGHT = 900 # Game window height
 GAME_SPEED = 60 # Game speed (FPS)
+LASER_POOL_CAPACITY = 256 # Laser canvas items kept for reuse, per laser sprite
+HORDE_WAVE_INTERVAL = 10 # Levels between two horde waves, played only when NumPy is installed
+HORDE_WAVE_SIZE = 60 # Alien ships of a horde wave
+LEADERBOARD_BACKEND = "journal" # Leaderboard storage, "journal" or "sqlite"
+LEADERBOARD_COMPACTION_THRESHOLD = 500 # Outdated leaderboard records that trigger a compaction
+REPLAY_FILE = "assets/db/last-game.replay" # Replay of the last game played, None to not record the games
 
 PLAYER_NAME_MAX_LENGTH = 10 # Maximum length of the player's name
 PLAYER_NAME_MIN_LENGTH = 3 # Minimum length of the player's name
@@ -0,0 +1,114 @@
+"""
+Galactic Onslaught - Entity Arena Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the entity arena class, which stores the entities of one kind in a
+dense list that is cheap to iterate and to remove from. Every entity gets a handle, a slot
+number and the generation of that slot. Removing an entity bumps the generation of its slot
+at once, so its handle and a membership test stop finding it, but the entity stays in the
+list until the arena is flushed. A flush swaps every removed entity with the last one of
+the list and drops it, so a removal costs the same whatever the number of entities, and a
+loop over the entities never skips one because another was removed during the loop.
+
+Implementation:
+This module is imported by the simulation module, which keeps the alien ships, the lasers
+of the space fighter and the lasers of the alien ships in arenas and flushes them at the
+end of each phase of a tick.
+"""
+
+class EntityArena:
+    """
+    The EntityArena class stores entities in a dense list with generational handles.
+
+    Attributes:
+    - entities: The dense list of the entities, removed entities included until the next flush.
+    - generations: The generation of every slot, bumped each time its entity is removed.
+    - indices: The index in entities of the entity of every slot, or None for a free slot.
+    - free_slots: The slots free to be reused by the next entities added.
+    - pending: The slots removed since the last flush.
+    """
+
+    def __init__(self):
+        self.entities = []
+        self.generations = []
+        self.indices = []
+        self.free_slots = []
+        self.pending = []
+
+    def __len__(self):
+        return len(self.entities) - len(self.pending)
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    def __contains__(self, entity):
+        handle = entity.handle
+        return handle is not None and self.get(handle) is entity
+
+    def add(self, entity):
+        """The add method adds an entity to the arena and returns its handle, also stored on the entity."""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            slot = len(self.generations)
+            self.generations.append(0)
+            self.indices.append(None)
+
+        self.indices[slot] = len(self.entities)
+        self.entities.append(entity)
+
+        entity.handle = (slot, self.generations[slot])
+        return entity.handle
+
+    def get(self, handle):
+        """The get method returns the entity of a handle, or None if it has been removed."""
+        slot, generation = handle
+        if slot >= len(self.generations) or self.generations[slot] != generation:
+            return None
+
+        return self.entities[self.indices[slot]]
+
+    def remove(self, entity):
+        """The remove method removes an entity at once for its handle, and from the list at the next flush."""
+        if entity not in self:
+            return
+
+        slot, _ = entity.handle
+        self.generations[slot] += 1
+        self.pending.append(slot)
+
+    def flush(self):
+        """The flush method drops the removed entities from the list, swapping each with the last entity."""
+        entities = self.entities
+        indices = self.indices
+
+        for slot in self.pending:
+            index = indices[slot]
+            last = entities.pop()
+
+            # The last entity takes the place of the removed one, unless it is the removed one
+            if index < len(entities):
+                entities[index] = last
+                indices[last.handle[0]] = index
+
+            indices[slot] = None
+            self.free_slots.append(slot)
+
+        self.pending.clear()
+
+    def clear(self):
+        """The clear method removes every entity from the arena at once."""
+        for slot, index in enumerate(self.indices):
+            if index is not None:
+                self.generations[slot] += 1
+                self.indices[slot] = None
+                self.free_slots.append(slot)
+
+        self.entities.clear()
+        self.pending.clear()
@@ -0,0 +1,185 @@
+"""
+Galactic Onslaught - Entity Store Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the entity arrays class, a structure of arrays that stores the
+positions, speeds, directions, sprite states and timers of many entities of one type in
+NumPy arrays. Movement, off-screen culling and the bounding box prefilter of the collision
+checks run as vectorized operations over every entity at once, instead of a Python method
+call per entity.
+
+NumPy is optional. The game runs without it, only the horde waves need it.
+
+Implementation:
+This module is imported by the simulation module, which stores the alien ships and the
+alien lasers of a horde wave in EntityArrays. The main game module draws them at the
+positions returned by their interpolate method.
+"""
+
+# Import modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Fields of the entity arrays and their NumPy types
+FIELDS = {
+    "x": "float64",
+    "y": "float64",
+    "previous_x": "float64",
+    "previous_y": "float64",
+    "speed": "float64",
+    "direction": "int8",
+    "sprite": "int8",
+    "timer": "int32",
+    "cooldown": "int32"
+}
+
+def numpy_available():
+    """The numpy_available function checks if NumPy can be used by the entity arrays."""
+    return numpy is not None
+
+class EntityArrays:
+    """
+    The EntityArrays class stores the entities of one type as a structure of NumPy arrays.
+    Only the first count elements of every array hold entities.
+
+    Parameters:
+    - width: The width of the bounding box of the entities.
+    - height: The height of the bounding box of the entities.
+    - capacity: The initial length of the arrays (default is 64).
+
+    Attributes:
+    - width: The width of the bounding box of the entities.
+    - height: The height of the bounding box of the entities.
+    - count: The number of entities stored.
+    - x, y: The position of each entity.
+    - previous_x, previous_y: The position of each entity before the last tick.
+    - speed: The speed of each entity.
+    - direction: The vertical direction of each entity (1 is down, -1 is up).
+    - sprite: The sprite state of each entity.
+    - timer: The ticks left in the current sprite state of each entity.
+    - cooldown: The ticks left before each entity can shoot again.
+    """
+
+    def __init__(self, width, height, capacity=64):
+        if numpy is None:
+            raise ImportError("NumPy is required to store entities in arrays")
+
+        self.width = width
+        self.height = height
+        self.count = 0
+
+        for field, dtype in FIELDS.items():
+            setattr(self, field, numpy.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def reserve(self, capacity):
+        """The reserve method grows the arrays so they can hold at least the given number of entities."""
+        if capacity <= len(self.x):
+            return
+
+        # Double the arrays so repeated additions stay cheap
+        new_capacity = max(capacity, 2 * len(self.x))
+        for field in FIELDS:
+            array = getattr(self, field)
+            grown = numpy.zeros(new_capacity, dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            setattr(self, field, grown)
+
+    def extend(self, x, y, speed, direction, sprite=0):
+        """The extend method adds entities from arrays (or scalars) of positions and speeds."""
+        x = numpy.atleast_1d(x)
+        added = len(x)
+        start = self.count
+        end = start + added
+
+        self.reserve(end)
+
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.previous_x[start:end] = x
+        self.previous_y[start:end] = y
+        self.speed[start:end] = speed
+        self.direction[start:end] = direction
+        self.sprite[start:end] = sprite
+        self.timer[start:end] = 0
+        self.cooldown[start:end] = 0
+
+        self.count = end
+
+    def view(self, field):
+        """The view method returns the part of an array that holds entities."""
+        return getattr(self, field)[:self.count]
+
+    def remember_positions(self):
+        """The remember_positions method stores the current positions as the previous positions."""
+        self.previous_x[:self.count] = self.x[:self.count]
+        self.previous_y[:self.count] = self.y[:self.count]
+
+    def interpolate(self, alpha):
+        """The interpolate method returns the positions between the previous and current positions."""
+        count = self.count
+        previous_x = self.previous_x[:count]
+        previous_y = self.previous_y[:count]
+
+        return (
+            previous_x + (self.x[:count] - previous_x) * alpha,
+            previous_y + (self.y[:count] - previous_y) * alpha)
+
+    def move(self):
+        """The move method moves every entity vertically by its speed in its direction."""
+        count = self.count
+        self.y[:count] += self.speed[:count] * self.direction[:count]
+
+    def sway(self, mask):
+        """The sway method moves the masked entities sideways along the alien ship sine path."""
+        x = self.x[:self.count]
+        x[mask] += 2 * numpy.sin(self.y[:self.count][mask] / 50)
+
+    def keep(self, mask):
+        """The keep method removes every entity whose mask value is False, keeping the order."""
+        kept = int(numpy.count_nonzero(mask))
+        if kept == self.count:
+            return
+
+        for field in FIELDS:
+            array = getattr(self, field)
+            array[:kept] = array[:self.count][mask]
+
+        self.count = kept
+
+    def swept_boxes(self):
+        """
+        The swept_boxes method returns the left, top, right and bottom arrays of the boxes covering
+        every entity at its previous and current positions.
+        """
+        count = self.count
+        entity_x = self.x[:count].astype(numpy.int64)
+        entity_y = self.y[:count].astype(numpy.int64)
+        previous_x = self.previous_x[:count].astype(numpy.int64)
+        previous_y = self.previous_y[:count].astype(numpy.int64)
+
+        return (
+            numpy.minimum(entity_x, previous_x),
+            numpy.minimum(entity_y, previous_y),
+            numpy.maximum(entity_x, previous_x) + self.width,
+            numpy.maximum(entity_y, previous_y) + self.height)
+
+    def swept_overlapping(self, x, y, width, height, boxes=None):
+        """
+        The swept_overlapping method returns the indices of the entities whose swept box overlaps a box.
+        The boxes returned by swept_boxes can be passed to reuse them across queries.
+        """
+        left, top, right, bottom = boxes if boxes is not None else self.swept_boxes()
+
+        overlap = (left < x + width) & (right > x) & (top < y + height) & (bottom > y)
+        return numpy.flatnonzero(overlap)
@@ -0,0 +1,129 @@
+"""
+Galactic Onslaught - Game Loop Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the fixed timestep game loop. The loop measures the real time that
+passed between two frames with time.perf_counter and runs as many simulation ticks as
+that time covers, so the game keeps its speed when a frame takes longer than planned.
+The next frame is scheduled for the moment the next tick is due, so the time spent
+updating the game does not add up to the tick period.
+
+Implementation:
+This module is imported by the main game module. The Game class creates a FixedTimestepLoop
+with its tick and render methods, starts it when the game begins and shows the late frames
+and dropped ticks of its stats in the frame profiler.
+"""
+
+# Import modules
+import math
+import time
+import constants
+
+class FixedTimestepLoop:
+    """
+    The FixedTimestepLoop class runs the game ticks at a fixed rate on the Tk event loop.
+
+    Parameters:
+    - master: The Tkinter widget used to schedule the frames.
+    - tick: The function that advances the game by one tick.
+    - render: The function that draws a frame, called with the interpolation factor
+        between the previous and the current tick (0.0 to 1.0).
+    - tick_rate: The number of ticks per second (default is GAME_SPEED).
+    - max_catch_up: The maximum number of ticks run in a single frame (default is 5).
+    - timer: The function returning the current time in seconds (default is time.perf_counter).
+
+    Attributes:
+    - tick_duration: The duration of a tick in seconds.
+    - accumulator: The real time not yet simulated, in seconds.
+    - frames: The number of frames rendered.
+    - ticks: The number of ticks run.
+    - late_frames: The number of frames that had to run more than one tick to catch up.
+    - dropped_ticks: The number of ticks skipped because a frame exceeded max_catch_up.
+    - running: A boolean indicating whether the loop is running.
+    """
+
+    def __init__(self, master, tick, render, tick_rate=constants.GAME_SPEED, max_catch_up=5, timer=time.perf_counter):
+        self.master = master
+        self.tick = tick
+        self.render = render
+        self.tick_duration = 1 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.timer = timer
+
+        self.accumulator = 0.0
+        self.previous_time = 0.0
+        self.frames = 0
+        self.ticks = 0
+        self.late_frames = 0
+        self.dropped_ticks = 0
+        self.running = False
+        self.after_id = None
+
+    def start(self):
+        """The start method runs the first tick and starts scheduling frames."""
+        self.running = True
+        self.previous_time = self.timer()
+        self.accumulator = self.tick_duration
+        self.frame()
+
+    def stop(self):
+        """The stop method cancels the next frame."""
+        self.running = False
+
+        if self.after_id is not None:
+            self.master.after_cancel(self.after_id)
+            self.after_id = None
+
+    def frame(self):
+        """The frame method runs the ticks that are due, renders a frame and schedules the next one."""
+        self.after_id = None
+        if not self.running:
+            return
+
+        # Add the real time elapsed since the last frame
+        now = self.timer()
+        self.accumulator += now - self.previous_time
+        self.previous_time = now
+
+        # Run the ticks that are due, up to the catch up limit
+        ticks = 0
+        while self.accumulator >= self.tick_duration and ticks < self.max_catch_up:
+            self.tick()
+            self.accumulator -= self.tick_duration
+            ticks += 1
+
+        self.ticks += ticks
+        if ticks > 1:
+            self.late_frames += 1
+
+        # Drop the time the loop could not catch up with, so the game does not spiral
+        if self.accumulator >= self.tick_duration:
+            dropped = int(self.accumulator // self.tick_duration)
+            self.dropped_ticks += dropped
+            self.accumulator -= dropped * self.tick_duration
+
+        self.render(self.accumulator / self.tick_duration)
+        self.frames += 1
+
+        # The tick or render may have stopped the loop
+        if not self.running:
+            return
+
+        # Schedule the next frame for when the next tick is due, never before it
+        delay = (self.tick_duration - self.accumulator) - (self.timer() - now)
+        self.after_id = self.master.after(max(1, math.ceil(delay * 1000)), self.frame)
+
+    def stats(self):
+        """The stats method returns the frame and tick counters of the loop."""
+        return {
+            "frames": self.frames,
+            "ticks": self.ticks,
+            "late_frames": self.late_frames,
+            "dropped_ticks": self.dropped_ticks
+        }
@@ -15,69 +15,97 @@ must destroy as many alien ships as possible to get a high score. The player has
 lives and can upgrade their spaceship with a shield if knows the cheat code.
 
 Implementation:
-The game is implemented using the tkinter library. There are four classes in this file:
-Game, SpaceFighter, AlienShip, and Laser.
+The game logic lives in the simulation module, which does not depend on tkinter.
+This file contains the Game class, the Tk adapter that renders the simulation.
 
     - The Game class represents the game window and its contents.
-        It manages the game loop and the game elements.
-        The game loop updates the game every frame.
+        It manages the game loop, which advances the simulation every frame,
+        and draws the space fighter, the alien ships and the lasers on the canvas,
+        with pooled canvas items for the lasers and the horde waves.
+        It also turns the key events of the player into simulation commands.
 
-    - The SpaceFighter class represents the space fighter in the game.
-        It manages the movement and shooting of the space fighter.
+    - The Simulation class (simulation module) represents the game state.
+        It manages the movement and shooting of the space fighter and the alien ships,
+        the collisions between them and the waves of alien ships.
 
-    - The AlienShip class represents the alien ship in the game.
-        It manages the movement and shooting of the alien ship.
-        A new wave of alien ships is created every time the player
-        destroys an alien ship wave.
-
-    - The Laser class represents the laser in the game.
-        It manages the movement of the laser.
-        A laser is created every time the player shoots or the alien ship shoots.
+    - The GameSession class switches between the start menu and the game in the same
+        process and window, and checks that nothing of a finished game is left behind.
 """
 
 # Import modules
-import os
 import sys
 import time
-import math
-import random
+
+# Time the game was launched, for the startup report
+LAUNCH_TIME = time.perf_counter()
+
 import constants
-from tkinter import Tk, Canvas, PhotoImage
-from leaderboard import LeaderboardManager
+from tkinter import Tk, Canvas
+from leaderboard import LeaderboardView
+from leaderboard_worker import LeaderboardWorker
 from menu_handler import StartMenu
+from canvas_pool import CanvasItemPool
+from background import ScrollingBackground
+from profiler import FrameProfiler, StartupTimer
+from game_loop import FixedTimestepLoop
+from input_state import InputState
+from replay import ReplayRecorder, ReplayPlayer
+from asset_preloader import AssetPreloader
+from asset_bundle import load_bundle
+import collision
+from simulation import Simulation, Laser, SPACE_FIGHTER_SPRITES, ALIEN_SHIP_SPRITES, LASER_SPRITES, HORDE_SPRITES
+from sprite_registry import sprites
+
+# Sprites of the game, whose images and collision masks are preloaded while the start menu is shown
+GAME_SPRITE_FILES = [*SPACE_FIGHTER_SPRITES.values(), *ALIEN_SHIP_SPRITES.values(), *LASER_SPRITES.values()]
+
+# Images of the game, preloaded while the start menu is shown
+GAME_IMAGE_FILES = ["assets/img/bg/background.png", *GAME_SPRITE_FILES]
 
 class Game:
     """
-    The Game class represents the main game logic and elements.
+    The Game class represents the game window and renders the game simulation.
 
     Parameters:
     - master: The Tkinter master window.
     - playing_keys: A dictionary containing the key bindings for player controls.
     - player_name: The name of the player.
+    - return_to_menu_callback: The function called when the player returns to the menu (default is None).
+    - replay: A ReplayPlayer to play a recorded game back instead of reading the keys (default is None).
 
     Attributes:
     - master: The Tkinter master window.
     - canvas: The Tkinter canvas widget for rendering game elements.
+    - simulation: An instance of Simulation holding the game state.
     - player_name: The name of the player.
-    - score: The player's score.
-    - lives: The number of lives remaining.
-    - paused: A boolean indicating whether the game is paused.
-    - level: The current level of the game.
-    - game_over_status: A boolean indicating whether the game is over.
-    - scroll_speed: The speed at which the background scrolls.
     - playing_keys: A dictionary containing the key bindings for player controls.
+    - input_state: An instance of InputState recording the movement keys held by the player.
+    - replay: The ReplayPlayer the inputs are played back from, or None if the player is playing.
+    - recorder: An instance of ReplayRecorder recording the game, or None if it is not recorded.
     - background_image: The image used for the game background.
-    - bg_image_1, bg_image_2: Canvas objects representing the two background images for seamless scrolling.
-    - alien_ships: A list containing instances of AlienShip representing enemy ships.
-    - wave_length: The number of alien ships in a wave.
-    - alien_ship_speed: The speed of alien ships.
-    - space_fighter: An instance of SpaceFighter representing the player's spaceship.
-    - leaderboard_manager: An instance of LeaderboardManager for managing the game leaderboard.
+    - background: An instance of ScrollingBackground scrolling the background layers.
+    - game_loop: An instance of FixedTimestepLoop running the clock at a fixed rate.
+    - scroll_distance: The distance the background has to scroll on the next frame.
+    - sprite_items: A dictionary mapping each drawn entity to its canvas item and last drawn state.
+    - laser_pools: A dictionary of CanvasItemPool instances reusing the laser canvas items.
+    - horde_pools: A list of CanvasItemPool instances reusing the canvas items of the horde wave.
+    - horde_items: A list of the [items, x, y] lists drawn by each horde pool in the last frame.
+    - canvas_calls: The number of canvas calls made to draw the current frame.
+    - profiler: An instance of FrameProfiler measuring the frame and tick timings.
+    - leaderboard_worker: An instance of LeaderboardWorker reading and writing the leaderboard off the Tk thread.
+    - sorted_leaderboard: The top entries of the leaderboard, or None until they are read.
+    - leaderboard_due: A boolean indicating whether the leaderboard should be printed as soon as it is read.
+    - leaderboard_view: An instance of LeaderboardView drawing the leaderboard table, or None until it is printed.
+    - after_ids: The identifiers of the pending after callbacks of the game, cancelled on teardown.
     """
 
-    def __init__(self, master, playing_keys, player_name):
+    def __init__(self, master, playing_keys, player_name, return_to_menu_callback=None, replay=None):
         # Store the root window as an instance variable
         self.master = master
+        self.return_to_menu_callback = return_to_menu_callback
+
+        # Pending after callbacks, so the teardown can cancel them
+        self.after_ids = set()
 
         # Set the title and geometry of the root window
         self.master.title(constants.GAME_TITLE)
@@ -93,47 +121,59 @@ class Game:
 
         self.canvas.pack()
 
+        # Create the game simulation, set up as the recorded game when a replay is played back
+        self.replay = replay
+        if replay is not None:
+            self.simulation = Simulation(seed=replay.seed, horde_waves=replay.horde_waves)
+        else:
+            self.simulation = Simulation()
+
         # Define game variables
         self.player_name = player_name
-        self.score = 0
-        self.lives = 3
-        self.paused = False
-        self.level = 0
-        self.game_over_status = False
-        self.scroll_speed = 0
         self.playing_keys = playing_keys
 
+        # Record the seed and the inputs of the game, unless it is a replay itself
+        self.recorder = None
+        if replay is None and constants.REPLAY_FILE:
+            try:
+                self.recorder = ReplayRecorder(
+                    constants.REPLAY_FILE, self.simulation.seed, self.simulation.horde_waves, playing_keys, player_name)
+            except OSError as error:
+                print(f"The game is not recorded: {error}", file=sys.stderr)
+
         # Load and store the background image as an instance variable
-        self.background_image = PhotoImage(file="assets/img/bg/background.png")
+        self.background_image = sprites.get("assets/img/bg/background.png")
         # Background graphic made by me (Jean Paul Fernandez) using Canva's image editor [https://www.canva.com].
         # Additional graphics made by Rostik Solonenko, retrieved from Canva's free media library [https://www.canva.com/features/free-stock-photos/].
         # Editable file available as view-only at https://www.canva.com/design/DAF0EFDjc3g/cApy-RMGI9pTI6kQi9Xrmg/edit.
 
-        # Create two background images for seamless scrolling
-        self.bg_image_1 = self.canvas.create_image(
-            0,
-            0,
-            anchor="nw",
-            image=self.background_image)
+        # Create the scrolling background, with the background image as its only layer
+        self.background = ScrollingBackground(self.canvas)
+        self.background.add_layer(self.background_image)
+
+        # Distance the background has to scroll on the next frame
+        self.scroll_distance = 0
 
-        self.bg_image_2 = self.canvas.create_image(
-            0,
-            -constants.GAME_HEIGHT,
-            anchor="nw",
-            image=self.background_image)
+        # Canvas items of the entities, created the first time each entity is drawn
+        self.sprite_items = {}
 
-        # Store the alien ships in an array
-        self.alien_ships = []
-        self.wave_length = 0
-        self.alien_ship_speed = 0
+        # Pools of reusable canvas items for the lasers, one per laser sprite and tagged by sprite
+        self.laser_pools = {
+            sprite: CanvasItemPool(self.canvas, sprites.get(file), constants.LASER_POOL_CAPACITY, f"laser-{sprite}")
+            for sprite, file in LASER_SPRITES.items()}
 
-        # Create the alien ship
-        if len(self.alien_ships) >= 0:
-            for self.alien_ship in self.alien_ships:
-                self.alien_ship = AlienShip(self.canvas, self.alien_ship_speed)
+        # Pools of reusable canvas items for the horde wave, one per alien ship sprite state and one
+        # for its lasers, with the items each pool drew in the last frame and where it drew them
+        self.horde_pools = [
+            CanvasItemPool(self.canvas, sprites.get(file), constants.HORDE_WAVE_SIZE, f"horde-{index}")
+            for index, file in enumerate([*map(ALIEN_SHIP_SPRITES.get, HORDE_SPRITES), LASER_SPRITES["alt"]])]
+        self.horde_items = [[[], [], []] for _ in self.horde_pools]
 
-        # Create the space fighter
-        self.space_fighter = SpaceFighter(self.canvas, playing_keys)
+        # Canvas calls made to draw the current frame
+        self.canvas_calls = 0
+
+        # Draw the space fighter
+        self.render(1.0)
 
         # Create the player name label on the canvas
         self.canvas.create_text(
@@ -148,7 +188,7 @@ class Game:
         # Create the score label on the canvas
         self.score_label = self.canvas.create_text(
             constants.GAME_WIDTH - 20, 30,
-            text=f"Score: {self.score}",
+            text=f"Score: {self.simulation.score}",
             fill=constants.GAME_FONT_COLOR,
             font=(constants.GAME_SMALL_FONT),
             anchor="e",
@@ -158,7 +198,7 @@ class Game:
         self.lives_label = self.canvas.create_text(
             constants.GAME_WIDTH - 20,
             70,
-            text=f"Lives: {self.lives}",
+            text=f"Lives: {self.simulation.lives}",
             fill=constants.GAME_FONT_COLOR,
             font=(constants.GAME_SMALL_FONT),
             anchor="e",
@@ -167,36 +207,67 @@ class Game:
         # Draw the lives bar on the canvas
         self.draw_lives_bar()
 
-        # Create a leaderboard manager
-        self.leaderboard_manager = LeaderboardManager("assets/db/leaderboard.txt")
+        # Create a leaderboard worker, which reads and writes the leaderboard on a background thread
+        self.leaderboard_worker = LeaderboardWorker(self.canvas, "assets/db/leaderboard.txt")
+        self.sorted_leaderboard = None
+        self.leaderboard_due = False
+        self.leaderboard_view = None
 
-        # Boss key to minimize the game window (Ctrl + Shift + B)
-        self.canvas.bind("<Control-Shift-Key-B>", self.boss_key)
+        # Create the frame profiler and bind its overlay (Ctrl + Shift + O) and CSV export (Ctrl + Shift + C)
+        self.profiler = FrameProfiler(self.canvas)
+        self.canvas.bind("<Control-Shift-Key-O>", self.profiler.toggle)
+        self.canvas.bind("<Control-Shift-Key-C>", self.profiler.toggle_csv)
 
-        # Bind the key events to the corresponding methods
-        self.canvas.bind("<P>", self.pause_resume_game)
-        self.canvas.bind("<p>", self.pause_resume_game)
+        # A replay takes its inputs from the replay file, not from the keys
+        if replay is None:
+            # Boss key to minimize the game window (Ctrl + Shift + B)
+            self.canvas.bind("<Control-Shift-Key-B>", self.boss_key)
+
+            # Bind the key events to the corresponding methods
+            self.canvas.bind("<P>", self.pause_resume_game)
+            self.canvas.bind("<p>", self.pause_resume_game)
+
+            # Bind the space fighter controls
+            self.bind_controls(playing_keys)
 
         # Set focus to the canvas
         self.canvas.focus_set()
 
-        # Start the clock
-        self.clock()
+        # Start the clock on a fixed timestep, rendering between the ticks
+        self.game_loop = FixedTimestepLoop(self.master, self.clock, self.update_screen)
+        self.game_loop.start()
 
     def clock(self):
-        """The clock method updates the game every frame."""
-        # Check if the game is not yet over or paused
-        if not self.game_over_status:
-            self.scroll_speed = self.alien_ship_speed // 2
-            self.update_screen()
+        """The clock method advances the game by one tick."""
+        if self.replay is not None:
+            self.play_inputs()
+
+            # The recorded player left before the game was over, so the replay ends there too
+            if self.replay.finished(self.simulation.tick) and not self.simulation.game_over_status:
+                self.end_replay()
+                return
+        else:
+            # Steer the space fighter with the movement keys held during this tick
+            self.send_input("steer", *self.input_state.direction())
+
+        # Advance the simulation by one tick and render its events
+        self.simulation.step()
+        self.profiler.record_tick(self.simulation.phase_times)
+        self.handle_events()
 
-            # Check if the player has destroyed an alien ship
-            if len(self.alien_ships) == 0:
-                self.level_up()
+        # Add the distance the background scrolled during this tick
+        if not self.simulation.paused and not self.simulation.game_over_status:
+            self.scroll_distance += self.simulation.scroll_speed
 
-            self.check_collisions()
+    def after(self, delay, callback):
+        """The after method schedules a callback on the canvas and keeps track of it until it runs."""
+        def run():
+            self.after_ids.discard(after_id)
+            callback()
 
-        self.master.after(1000 // constants.GAME_SPEED, self.clock)
+        after_id = self.canvas.after(delay, run)
+        self.after_ids.add(after_id)
+        return after_id
 
     def create_window(self):
         """Create the game window."""
@@ -211,6 +282,44 @@ class Game:
         # Set the window's position
         self.master.geometry(f"{constants.GAME_WIDTH}x{constants.GAME_HEIGHT}+{x}+{y}")
 
+    def send_input(self, name, dx=0, dy=0):
+        """The send_input method records an input of the player and applies it to the simulation."""
+        if self.recorder is not None:
+            self.recorder.record(self.simulation.tick, name, dx, dy)
+
+        self.simulation.apply_input(name, dx, dy)
+
+    def play_inputs(self):
+        """The play_inputs method applies the inputs the replay recorded before the next tick."""
+        paused = self.simulation.paused
+
+        for name, dx, dy in self.replay.inputs(self.simulation.tick):
+            self.simulation.apply_input(name, dx, dy)
+
+        # A pause resumed before the next tick is never shown
+        if self.simulation.paused != paused:
+            self.draw_pause()
+
+    def end_replay(self):
+        """The end_replay method stops the clock at the end of the recording and returns to the start menu."""
+        if not self.game_loop.running:
+            return
+
+        self.game_loop.stop()
+        self.after(0, lambda: self.return_to_menu(None))
+
+    def bind_controls(self, playing_keys):
+        """The bind_controls method binds the space fighter controls to the simulation."""
+        # Record the held movement keys, the space fighter moves once per tick while they are held
+        self.input_state = InputState(playing_keys)
+        self.input_state.bind(self.canvas)
+
+        # Cheat codes to update the sprite of the space fighter and be invincible
+        self.canvas.bind("<Control-Shift-Key-F>", lambda _: self.send_input("cheat"))
+
+        # Bind the space bar to the shoot method
+        self.canvas.bind("<space>", lambda _: self.send_input("shoot"))
+
     def boss_key(self, _):
         """The boss_key method minimizes the game window."""
         # Pause the game
@@ -219,9 +328,12 @@ class Game:
 
     def pause_resume_game(self, _):
         """The pause_resume_game method pauses or resumes the game."""
-        if not self.paused:
-            self.paused = True
+        self.send_input("pause")
+        self.draw_pause()
 
+    def draw_pause(self):
+        """The draw_pause method shows or hides the pause screen."""
+        if self.simulation.paused:
             self.canvas.create_text(
                 constants.GAME_WIDTH // 2,
                 constants.GAME_HEIGHT // 2,
@@ -241,121 +353,255 @@ class Game:
                 tag="resume_game")
 
         else:
-            self.paused = False
             self.canvas.delete("game_paused")
             self.canvas.delete("resume_game")
             self.canvas.delete("save_game")
 
-    def check_collisions(self):
-        """The check_collisions method checks for collisions between game elements."""
-
-        # Check if the player has been hit by an alien laser
-        for alien_ship in self.alien_ships:
-            for alien_laser in alien_ship.alien_lasers:
-                if self.pixel_collision(
-                    self.space_fighter.x,
-                    self.space_fighter.y,
-                    self.space_fighter.space_fighter_sprites[self.space_fighter.current_sprite],
-                    alien_laser.x,
-                    alien_laser.y,
-                    alien_laser.laser_sprites[alien_laser.current_sprite]):
-
-                    if self.space_fighter.current_sprite == "main":
-                        self.lives -= 1 # Decrement the lives by 1
-                        self.update_lives() # Update the lives label on the canvas
-                        self.space_fighter.shot_animation() # Play the shot animation
-
-                    alien_ship.alien_lasers.remove(alien_laser) # Remove the alien laser
-
-        # Check if the player has been hit by an alien ship
-        for alien_ship in self.alien_ships:
-            if self.pixel_collision(
-                self.space_fighter.x,
-                self.space_fighter.y,
-                self.space_fighter.space_fighter_sprites[self.space_fighter.current_sprite],
-                alien_ship.x,
-                alien_ship.y,
-                alien_ship.alien_ship_sprites[alien_ship.current_sprite]):
-
-                if self.space_fighter.current_sprite == "main":
-                    self.lives -= 1 # Decrement the lives by 1
-                    self.update_lives()
-                    self.space_fighter.shot_animation() # Play the shot animation
-
-                if self.space_fighter.current_sprite == "super":
-                    self.update_score()
-
-                alien_ship.destroyed_animation() # Play the destroyed animation
-
-                # Remove the alien ship from the alien_ships array
-                if alien_ship in self.alien_ships:
-                    self.alien_ships.remove(alien_ship)
-
-        # Check if the alien ship has been hit by a laser
-        for alien_ship in self.alien_ships:
-            for laser in self.space_fighter.lasers:
-                if self.pixel_collision(
-                    alien_ship.x,
-                    alien_ship.y,
-                    alien_ship.alien_ship_sprites[alien_ship.current_sprite],
-                    laser.x,
-                    laser.y,
-                    laser.laser_sprites[laser.current_sprite]):
-                    self.update_score() # Update the score label on the canvas
-
-                    alien_ship.destroyed_animation() # Play the destroyed animation
-
-                    # Remove the alien ship from the alien_ships array
-                    if alien_ship in self.alien_ships:
-                        self.alien_ships.remove(alien_ship)
-
-                    # Remove the laser from the lasers array
-                    if laser in self.space_fighter.lasers:
-                        self.space_fighter.lasers.remove(laser)
-
-    def update_screen(self):
-        """The update_screen method updates the game every clock tick."""
-        if not self.paused:
-            self.scroll_background(self.scroll_speed)
-
-            # Move the lasers
-            self.space_fighter.move_lasers()
-
-            # Move the alien ship and handle shooting
-            for alien_ship in self.alien_ships:
-                alien_ship.move()
-                alien_ship.move_lasers()
-
-    def update_score(self):
-        """The update_score method updates the score of the player."""
-        self.score += 1 # Increment the score by 1
-
-        # Update the score label on the canvas
-        self.canvas.itemconfig(self.score_label, text=f"Score: {self.score}")
-
-    def update_lives(self):
-        """The update_lives method updates the lives of the player."""
+    def handle_events(self):
+        """The handle_events method renders the events recorded by the simulation in the last tick."""
+        for name, value in self.simulation.events:
+            match name:
+                case "score":
+                    self.update_score(value)
+                case "lives":
+                    self.update_lives(value)
+                case "level_up":
+                    self.level_up(value)
+                case "game_over":
+                    self.game_over()
+
+    def update_screen(self, alpha):
+        """The update_screen method scrolls the background and draws the entities every frame."""
+        frame_start = time.perf_counter()
+        self.canvas_calls = 0
+
+        if self.scroll_distance:
+            self.scroll_background(self.scroll_distance)
+            self.scroll_distance = 0
+
+        # A paused game shows the entities where the last tick left them
+        if self.simulation.paused:
+            alpha = 1.0
+
+        self.render(alpha)
+
+        self.profiler.record_frame(
+            frame_start,
+            time.perf_counter() - frame_start,
+            self.frame_counts)
+
+    def frame_counts(self):
+        """
+        The frame_counts method returns the entity counts, the canvas calls of the frame, the
+        items kept by the canvas pools and the late frames and dropped ticks of the game loop
+        for the profiler.
+        """
+        counts = self.simulation.entity_counts()
+        counts["canvas_calls"] = self.canvas_calls
+
+        pool_stats = [pool.stats() for pool in [*self.laser_pools.values(), *self.horde_pools]]
+        counts["pooled_items"] = sum(stats["items"] for stats in pool_stats)
+        counts["pool_overflow"] = sum(stats["overflow"] for stats in pool_stats)
+
+        loop_stats = self.game_loop.stats()
+        counts["late_frames"] = loop_stats["late_frames"]
+        counts["dropped_ticks"] = loop_stats["dropped_ticks"]
+        return counts
+
+    def render(self, alpha):
+        """The render method draws every entity of the simulation on the canvas."""
+        simulation = self.simulation
+        previous_items = self.sprite_items
+        self.sprite_items = {}
+        pools = [*self.laser_pools.values(), *self.horde_pools]
+        pool_calls = sum(pool.calls for pool in pools)
+
+        for pool in pools:
+            pool.begin_frame()
+
+        # Move the lasers that moved together with one call per laser sprite
+        self.move_laser_groups(previous_items, alpha)
+
+        self.draw_sprite(simulation.space_fighter, previous_items, alpha)
+
+        for laser in simulation.space_fighter.lasers:
+            self.draw_sprite(laser, previous_items, alpha)
+
+        for alien_ship in simulation.alien_ships:
+            self.draw_sprite(alien_ship, previous_items, alpha)
+
+        for alien_laser in simulation.alien_lasers:
+            self.draw_sprite(alien_laser, previous_items, alpha)
+
+        for alien_ship in simulation.debris:
+            self.draw_sprite(alien_ship, previous_items, alpha)
+
+        self.render_horde(alpha)
+
+        # Delete the canvas items of the entities that left the game, lasers go back to their pool
+        for entity, (item, _, _, _, pool) in previous_items.items():
+            if entity not in self.sprite_items:
+                if pool is None:
+                    self.canvas.delete(item)
+                    self.canvas_calls += 1
+                else:
+                    pool.release(item)
+
+        self.canvas_calls += sum(pool.calls for pool in pools) - pool_calls
+
+    def render_horde(self, alpha):
+        """
+        The render_horde method draws the alien ships and lasers of the horde wave with the items
+        of the horde pools. The entities of a pool that all moved by the same distance, such as
+        the lasers, are moved with a single canvas.move call on the tag of the pool.
+        """
+        horde = self.simulation.horde
+        positions = [([], [])] * len(self.horde_pools)
+
+        # Split the alien ships of the horde wave by sprite state, then add its lasers
+        if horde is not None:
+            x, y = horde.alien_ships.interpolate(alpha)
+            sprite = horde.alien_ships.view("sprite")
+            positions = [(x[sprite == index].tolist(), y[sprite == index].tolist()) for index in range(len(HORDE_SPRITES))]
+
+            x, y = horde.alien_lasers.interpolate(alpha)
+            positions.append((x.tolist(), y.tolist()))
+
+        for pool, (items, drawn_x, drawn_y), (x, y) in zip(self.horde_pools, self.horde_items, positions):
+            # Give back the items of the entities that left the pool
+            while len(items) > len(x):
+                pool.release(items.pop())
+                drawn_x.pop()
+                drawn_y.pop()
+
+            # Move the items still in use, together if they all moved by the same distance
+            moves = {(x[index] - drawn_x[index], y[index] - drawn_y[index]) for index in range(len(items))}
+            if len(moves) == 1 and len(items) > 1:
+                dx, dy = moves.pop()
+                if dx or dy:
+                    self.canvas.move(pool.tag, dx, dy)
+                    self.canvas_calls += 1
+            else:
+                for index, item in enumerate(items):
+                    if x[index] != drawn_x[index] or y[index] != drawn_y[index]:
+                        self.canvas.coords(item, x[index], y[index])
+                        self.canvas_calls += 1
+
+            # Display the entities that joined the pool
+            for index in range(len(items), len(x)):
+                items.append(pool.acquire(x[index], y[index]))
+
+            drawn_x[:] = x
+            drawn_y[:] = y
+
+            # The next horde wave is levels away, so the hidden items of the last one are deleted
+            if horde is None and pool.free_items:
+                pool.clear()
+
+    def move_laser_groups(self, previous_items, alpha):
+        """
+        The move_laser_groups method moves the lasers that moved by the same distance since the
+        last frame with a single canvas.move call on the tag of their pool. The lasers that
+        moved differently are left to draw_sprite, which places them one by one.
+        """
+        simulation = self.simulation
+        lasers = [*simulation.space_fighter.lasers, *simulation.alien_lasers]
+
+        # Group the lasers already on the canvas by pool and by the distance they moved
+        groups = {}
+        for laser in lasers:
+            drawn = previous_items.get(laser)
+            if drawn is None or laser.removed:
+                continue
+
+            item, sprite, drawn_x, drawn_y, pool = drawn
+            x, y = laser.interpolate(alpha)
+            if x != drawn_x or y != drawn_y:
+                groups.setdefault(pool, {}).setdefault((x - drawn_x, y - drawn_y), []).append((laser, x, y))
+
+        for pool, moves in groups.items():
+            (dx, dy), moved = max(moves.items(), key=lambda move: len(move[1]))
+
+            # A single laser is placed by draw_sprite, which costs the same single call
+            if len(moved) < 2:
+                continue
+
+            self.canvas.move(pool.tag, dx, dy)
+            self.canvas_calls += 1
+
+            # Every item of the pool moved, so draw_sprite places the lasers that should not have
+            for laser, (item, sprite, drawn_x, drawn_y, laser_pool) in previous_items.items():
+                if laser_pool is pool:
+                    previous_items[laser] = (item, sprite, drawn_x + dx, drawn_y + dy, pool)
+
+            # The lasers of the group are now drawn where they should be
+            for laser, x, y in moved:
+                item, sprite, _, _, _ = previous_items[laser]
+                previous_items[laser] = (item, sprite, x, y, pool)
+
+    def draw_sprite(self, entity, previous_items, alpha):
+        """The draw_sprite method creates or updates the canvas item of an entity."""
+        if entity.removed:
+            return
+
+        # Draw the entity between its previous and current position
+        x, y = entity.interpolate(alpha)
+        drawn = previous_items.get(entity)
+
+        if drawn is None:
+            # Display the entity on the canvas the first time it is drawn
+            if isinstance(entity, Laser):
+                pool = self.laser_pools[entity.current_sprite]
+                item = pool.acquire(x, y)
+            else:
+                pool = None
+                item = self.canvas.create_image(
+                    x,
+                    y,
+                    anchor="center",
+                    image=sprites.get(entity.sprite_files[entity.current_sprite]))
+                self.canvas_calls += 1
+
+            self.sprite_items[entity] = (item, entity.current_sprite, x, y, pool)
+            return
+
+        item, sprite, drawn_x, drawn_y, pool = drawn
+
+        # Only send the position and the sprite to Tk when they have changed
+        if drawn_x != x or drawn_y != y:
+            self.canvas.coords(item, x, y)
+            self.canvas_calls += 1
+
+        if sprite != entity.current_sprite:
+            self.canvas.itemconfig(item, image=sprites.get(entity.sprite_files[entity.current_sprite]))
+            self.canvas_calls += 1
+
+        self.sprite_items[entity] = (item, entity.current_sprite, x, y, pool)
+
+    def update_score(self, score):
+        """The update_score method updates the score label on the canvas."""
+        self.canvas.itemconfig(self.score_label, text=f"Score: {score}")
+
+    def update_lives(self, lives):
+        """The update_lives method updates the lives label and the lives bar on the canvas."""
         # Update the lives label on the canvas
-        self.canvas.itemconfig(self.lives_label, text=f"Lives: {self.lives}")
+        self.canvas.itemconfig(self.lives_label, text=f"Lives: {lives}")
 
         self.destroy_lives_bar()
 
         self.draw_lives_bar()
 
-        # Check if the player has no more lives
-        if self.lives <= 0:
-            self.game_over() # End the game
-
     def draw_lives_bar(self):
         """The draw_lives_bar method draws the lives bar on the canvas."""
+        lives = self.simulation.lives
 
         # Draw the lives bar on the canvas
-        for i in range(self.lives):
+        for i in range(lives):
             # Set the color of the lives bar
             lives_bar_color = constants.GAME_FONT_COLOR
 
             # Check the number of lives left and set the color of the lives bar accordingly
-            match self.lives:
+            match lives:
                 case 1:
                     lives_bar_color = constants.GAME_FONT_COLOR_ERROR
                 case 2:
@@ -381,41 +627,25 @@ class Game:
         # Destroy the lives bar on the canvas
         self.canvas.delete("lives-bar")
 
-    def level_up(self):
-        """The level_up method levels up the game and spawns more alien ships."""
-        self.level += 1 # Increment the level by 1
-        self.wave_length = int(self.level**0.7) + 2 # Calculate the wave length
-        self.alien_ship_speed = int(self.level**0.6) + 1 # Calculate the alien ship speed
-        self.space_fighter.speed = int(self.level**0.6)+14 # Calculate the space fighter speed
-
-        if self.lives < 3:
-            self.lives += 1 # Increment the lives by 1
-            self.update_lives()
-
-        # Print the level up message on the canvas
+    def level_up(self, level):
+        """The level_up method prints the level up message on the canvas."""
         self.canvas.create_text(
             constants.GAME_WIDTH // 2,
             constants.GAME_HEIGHT // 2,
-            text=f"LEVEL {self.level}",
+            text=f"LEVEL {level}",
             fill=constants.GAME_FONT_COLOR,
             font=(constants.GAME_LARGE_FONT_BOLD),
             anchor="center",
             tag="level_up")
 
-        # Spawn the alien ships for the next wave
-        for _ in range(self.wave_length):
-            new_alien_ship = AlienShip(self.canvas, self.alien_ship_speed)
-            self.alien_ships.append(new_alien_ship)
-
-        self.canvas.after(3000, self.remove_level_up_message)
+        self.after(3000, self.remove_level_up_message)
 
     def remove_level_up_message(self):
         """The remove_level_up method removes the level up message from the canvas."""
         self.canvas.delete("level_up")
 
     def game_over(self):
-        """The game_over method stops the game and prints the game over screen."""
-        self.game_over_status = True
+        """The game_over method prints the game over screen."""
 
         # Create the game over label on the canvas
         self.canvas.create_text(
@@ -428,59 +658,46 @@ class Game:
             tag="game_over")
 
         # Wait for shot animation to finish before destroying the space fighter
-        self.canvas.after(200, self.space_fighter.destroyed_animation)
+        self.after(200, self.simulation.space_fighter.destroyed_animation)
 
         # Wait for the animation to finish before stopping the game
-        self.canvas.after(800, self.stop_game)
+        self.after(800, self.stop_game)
 
         # Update the leaderboard
         self.update_leaderboard()
 
     def stop_game(self):
-        """The stop_game method stops the game."""
-        # Set the paused status to True
-        self.paused = True
+        """The stop_game method stops the game and removes its entities from the canvas."""
+        self.simulation.stop_game()
+        self.render(1.0)
 
-        # Stop and remove the space fighter
-        self.space_fighter.speed = 0
-        self.space_fighter.remove_space_fighter()
+    def update_leaderboard(self):
+        """The update_leaderboard method updates the leaderboard without waiting for the storage."""
+        # Keep the score if it is the best score of the player, then read the top of the leaderboard
+        if self.replay is None:
+            self.leaderboard_worker.submit_score(self.player_name, self.simulation.score)
+        self.leaderboard_worker.top_leaderboard(self.receive_leaderboard)
 
-        # Stop and remove the alien ships
-        for alien_ship in self.alien_ships:
-            alien_ship.speed = 0
-            alien_ship.remove_alien_ship()
+        # After updating the leaderboard, wait 3 seconds before printing it
+        self.after(3000, self.leaderboard_delay_over)
 
-            # Stop and remove the alien lasers
-            for alien_laser in alien_ship.alien_lasers:
-                alien_laser.speed = 0
-                if alien_laser in alien_ship.alien_lasers:
-                    alien_ship.alien_lasers.remove(alien_laser)
+    def receive_leaderboard(self, sorted_leaderboard):
+        """The receive_leaderboard method stores the top of the leaderboard once it is read."""
+        # The leaderboard is printed empty if the storage failed
+        self.sorted_leaderboard = sorted_leaderboard or []
 
-    def update_leaderboard(self):
-        """The update_leaderboard method updates the leaderboard."""
-
-        # Read the leaderboard
-        leaderboard = self.leaderboard_manager.read_leaderboard()
-        player_exists = False
-
-        for entry in leaderboard:
-            # Check if the player exists in the leaderboard
-            if entry["playerName"] == self.player_name:
-                player_exists = True
-                if self.score > entry["score"]:
-                    self.leaderboard_manager.update_leaderboard(
-                        {"playerName": self.player_name,
-                        "score": self.score})
-                    break
-                break
-
-        # If the player does not exist in the leaderboard, append the player to the leaderboard
-        if not player_exists:
-            new_leaderboard_entry = {"playerName": self.player_name, "score": self.score}
-            self.leaderboard_manager.append_leaderboard(new_leaderboard_entry)
+        # A table already on screen is updated in place
+        if self.leaderboard_view is not None:
+            self.leaderboard_view.update(self.sorted_leaderboard, self.player_name)
+        elif self.leaderboard_due:
+            self.print_leaderboard()
 
-        # After updating the leaderboard, wait 3 seconds before printing it
-        self.canvas.after(3000, self.print_leaderboard)
+    def leaderboard_delay_over(self):
+        """The leaderboard_delay_over method prints the leaderboard, or waits until it is read."""
+        self.leaderboard_due = True
+
+        if self.sorted_leaderboard is not None:
+            self.print_leaderboard()
 
     def print_leaderboard(self):
         """The print_leaderboard method prints the leaderboard."""
@@ -489,13 +706,9 @@ class Game:
         self.canvas.delete("score")
         self.canvas.delete("lives")
         self.canvas.delete("game_over")
-        self.space_fighter.remove_space_fighter()
-
-        # Read and sort the leaderboard
-        leaderboard = self.leaderboard_manager.read_leaderboard()
-        sorted_leaderboard = self.leaderboard_manager.sort_leaderboard(leaderboard)
 
-        self.leaderboard_manager.print_leaderboard(self.canvas, sorted_leaderboard, self.player_name)
+        self.leaderboard_view = LeaderboardView(self.canvas)
+        self.leaderboard_view.update(self.sorted_leaderboard, self.player_name)
 
         # Create the return to Menu label on the canvas
         self.canvas.create_text(
@@ -516,518 +729,178 @@ class Game:
 
     def return_to_menu(self, _):
         """The return_to_menu method returns to the start menu."""
-        # Destroy the canvas
+        if self.return_to_menu_callback is not None:
+            self.return_to_menu_callback()
+
+    def teardown(self):
+        """The teardown method stops the game and removes everything it created from the window."""
+        # Stop the clock and cancel the pending after callbacks
+        self.game_loop.stop()
+        for after_id in self.after_ids:
+            self.canvas.after_cancel(after_id)
+        self.after_ids.clear()
+
+        # Let the leaderboard finish writing on its worker thread and close the CSV file of the profiler
+        self.leaderboard_worker.close()
+        self.profiler.close()
+
+        # Finish the recording, or the replay file played back
+        if self.recorder is not None:
+            self.recorder.close(self.simulation.tick)
+        if self.replay is not None:
+            self.replay.close()
+
+        # Remove the canvas items, then the canvas with its key bindings
+        self.sprite_items.clear()
+        self.laser_pools.clear()
+        self.horde_pools.clear()
+        self.horde_items.clear()
+        self.canvas.delete("all")
         self.canvas.destroy()
 
-        os.execv(sys.executable, ['python'] + sys.argv)
-
     def scroll_background(self, speed):
-        """The scroll_background method scrolls the background images vertically."""
-        self.canvas.move(self.bg_image_1, 0, speed)
-        self.canvas.move(self.bg_image_2, 0, speed)
-
-        # The bbox method returns a tuple containing the coordinates of the specified item.
-        # We just need the y coordinates of the background images.
-        _, y1, _, _ = self.canvas.bbox(self.bg_image_1)
-        _, y2, _, _ = self.canvas.bbox(self.bg_image_2)
-
-        # Check if the first background image is out of the canvas
-        if y1 >= constants.GAME_HEIGHT:
-            # Reset its position above the second background image
-            self.canvas.move(self.bg_image_1, 0, -2 * constants.GAME_HEIGHT)
-
-        # Check if the second background image is out of the canvas
-        if y2 >= constants.GAME_HEIGHT:
-            # Reset its position above the first background image
-            self.canvas.move(self.bg_image_2, 0, -2 * constants.GAME_HEIGHT)
-
-    def pixel_collision(self, x1, y1, image1, x2, y2, image2):
-        """The pixel_collision method checks if two images collide comparing its RGB values."""
-
-        # Bounding box check
-        if not (x1 < x2 + image2.width() and x1 + image1.width() > x2 and y1 < y2 + image2.height() and y1 + image1.height() > y2):
-            return False  # No collision
-
-        # Get the overlapping rectangle coordinates
-        x_overlap = max(int(x1), int(x2))
-        y_overlap = max(int(y1), int(y2))
-        x_end = min(int(x1) + image1.width(), int(x2) + image2.width())
-        y_end = min(int(y1) + image1.height(), int(y2) + image2.height())
-
-        # Check for overlap within the rectangle
-        for x in range(int(x_overlap), int(x_end)):
-            for y in range(int(y_overlap), int(y_end)):
-                # Get pixel values of the two images at the current position
-                pixel1 = image1.get(x - int(x1), y - int(y1))
-                pixel2 = image2.get(x - int(x2), y - int(y2))
-
-                # Check if both pixels are
-                if pixel1 != (0, 0, 0) and pixel2 != (0, 0, 0):
-                    return True  # Collision detected
-
-        return False  # No collision
-
-class SpaceFighter:
-    """
-    The SpaceFighter class represents the space fighter in the game.
-    It manages the movement and shooting of the space fighter.
-
-    Parameters:
-    - canvas: The Tkinter canvas widget for rendering game elements.
-    - playing_keys: A dictionary containing the key bindings for player controls.
+        """The scroll_background method scrolls the background layers vertically."""
+        self.canvas_calls += self.background.scroll(speed)
 
-    Attributes:
-    - canvas: The Tkinter canvas widget for rendering game elements.
-    - x: The x-coordinate of the space fighter.
-    - y: The y-coordinate of the space fighter.
-    - space_fighter_sprites: A dictionary containing different sprites for the space fighter.
-    - current_sprite: The current sprite of the space fighter.
-    - speed: The speed of the space fighter.
-    - width: The width of the space fighter.
-    - height: The height of the space fighter.
-    - space_fighter_image: The canvas object representing the space fighter.
-    - lasers: A list containing instances of Laser representing the space fighter's lasers.
+class GameSession:
     """
-
-    def __init__(self, canvas, playing_keys):
-        self.canvas = canvas
-
-        # Set the initial position of the space fighter
-        self.x = constants.GAME_WIDTH // 2
-        self.y = constants.GAME_HEIGHT - 90
-
-        # Load and store the space fighter sprites as a dictionary
-        self.space_fighter_sprites = {
-            "main": PhotoImage(file="assets/img/chr/space-fighter-main.png"),
-            "super": PhotoImage(file="assets/img/chr/space-fighter-super.png"),
-            "shot": PhotoImage(file="assets/img/chr/space-fighter-shot.png"),
-            "destroyed": PhotoImage(file="assets/img/chr/space-fighter-destroyed.png"),
-            "explosion": PhotoImage(file="assets/img/chr/space-fighter-explosion.png")
-            # Sprites generated using Canva's AI image generator Magic Media [https://www.canva.com/ai-image-generator/]
-            # Input prompt "3D 4K Animated and Futuristic Space Fighter. 2D view from the top of it. Place it on a black background."
-            # Background removed using Canva's Magic Studio [https://www.canva.com/magic/].
-            # Further modifications made using Canva's image editor [https://canva.com].
-            # Editable file available as view-only at https://www.canva.com/design/DAF0D65NA5U/6-y7e9e_xXZK_j7Iaaq5TQ/edit.
-        }
-
-        # Properties of the space fighter
-        self.current_sprite = "main"
-        self.speed = 0
-        self.width = 150
-        self.height = 150
-
-        # Create the space fighter
-        self.create_space_fighter()
-
-        # Create a list to store the lasers
-        self.lasers = []
-
-        # Bind the key events to the corresponding methods
-        if playing_keys == "arrows":
-            self.canvas.bind("<Left>", self.move_left)
-            self.canvas.bind("<Right>", self.move_right)
-            self.canvas.bind("<Up>", self.move_up)
-            self.canvas.bind("<Down>", self.move_down)
-
-        elif playing_keys == "wasd":
-            # Uppercase
-            self.canvas.bind("<A>", self.move_left)
-            self.canvas.bind("<D>", self.move_right)
-            self.canvas.bind("<W>", self.move_up)
-            self.canvas.bind("<S>", self.move_down)
-
-            # Lowercase
-            self.canvas.bind("<a>", self.move_left)
-            self.canvas.bind("<d>", self.move_right)
-            self.canvas.bind("<w>", self.move_up)
-            self.canvas.bind("<s>", self.move_down)
-
-        # Cheat codes to update the sprite of the space fighter and be invincible
-        self.canvas.bind("<Control-Shift-Key-F>", self.update_sprite)
-
-        # Bind the space bar to the shoot method
-        self.canvas.bind("<space>", self.shoot)
-
-    def create_space_fighter(self):
-        """The create_space_fighter method creates the space fighter on the canvas."""
-
-        # Display the space fighter on the canvas and store it as an instance variable
-        self.space_fighter_image = self.canvas.create_image(
-            self.x,
-            self.y,
-            anchor="center",
-            image=self.space_fighter_sprites[self.current_sprite])
-
-    def update_sprite(self, _):
-        """The update_sprite method updates the sprite of the space fighter."""
-
-        # Check if the space fighter is in its main sprite
-        if self.current_sprite == "main":
-            # Change the sprite of the space fighter to super
-            self.current_sprite = "super"
-
-            self.canvas.itemconfig(
-                self.space_fighter_image,
-                image=self.space_fighter_sprites[self.current_sprite])
-
-        # Check if the space fighter is in its super sprite
-        elif self.current_sprite == "super":
-            # Change the sprite of the space fighter to main
-            self.current_sprite = "main"
-
-            self.canvas.itemconfig(
-                self.space_fighter_image,
-                image=self.space_fighter_sprites[self.current_sprite])
-
-        self.canvas.focus_set()
-
-    def move_left(self, event):
-        """The move_left method moves the space fighter to the left."""
-
-        # Check if the space fighter is not yet at the leftmost part of the canvas
-        if self.x > self.width / 2 + 15:
-            self.x -= self.speed
-            self.update_position(event)
-
-    def move_right(self, event):
-        """The move_right method moves the space fighter to the right."""
-
-        # Check if the space fighter is not yet at the rightmost part of the canvas
-        if self.x < constants.GAME_WIDTH - (self.width / 2 + 15):
-            self.x += self.speed
-            self.update_position(event)
-
-    def move_up(self, event):
-        """The move_up method moves the space fighter upwards."""
-
-        # Check if the space fighter is not yet at the top limit of the game
-        if self.y > self.height / 2 + 400:
-            self.y -= self.speed
-            self.update_position(event)
-
-    def move_down(self, event):
-        """The move_down method moves the space fighter downwards."""
-
-        # Check if the space fighter is not yet at the bottommost part of the canvas
-        if self.y < constants.GAME_HEIGHT - (self.height / 2 + 15):
-            self.y += self.speed
-            self.update_position(event)
-
-    def update_position(self, _):
-        """The update_position method updates the position of the space fighter on the canvas."""
-        self.canvas.coords(self.space_fighter_image, self.x, self.y)
-
-    def shoot(self, _):
-        """The shoot method shoots a laser from the space fighter."""
-
-        # Create a laser at the current position of the space fighter
-        laser = Laser(self.canvas, self.x, self.y - 40, self.speed - 5, "up", "main")
-
-        # Add the laser to the list of lasers
-        self.lasers.append(laser)
-
-    def move_lasers(self):
-        """The move_lasers method moves the lasers in the list of lasers."""
-
-        for laser in self.lasers:
-            laser.move()
-
-            # Remove the laser if it goes beyond the top of the canvas
-            if laser.off_screen(0):
-                self.lasers.remove(laser)
-
-    def shot_animation(self):
-        """The shot_animation method animates the space fighter when it gets hit by a laser."""
-
-        self.current_sprite = "shot"
-        self.canvas.itemconfig(
-            self.space_fighter_image,
-            image=self.space_fighter_sprites[self.current_sprite])
-
-        # Animate the space fighter
-        self.canvas.after(200, self.remove_shot_animation)
-
-    def remove_shot_animation(self):
-        """The remove_shot_animation method removes the space fighter from the canvas."""
-
-        self.current_sprite = "main"
-        self.canvas.itemconfig(
-            self.space_fighter_image,
-            image=self.space_fighter_sprites[self.current_sprite])
-
-    def destroyed_animation(self):
-        """The destroyed_animation method animates the space fighter when it gets destroyed."""
-
-        self.current_sprite = "destroyed"
-        self.canvas.itemconfig(
-            self.space_fighter_image,
-            image=self.space_fighter_sprites[self.current_sprite])
-
-        # Animate the space fighter
-        self.canvas.after(200, self.explosion_animation)
-
-    def explosion_animation(self):
-        """The explosion_animation method animates the explosion of the space fighter."""
-
-        # Change the sprite of the space fighter to explosion
-        self.current_sprite = "explosion"
-        self.canvas.itemconfig(
-            self.space_fighter_image,
-            image=self.space_fighter_sprites[self.current_sprite])
-
-        # Remove the space fighter after 200 milliseconds
-        self.canvas.after(200, self.remove_space_fighter)
-
-    def remove_space_fighter(self):
-        """The remove_space_fighter method removes the space fighter from the canvas."""
-        self.canvas.delete(self.space_fighter_image)
-
-class AlienShip:
-    """
-    The AlienShip class represents the alien ship in the game.
-    It manages the movement and shooting of the alien ship.
-    A new wave of alien ships is created every time the player
-    destroys an alien ship wave.
+    The GameSession class switches between the start menu and the game in one window.
 
     Parameters:
-    - canvas: The Tkinter canvas widget for rendering game elements.
-    - speed: The speed of the alien ship.
+    - master: The Tkinter master window, kept for every round.
+    - launch_time: The perf_counter time the game was launched (default is LAUNCH_TIME).
 
     Attributes:
-    - canvas: The Tkinter canvas widget for rendering game elements.
-    - x: The x-coordinate of the alien ship.
-    - y: The y-coordinate of the alien ship.
-    - alien_ship_sprites: A dictionary containing different sprites for the alien ship.
-    - current_sprite: The current sprite of the alien ship.
-    - speed: The speed of the alien ship.
-    - width: The width of the alien ship.
-    - height: The height of the alien ship.
-    - alien_ship_image: The canvas object representing the alien ship.
-    - alien_lasers: A list containing instances of Laser representing the alien ship's lasers.
-    - shoot_delay: The delay between shots in milliseconds.
-    - last_shot_time: The time of the last shot in milliseconds.
+    - master: The Tkinter master window.
+    - start_menu: The StartMenu shown, or None while a game is running.
+    - game: The Game running, or None while the start menu is shown.
+    - rounds: The number of games started.
+    - leaks: A list of the leaks found by the teardown checks.
+    - preloader: An instance of AssetPreloader loading the game assets while the start menu is shown.
+    - startup_timer: An instance of StartupTimer measuring the time to the first menu and game frames.
+    - bundle: The AssetBundle the images are loaded from, or None if the PNG files are loaded.
     """
 
-    def __init__(self, canvas, speed):
-        self.canvas = canvas
-
-        # Set the initial position of the alien ship
-        self.x = 0
-        self.y = 0
-
-        # Load and store the alien ship sprites as a dictionary
-        self.alien_ship_sprites = {
-            "main": PhotoImage(file="assets/img/chr/alien-ship-main.png"),
-            "destroyed": PhotoImage(file="assets/img/chr/alien-ship-destroyed.png"),
-            "explosion": PhotoImage(file="assets/img/chr/alien-ship-explosion.png")
-            # Sprites generated using Canva's AI image generator Magic Media [https://www.canva.com/ai-image-generator/]
-            # Input prompt "3D Cartoon 4K Animated and Futuristic Alien UFO. 2D view from the top of it. Place it on a black background."
-            # Background removed using Canva's Magic Studio [https://www.canva.com/magic/].
-            # Additional graphic "Cosmic explosion orange" Anna Kuz on Canva's free media library [https://www.canva.com/features/free-stock-photos/].
-            # Further modifications made using Canva's image editor [https://canva.com].
-            # Editable file available as view-only at https://www.canva.com/design/DAF0GJfd7jU/PrEOAQ9Z_rp3vRWcLYkN3Q/edit
-        }
-
-        # Properties of the alien ship
-        self.current_sprite = "main"
-        self.speed = speed
-        self.width = 100
-        self.height = 100
-
-        # Create the alien ship
-        self.create_alien_ship()
-
-        # Create a list to store the lasers
-        self.alien_lasers = []
-
-        # Set the shoot delay and last shot time
-        self.shoot_delay = 5000
-        self.last_shot_time = 0
-
-    def create_alien_ship(self):
-        """The create_alien_ship method creates the alien ship on the canvas."""
-
-        # Set the initial position of the alien ship randomly
-        self.x = random.randint(75, constants.GAME_WIDTH - 75)
-        self.y = random.randint(-900, 0)
-
-        # Display the alien ship on the canvas and store it as an instance variable
-        self.alien_ship_image = self.canvas.create_image(
-            self.x,
-            self.y,
-            anchor="center",
-            image=self.alien_ship_sprites[self.current_sprite])
-
-    def move(self):
-        """The move method moves the alien ship downwards."""
-
-        # Move the alien ship downwards
-        self.y += self.speed
-        self.x += 2 * math.sin(self.y / 50)
-
-        self.update_position()
-
-        # Remove the alien ship if it goes beyond the bottom of the canvas
-        if self.off_screen(constants.GAME_HEIGHT):
-            self.destroyed_animation()
-
-            # Update the lives of the player
-            game.lives -= 1
-            game.update_lives()
-
-            # Remove the alien ship from the alien_ships array
-            if self in game.alien_ships:
-                game.alien_ships.remove(self)
-
-        current_time = time.time() * 1000  # Convert to milliseconds
-
-        # Check if it's time for the alien to shoot a laser
-        if current_time - self.last_shot_time > self.shoot_delay and self.y > 0:
-            self.shoot()
-            self.last_shot_time = current_time
-
-    def update_position(self):
-        """The update_position method updates the position of the alien ship on the canvas."""
-        self.canvas.coords(self.alien_ship_image, self.x, self.y)
-
-    def shoot(self):
-        """The shoot method shoots a laser from the alien ship."""
-
-        # Create a laser at the current position of the alien ship
-        alien_laser = Laser(self.canvas, self.x, self.y + 40, self.speed + 3, "down", "alt")
-
-        self.alien_lasers.append(alien_laser)
-
-    def move_lasers(self):
-        """The move_lasers method moves the lasers in the list of lasers."""
-        for alien_laser in self.alien_lasers:
-            alien_laser.move()
-
-            # Remove the laser if it goes beyond the bottom of the canvas
-            if alien_laser.off_screen(constants.GAME_HEIGHT):
-                self.alien_lasers.remove(alien_laser)
-
-    def off_screen(self, height):
-        """The off_screen method checks if the alien ship is off the screen."""
-        return self.y >= height
-
-    def destroyed_animation(self):
-        """The destroyed_animation method animates the explosion of the alien ship."""
+    def __init__(self, master, launch_time=LAUNCH_TIME):
+        self.master = master
+        self.start_menu = None
+        self.game = None
+        self.rounds = 0
+        self.leaks = []
+        self.preloader = AssetPreloader(master)
+        self.startup_timer = StartupTimer(launch_time)
+
+        # Load every image with one file read from the asset bundle, or fall back to the PNG files
+        self.bundle = load_bundle()
+        if self.bundle is not None:
+            sprites.use_bundle(self.bundle)
+            collision.use_bundle(self.bundle)
+
+        # After callbacks pending before the first round are not leaks of the game
+        self.baseline_after_ids = set(self.pending_after_ids())
+
+        # Close the game and the preloader when the window is closed
+        self.master.protocol("WM_DELETE_WINDOW", self.close)
+
+    def show_menu(self):
+        """The show_menu method shows the start menu, reusing the window and the loaded images."""
+        self.master.title(constants.GAME_TITLE)
+        self.start_menu = StartMenu(self.master, self.start_game, self.close)
 
-        # Stop the alien ship from moving
-        self.speed = 0
+        if self.rounds == 0:
+            self.startup_timer.mark_first_frame(self.master, "first menu frame")
 
-        # Change the sprite of the alien ship to destroyed
-        self.current_sprite = "destroyed"
-        self.canvas.itemconfig(
-            self.alien_ship_image,
-            image=self.alien_ship_sprites[self.current_sprite])
+        # Load the game images and masks while the player is in the menu
+        self.preloader.preload(GAME_IMAGE_FILES, GAME_SPRITE_FILES)
 
-        # Animate the explosion of the alien ship
-        self.canvas.after(200, self.explosion_animation)
+    def start_game(self, playing_keys, player_name):
+        """The start_game method starts a new game from the start menu."""
+        new_game_time = time.perf_counter()
 
-    def explosion_animation(self):
-        """The explosion_animation method animates the explosion of the alien ship."""
+        self.start_menu = None
+        self.rounds += 1
+        self.master.title(constants.GAME_TITLE)
+        self.game = Game(self.master, playing_keys, player_name, self.return_to_menu)
 
-        # Change the sprite of the alien ship to explosion
-        self.current_sprite = "explosion"
-        self.canvas.itemconfig(
-            self.alien_ship_image,
-            image=self.alien_ship_sprites[self.current_sprite])
+        if self.rounds == 1:
+            self.startup_timer.mark_first_frame(self.master, "New Game to first game frame", new_game_time)
+            self.master.after_idle(self.report_startup)
 
-        # Remove the alien ship after 200 milliseconds
-        self.canvas.after(200, self.remove_alien_ship)
+    def start_replay(self, replay_file):
+        """The start_replay method plays a recorded game back in the window, or shows the start menu if it cannot be read."""
+        try:
+            replay = ReplayPlayer(replay_file)
+        except (OSError, ValueError) as error:
+            print(f"The replay cannot be played: {error}", file=sys.stderr)
+            self.show_menu()
+            return
 
-    def remove_alien_ship(self):
-        """The remove_alien_ship method removes the alien ship from the canvas."""
-        self.canvas.delete(self.alien_ship_image)
+        self.rounds += 1
+        self.master.title(f"{constants.GAME_TITLE} - Replay")
+        self.game = Game(self.master, replay.playing_keys, replay.player_name, self.return_to_menu, replay)
 
-class Laser:
-    """
-    The Laser class represents a laser beam in the game.
-    It manages the movement and appearance of the laser on the canvas.
+    def report_startup(self):
+        """The report_startup method prints the startup times and the number of preloaded images."""
+        print(f"{self.startup_timer.report()} ({self.preloader.loaded} images preloaded)")
 
-    Parameters:
-    - canvas: The Tkinter canvas widget for rendering game elements.
-    - x: The initial x-coordinate of the laser.
-    - y: The initial y-coordinate of the laser.
-    - speed: The speed of the laser beam (default is 10).
-    - direction: The direction of the laser ("up" or "down", default is "up").
-    - sprite: The sprite of the laser ("main" or "alt", default is "main").
+    def return_to_menu(self):
+        """The return_to_menu method tears the game down and shows the start menu again."""
+        self.game.teardown()
+        self.game = None
 
-    Attributes:
-    - canvas: The Tkinter canvas widget for rendering game elements.
-    - x: The current x-coordinate of the laser.
-    - y: The current y-coordinate of the laser.
-    - speed: The speed of the laser beam.
-    - direction: The direction of the laser ("up" or "down").
-    - laser_sprites: A dictionary containing different sprites for the laser.
-    - current_sprite: The current sprite of the laser.
-    - laser_image: The canvas object representing the laser beam.
-    """
-
-    def __init__(self, canvas, x, y, speed = 10, direction = "up", sprite = "main"):
-        self.canvas = canvas
+        self.check_teardown()
+        self.show_menu()
 
-        # Set the initial position of the laser
-        self.x = x
-        self.y = y
+    def close(self):
+        """The close method tears the running game down, stops the preloader and closes the window."""
+        if self.game is not None:
+            self.game.teardown()
+            self.game = None
 
-        # Speed and direction of the laser
-        self.speed = speed
-        self.direction = direction
+        self.preloader.close()
+        self.master.destroy()
 
-        # Load and store the laser image as an instance variable
-        self.laser_sprites = {
-            "main": PhotoImage(file="assets/img/clt/laser-beam.png"),
-            "alt": PhotoImage(file="assets/img/clt/laser-beam-alt.png")
-        }
-        # Laser graphic made by me (Jean Paul Fernandez) using Adobe Photoshop [https://adobe.com/products/photoshop/].
+    def pending_after_ids(self):
+        """The pending_after_ids method returns the identifiers of the after callbacks pending in Tk."""
+        return self.master.tk.splitlist(self.master.tk.call("after", "info"))
 
-        # Properties of the laser
-        self.current_sprite = sprite
-        self.laser_image = self.laser_sprites[self.current_sprite]
+    def check_teardown(self):
+        """The check_teardown method reports the widgets and after callbacks left behind by a game."""
+        leaks = []
 
-        # Display the laser on the canvas and store it as an instance variable
-        self.laser_beam = self.canvas.create_image(
-            self.x,
-            self.y,
-            anchor="center",
-            image=self.laser_image)
+        # The game canvas, with all its items, must be gone from the window
+        if self.master.winfo_children():
+            leaks.append(f"{len(self.master.winfo_children())} widgets left in the window")
 
-    def move(self):
-        """The move method moves the laser beam upwards or downwards."""
+        # The preloader polls across screens, so its callback is not a leak of the game
+        after_ids = set(self.pending_after_ids()) - self.baseline_after_ids - {self.preloader.after_id}
+        if after_ids:
+            leaks.append(f"{len(after_ids)} after callbacks still pending")
 
-        # Move the laser beam upwards or downwards according to its direction
-        if self.direction == "up":
-            self.y -= self.speed
-        elif self.direction == "down":
-            self.y += self.speed
+        for leak in leaks:
+            print(f"Teardown leak after round {self.rounds}: {leak}", file=sys.stderr)
 
-        # Update the position of the laser on the canvas
-        self.canvas.coords(self.laser_beam, self.x, self.y)
+        self.leaks += leaks
+        return leaks
 
-    def off_screen(self, height):
-        """The off_screen method checks if the laser is off the screen."""
-        # Check if the laser is off the screen according to its direction
-        if self.direction == "up":
-            # Return True if the laser is above the canvas
-            return self.y <= height
+if __name__ == "__main__":
+    # Run the benchmark suite instead of the game (python game_solution.py --bench)
+    if "--bench" in sys.argv:
+        import benchmark
+        sys.exit(benchmark.main(sys.argv[1:]))
 
-        if self.direction == "down":
-            # Return True if the laser is below the canvas
-            return self.y >= height
+    # Play a replay file back headless (python game_solution.py --replay FILE --headless)
+    if "--replay" in sys.argv and "--headless" in sys.argv:
+        import replay
+        sys.exit(replay.main(sys.argv[1:]))
 
-        # If the direction is not up or down, return none
-        return None
+    root = Tk()
+    session = GameSession(root)
 
-if __name__ == "__main__":
-    def start_game(playing_keys, player_name):
-        """The start_game function that starts a the game."""
-        global game
-        root.title(constants.GAME_TITLE)
-        game = Game(root, playing_keys, player_name)
+    # Play a replay file back in the window (python game_solution.py --replay FILE)
+    if "--replay" in sys.argv:
+        session.start_replay(sys.argv[sys.argv.index("--replay") + 1])
+    else:
+        session.show_menu()
 
-    root = Tk()
-    start_menu = StartMenu(root, start_game)
     root.mainloop()
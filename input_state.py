@@ -0,0 +1,87 @@
+"""
+Galactic Onslaught - Input State Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the input state class, which keeps track of the movement keys held by
+the player. Key presses and releases only update the set of held directions, they never move
+the space fighter themselves. The game reads the held directions once per tick instead, so
+the space fighter moves as soon as a key is pressed, without waiting for the key repeat of
+the operating system, at the same speed whatever the key repeat rate is, and diagonally when
+two keys are held.
+
+Implementation:
+This module is imported by the main game module. The Game class binds an InputState to the
+game canvas and steers the space fighter with its direction before every tick.
+"""
+
+# Movement keys of each control scheme, mapped to their direction
+MOVEMENT_KEYS = {
+    "arrows": {
+        "Left": "left",
+        "Right": "right",
+        "Up": "up",
+        "Down": "down"
+    },
+    "wasd": {
+        "a": "left", "A": "left",
+        "d": "right", "D": "right",
+        "w": "up", "W": "up",
+        "s": "down", "S": "down"
+    }
+}
+
+class InputState:
+    """
+    The InputState class records which movement keys are held down.
+
+    Parameters:
+    - playing_keys: The control scheme of the player, "arrows" or "wasd".
+
+    Attributes:
+    - keys: A dictionary mapping the key symbols of the control scheme to their direction.
+    - held: The set of directions whose key is held down.
+    """
+
+    def __init__(self, playing_keys):
+        self.keys = MOVEMENT_KEYS.get(playing_keys, {})
+        self.held = set()
+
+    def bind(self, widget):
+        """The bind method records the presses and releases of the movement keys on a widget."""
+        for key in self.keys:
+            widget.bind(f"<KeyPress-{key}>", self.press)
+            widget.bind(f"<KeyRelease-{key}>", self.release)
+
+        # Keys released while the window is not focused would stay held otherwise
+        widget.bind("<FocusOut>", self.clear)
+
+    def press(self, event):
+        """The press method marks the direction of a pressed key as held."""
+        direction = self.keys.get(event.keysym)
+        if direction is not None:
+            self.held.add(direction)
+
+    def release(self, event):
+        """The release method marks the direction of a released key as no longer held."""
+        direction = self.keys.get(event.keysym)
+        if direction is not None:
+            self.held.discard(direction)
+
+    def clear(self, _=None):
+        """The clear method releases every held direction."""
+        self.held.clear()
+
+    def direction(self):
+        """The direction method returns the (dx, dy) direction of the held keys, each -1, 0 or 1."""
+        held = self.held
+
+        # Opposite keys held together cancel each other out
+        dx = ("right" in held) - ("left" in held)
+        dy = ("down" in held) - ("up" in held)
+        return dx, dy
@@ -8,71 +8,398 @@ IDE: Visual Studio Code 1.84.2
 Development Platform: MacOs Sonoma 14.1
 
 Description:
-This module contains the leaderboard manager class, which manages the leaderboard file.
-The leaderboard file contains the top scores of the players who have played the game.
-The leaderboard manager class allows appending, updating, reading, and sorting of entries
-in the leaderboard file.
+This module contains the leaderboard backend class, which defines the methods shared by
+the two leaderboard backends, and the leaderboard manager class, which manages the
+leaderboard file. The leaderboard file contains the top scores of the players who have
+played the game. The leaderboard manager class allows appending and updating entries in
+the leaderboard file and reading its top entries.
+
+The scores are stored in an append-only journal. Appending or updating a score only adds a
+record at the end of the journal, and the latest record of each player wins when the
+journal is read. Once the journal holds enough outdated records, it is compacted in a
+background thread, which writes the latest record of every player to a new file and
+swaps it in place of the journal. The old whitespace-separated leaderboard text file is
+imported into the journal the first time the game runs. Appending a record and swapping the
+compacted journal in hold an exclusive lock on a lock file next to the journal, so the game
+processes sharing the leaderboard never lose a record to a compaction.
+
+The SQLite leaderboard manager class is the second backend, a sibling of the leaderboard
+manager class. It stores the scores in an SQLite database with a unique index on the
+player names and an index on the scores. Adding a score is a single upsert and the top ten
+scores are read with an indexed query, without loading every row. The database runs in WAL
+mode, so several game processes can share it. The leaderboard text file (or journal) is
+migrated into it on the first run.
 
 Implementation:
-This module is imported by the main game module. The leaderboard manager class is
-instantiated in the main game module and is used to manage the leaderboard file.
+This module is imported by the leaderboard worker module, whose create_leaderboard_manager
+call creates the manager of the backend chosen in the constants module on a background
+thread. The main game module draws the leaderboard with a LeaderboardView, whose canvas
+items are created once and updated in place when the leaderboard changes.
 """
 
 # Import modules
+import contextlib
+import heapq
+import os
+import sqlite3
+import threading
 import constants
 
-class LeaderboardManager:
+# File locks are taken with fcntl on Unix and msvcrt on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Number of entries shown in the leaderboard
+LEADERBOARD_SIZE = 10
+
+def latest_scores(lines):
+    """The latest_scores function returns a dictionary with the score of the latest record of each player."""
+    scores = {}
+    for line in lines:
+        parts = line.split()
+
+        # Skip malformed records, such as a line cut short by a crash
+        if len(parts) == 2 and parts[1].lstrip("-").isdigit():
+            name, score = parts
+            scores[name] = int(score)
+
+    return scores
+
+def create_leaderboard_manager(scores_file, backend=constants.LEADERBOARD_BACKEND):
+    """The create_leaderboard_manager function creates the leaderboard manager of a backend ("journal" or "sqlite")."""
+    if backend == "sqlite":
+        return SqliteLeaderboardManager(scores_file)
+
+    return LeaderboardManager(scores_file)
+
+class LeaderboardBackend:
+    """
+    Base class of the leaderboard backends
+    It defines the methods the leaderboard worker calls on every backend
+    A leaderboard entry is represented by a dictionary with keys "playerName" and "score"
+    """
+    def add_score(self, player_name, score):
+        """Add the score of a player, keeping only the best score of each player"""
+        raise NotImplementedError
+
+    def top(self):
+        """Return the top 10 entries of the leaderboard, from the best score down"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release the storage of the leaderboard"""
+
+class LeaderboardManager(LeaderboardBackend):
     """
     Class to manage the leaderboard file
-    It allows appending, updating, reading, and sorting of entries
-    In the leaderboard file, each line contains a player name and a score
+    It allows appending and updating entries, and reading the top entries
+    In the leaderboard journal, each line is a record with a player name and a score
     A leaderboard entry is represented by a dictionary with keys "playerName" and "score"
+
+    The scores are cached in memory, with a heap of the top 10 scores that is updated as the
+    scores are submitted. The journal is only read again when its modification time or size
+    shows that another process has changed it.
+
+    Parameters:
+    - scores_file: The path of the old leaderboard text file, imported on the first run.
+    - compaction_threshold: The number of outdated records that triggers a compaction
+        (default is LEADERBOARD_COMPACTION_THRESHOLD).
+
+    Attributes:
+    - scores_file: The path of the old leaderboard text file.
+    - journal_file: The path of the leaderboard journal, next to the old text file.
+    - lock_file: The path of the lock file serializing the writes of every process to the journal.
+    - records: The number of records in the journal.
+    - scores: A dictionary with the score of each player, in the order the players joined.
+    - ranks: A dictionary with the order in which each player joined, used to break ties.
+    - top_scores: A min-heap of (score, -rank, name) tuples of the top 10 players.
+    - file_state: The modification time and size of the journal matching the cache, or None.
+    - lock: A lock serializing the writes of the threads of this process to the journal.
+    - compaction_thread: The thread compacting the journal, or None.
     """
-    def __init__(self, scores_file):
+    def __init__(self, scores_file, compaction_threshold=constants.LEADERBOARD_COMPACTION_THRESHOLD):
         self.scores_file = scores_file
+        self.journal_file = os.path.splitext(scores_file)[0] + ".journal"
+        self.lock_file = self.journal_file + ".lock"
+        self.compaction_threshold = compaction_threshold
+        self.records = 0
+        self.scores = {}
+        self.ranks = {}
+        self.top_scores = []
+        self.file_state = None
+        self.lock = threading.Lock()
+        self.compaction_thread = None
+
+        # Import the old leaderboard text file on the first run
+        with self.journal_lock():
+            if not os.path.exists(self.journal_file):
+                self.import_scores_file()
+
+        self.load_journal()
+
+    def import_scores_file(self):
+        """Import the old leaderboard text file into a new journal"""
+        lines = []
+        if os.path.exists(self.scores_file):
+            with open(self.scores_file, 'r', encoding="utf-8") as file:
+                lines = file.readlines()
+
+        # The old format already has one record per line, the last line of a player wins
+        self.write_journal(latest_scores(lines))
+
+    @contextlib.contextmanager
+    def journal_lock(self):
+        """Hold the lock of this process and the file lock shared by every process writing to the journal"""
+        with self.lock:
+            with open(self.lock_file, 'a+b') as file:
+                if fcntl is not None:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+                else:
+                    # msvcrt locks a byte range, the first byte stands for the whole journal
+                    file.seek(0)
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+                # The file lock is released when the lock file is closed
+                yield
 
     def append_leaderboard(self, new_entry):
-        """Append a new entry to the leaderboard file"""
-        with open(self.scores_file, 'a', encoding="utf-8") as file:
-            line = f"{new_entry['playerName']} {new_entry['score']}\n"
-            file.write(line)
+        """Append a new entry to the leaderboard journal"""
+        self.append_record(new_entry)
 
     def update_leaderboard(self, update_entry):
-        """Update an existing entry in the leaderboard file"""
-        with open(self.scores_file, 'r', encoding="utf-8") as file:
-            lines = file.readlines()
-
-        with open(self.scores_file, 'w', encoding="utf-8") as file:
-            for line in lines:
-                parts = line.split()
-                if len(parts) == 2:
-                    name, _ = parts
-                    if name == update_entry['playerName']:
-                        line = f"{update_entry['playerName']} {update_entry['score']}\n"
-                file.write(line)
-
-    def read_leaderboard(self):
-        """Read the leaderboard file and return a list of dictionaries"""
-        leaderboard = []
-        with open(self.scores_file, 'r', encoding="utf-8") as file:
-            for line in file:
-                parts = line.split()
-                if len(parts) == 2:
-                    name, score = parts
-                    leaderboard.append({"playerName": name, "score": int(score)})
-
-        return leaderboard
-
-    def sort_leaderboard(self, leaderboard):
-        """Sort the leaderboard by score"""
-        leaderboard.sort(key=lambda x: x['score'], reverse=True)
-
-        # Keep only the top 10 entries
-        leaderboard = leaderboard[:10]
-        return leaderboard
-
-    def print_leaderboard(self, canvas, sorted_leaderboard, player_name):
-        """Print the leaderboard to the screen"""
+        """Update an existing entry by appending a newer record to the leaderboard journal"""
+        self.append_record(update_entry)
+
+    def append_record(self, entry):
+        """Append a record to the journal and start a compaction if it holds too many outdated records"""
+        # Another process may have changed the journal since the cache was loaded
+        self.refresh()
+
+        record = f"{entry['playerName']} {entry['score']}\n".encode("utf-8")
+        with self.journal_lock():
+            with open(self.journal_file, 'ab') as file:
+                file.write(record)
+                status = os.fstat(file.fileno())
+
+            # The cache stays valid only if no other process appended a record meanwhile
+            if self.file_state is not None and self.file_state[1] + len(record) == status.st_size:
+                self.file_state = (status.st_mtime_ns, status.st_size)
+            else:
+                self.file_state = None
+
+            self.records += 1
+
+        self.set_score(entry['playerName'], entry['score'])
+
+        if self.records - len(self.scores) > self.compaction_threshold:
+            self.compact()
+
+    def load_journal(self):
+        """Read the whole journal into the cache"""
+        with open(self.journal_file, 'rb') as file:
+            status = os.fstat(file.fileno())
+            data = file.read()
+
+        lines = data.decode("utf-8").splitlines()
+        self.scores = latest_scores(lines)
+        self.ranks = {name: rank for rank, name in enumerate(self.scores)}
+        self.records = len(lines)
+        self.rebuild_top_scores()
+
+        # A record appended while the journal was read makes the cache stale at once
+        self.file_state = (status.st_mtime_ns, status.st_size) if len(data) == status.st_size else None
+
+    def refresh(self):
+        """Reload the cache if the journal was changed outside this leaderboard manager"""
+        try:
+            status = os.stat(self.journal_file)
+        except FileNotFoundError:
+            return
+
+        if self.file_state != (status.st_mtime_ns, status.st_size):
+            self.load_journal()
+
+    def set_score(self, name, score):
+        """Store the score of a player in the cache and keep the top 10 heap up to date"""
+        previous_score = self.scores.get(name)
+        self.scores[name] = score
+        rank = self.ranks.setdefault(name, len(self.ranks))
+
+        for i, (_, _, top_name) in enumerate(self.top_scores):
+            if top_name == name:
+                # A lower score may let a player outside the top 10 in, so the heap is rebuilt
+                if score < previous_score:
+                    self.rebuild_top_scores()
+                else:
+                    self.top_scores[i] = (score, -rank, name)
+                    heapq.heapify(self.top_scores)
+                return
+
+        if len(self.top_scores) < LEADERBOARD_SIZE:
+            heapq.heappush(self.top_scores, (score, -rank, name))
+        elif (score, -rank, name) > self.top_scores[0]:
+            heapq.heapreplace(self.top_scores, (score, -rank, name))
+
+    def rebuild_top_scores(self):
+        """Rebuild the top 10 heap from every score in the cache"""
+        self.top_scores = heapq.nlargest(
+            LEADERBOARD_SIZE, ((score, -self.ranks[name], name) for name, score in self.scores.items()))
+        heapq.heapify(self.top_scores)
+
+    def write_journal(self, scores):
+        """Replace the journal with one record per player"""
+        temporary_file = self.journal_file + ".tmp"
+        with open(temporary_file, 'w', encoding="utf-8") as file:
+            for name, score in scores.items():
+                file.write(f"{name} {score}\n")
+
+        # The journal is swapped in a single step, so it is never seen half written
+        os.replace(temporary_file, self.journal_file)
+
+    def compact(self):
+        """Start compacting the journal in a background thread"""
+        if self.compaction_thread is not None and self.compaction_thread.is_alive():
+            return
+
+        self.compaction_thread = threading.Thread(target=self.compact_journal, daemon=True)
+        self.compaction_thread.start()
+
+    def compact_journal(self):
+        """Rewrite the journal with the latest record of each player"""
+        # The journal is read and swapped under the lock, so no process appends a record in between
+        with self.journal_lock():
+            with open(self.journal_file, 'r', encoding="utf-8") as file:
+                lines = file.readlines()
+                status = os.fstat(file.fileno())
+
+            scores = latest_scores(lines)
+            self.write_journal(scores)
+            self.records = len(scores)
+
+            # The compacted journal holds the same scores, so a valid cache stays valid
+            if self.file_state == (status.st_mtime_ns, status.st_size):
+                status = os.stat(self.journal_file)
+                self.file_state = (status.st_mtime_ns, status.st_size)
+
+    def add_score(self, player_name, score):
+        """Add the score of a player, keeping only the best score of each player"""
+        self.refresh()
+
+        # Check if the player exists in the leaderboard
+        if player_name in self.scores:
+            if score > self.scores[player_name]:
+                self.update_leaderboard({"playerName": player_name, "score": score})
+            return
+
+        # If the player does not exist in the leaderboard, append the player to the leaderboard
+        self.append_leaderboard({"playerName": player_name, "score": score})
+
+    def top(self):
+        """Return the top 10 entries of the leaderboard from the cache"""
+        self.refresh()
+        return [{"playerName": name, "score": score} for score, _, name in sorted(self.top_scores, reverse=True)]
+
+    def close(self):
+        """Wait for a running compaction to finish"""
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+
+class SqliteLeaderboardManager(LeaderboardBackend):
+    """
+    Class to manage the leaderboard in an SQLite database
+    It is a sibling of the LeaderboardManager class, with the methods of the LeaderboardBackend class
+    Each row of the leaderboard table contains a player name and the best score of the player
+
+    Parameters:
+    - scores_file: The path of the old leaderboard text file, migrated on the first run.
+
+    Attributes:
+    - scores_file: The path of the old leaderboard text file.
+    - journal_file: The path of the leaderboard journal, migrated instead of the text file if it exists.
+    - database_file: The path of the SQLite database, next to the old text file.
+    - connection: The connection to the database, in autocommit mode.
+    """
+    def __init__(self, scores_file):
+        self.scores_file = scores_file
+        self.journal_file = os.path.splitext(scores_file)[0] + ".journal"
+        self.database_file = os.path.splitext(scores_file)[0] + ".sqlite3"
+
+        # Wait up to 5 seconds for another game process that is writing to the database
+        self.connection = sqlite3.connect(self.database_file, timeout=5, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+
+    def create_tables(self):
+        """Create the leaderboard table and its indexes, and migrate the old scores on the first run"""
+        # The write lock makes other game processes wait until the migration is done
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS leaderboard (playerName TEXT NOT NULL, score INTEGER NOT NULL)")
+            self.connection.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS leaderboard_player ON leaderboard (playerName)")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS leaderboard_score ON leaderboard (score)")
+
+            # The user version is 0 until the old scores are migrated
+            if self.connection.execute("PRAGMA user_version").fetchone()[0] == 0:
+                self.migrate_scores_file()
+                self.connection.execute("PRAGMA user_version = 1")
+
+            self.connection.execute("COMMIT")
+        except sqlite3.Error:
+            self.connection.execute("ROLLBACK")
+            raise
+
+    def migrate_scores_file(self):
+        """Copy the scores of the journal, or of the old leaderboard text file, into the database"""
+        for file_name in (self.journal_file, self.scores_file):
+            if os.path.exists(file_name):
+                with open(file_name, 'r', encoding="utf-8") as file:
+                    scores = latest_scores(file.readlines())
+
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO leaderboard (playerName, score) VALUES (?, ?)", scores.items())
+                return
+
+    def add_score(self, player_name, score):
+        """Add the score of a player in a single upsert, keeping only the best score of each player"""
+        self.connection.execute(
+            "INSERT INTO leaderboard (playerName, score) VALUES (?, ?) "
+            "ON CONFLICT (playerName) DO UPDATE SET score = excluded.score WHERE excluded.score > score",
+            (player_name, score))
+
+    def top(self):
+        """Return the top 10 entries of the leaderboard with an indexed query"""
+        rows = self.connection.execute(
+            "SELECT playerName, score FROM leaderboard ORDER BY score DESC, rowid LIMIT ?", (LEADERBOARD_SIZE,))
+        return [{"playerName": name, "score": score} for name, score in rows]
+
+    def close(self):
+        """Close the connection to the database"""
+        self.connection.close()
+
+class LeaderboardView:
+    """
+    Class to draw the leaderboard table on a canvas
+    The canvas items of the table are created once, and updating the table only changes
+    the rows whose rank, name, score or highlight changed
+
+    Parameters:
+    - canvas: The Tkinter canvas widget the table is drawn on.
+    - size: The number of rows of the table (default is LEADERBOARD_SIZE).
+
+    Attributes:
+    - canvas: The Tkinter canvas widget the table is drawn on.
+    - rows: A list of (rank, name, score) canvas text items for each row.
+    - row_states: A list of the (rank, name, score, highlighted) tuple shown by each row, or None if it is empty.
+    """
+    def __init__(self, canvas, size=LEADERBOARD_SIZE):
+        self.canvas = canvas
 
         # Print Leaderboard on a table
         canvas.create_rectangle(
@@ -124,38 +451,72 @@ class LeaderboardManager:
             anchor="center",
             tag="leaderboard-score")
 
-        # Create the leaderboard entries on the canvas
-        for i, entry in enumerate(sorted_leaderboard):
-            if entry["playerName"] == player_name:
-                font_size = constants.GAME_SMALL_FONT_BOLD
-                font_color = constants.GAME_FONT_COLOR_SUCCESS
-            else:
-                font_size = constants.GAME_SMALL_FONT
-                font_color = constants.GAME_FONT_COLOR
-
-            canvas.create_text(
+        # Create the empty rows of the table, filled in by the update method
+        self.rows = []
+        for i in range(size):
+            rank_item = canvas.create_text(
                 constants.GAME_WIDTH // 2 - 125,
                 constants.GAME_HEIGHT // 2 - 200 + (i * 50),
-                text=f"{i + 1}",
-                fill=font_color,
-                font=(font_size),
+                text="",
                 anchor="center",
-                tag="leaderboard-entry-rank")
+                tag=("leaderboard-entry-rank", "leaderboard-entry"))
 
-            canvas.create_text(
+            name_item = canvas.create_text(
                 constants.GAME_WIDTH // 2 - 50,
                 constants.GAME_HEIGHT // 2 - 200 + (i * 50),
-                text=f"{entry['playerName']}",
-                fill=font_color,
-                font=(font_size),
+                text="",
                 anchor="w",
-                tag="leaderboard-entry-name")
+                tag=("leaderboard-entry-name", "leaderboard-entry"))
 
-            canvas.create_text(
+            score_item = canvas.create_text(
                 constants.GAME_WIDTH // 2 + 125,
                 constants.GAME_HEIGHT // 2 - 200 + (i * 50),
-                text=f"{entry['score']}",
-                fill=font_color,
-                font=(font_size),
+                text="",
                 anchor="center",
-                tag="leaderboard-entry-score")
+                tag=("leaderboard-entry-score", "leaderboard-entry"))
+
+            self.rows.append((rank_item, name_item, score_item))
+
+        self.row_states = [None] * size
+
+    def update(self, sorted_leaderboard, player_name):
+        """Show the sorted leaderboard, changing only the rows that differ, and return the number of rows changed"""
+        changed = 0
+
+        for i, items in enumerate(self.rows):
+            if i < len(sorted_leaderboard):
+                entry = sorted_leaderboard[i]
+                state = (i + 1, entry["playerName"], entry["score"], entry["playerName"] == player_name)
+            else:
+                state = None
+
+            # Leave the row alone if it already shows this entry
+            if state == self.row_states[i]:
+                continue
+
+            self.row_states[i] = state
+            self.draw_row(items, state)
+            changed += 1
+
+        return changed
+
+    def draw_row(self, items, state):
+        """Show a (rank, name, score, highlighted) state in the canvas items of a row"""
+        rank_item, name_item, score_item = items
+
+        if state is None:
+            for item in items:
+                self.canvas.itemconfig(item, text="")
+            return
+
+        rank, name, score, highlighted = state
+        if highlighted:
+            font_size = constants.GAME_SMALL_FONT_BOLD
+            font_color = constants.GAME_FONT_COLOR_SUCCESS
+        else:
+            font_size = constants.GAME_SMALL_FONT
+            font_color = constants.GAME_FONT_COLOR
+
+        self.canvas.itemconfig(rank_item, text=f"{rank}", fill=font_color, font=(font_size))
+        self.canvas.itemconfig(name_item, text=f"{name}", fill=font_color, font=(font_size))
+        self.canvas.itemconfig(score_item, text=f"{score}", fill=font_color, font=(font_size))
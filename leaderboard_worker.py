@@ -0,0 +1,123 @@
+"""
+Galactic Onslaught - Leaderboard Worker Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the leaderboard worker class, which runs the leaderboard reads and
+writes on a background thread so the Tk main loop never waits for the storage. Requests
+are submitted to a single worker thread, which owns the leaderboard manager and runs them
+one at a time in the order they were submitted. Their results are put on a queue that the
+Tk thread polls with the after method, and each result is handed to the callback of its
+request on the Tk thread.
+
+Implementation:
+This module is imported by the main game module. The Game class creates a LeaderboardWorker
+when the game starts, submits the score of the player on game over and prints the
+leaderboard once its top entries are delivered.
+"""
+
+# Import modules
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import constants
+from leaderboard import create_leaderboard_manager
+
+class LeaderboardWorker:
+    """
+    The LeaderboardWorker class runs the leaderboard manager on a background thread.
+
+    Parameters:
+    - master: The Tkinter widget used to poll the results.
+    - scores_file: The path of the leaderboard file.
+    - backend: The leaderboard backend, "journal" or "sqlite" (default is LEADERBOARD_BACKEND).
+    - poll_interval: The milliseconds between two polls of the results (default is 50).
+
+    Attributes:
+    - master: The Tkinter widget used to poll the results.
+    - executor: The single thread executor running the leaderboard requests.
+    - results: A queue of (callback, result) tuples waiting for the Tk thread.
+    - manager: The leaderboard manager, only used on the worker thread.
+    - pending: The number of requests whose result has not been delivered yet.
+    """
+
+    def __init__(self, master, scores_file, backend=constants.LEADERBOARD_BACKEND, poll_interval=50):
+        self.master = master
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leaderboard")
+        self.results = queue.Queue()
+        self.manager = None
+        self.pending = 0
+        self.after_id = None
+
+        # The manager is created on the worker thread, as it reads the leaderboard file
+        self.submit(lambda: self.open_manager(scores_file, backend))
+
+    def open_manager(self, scores_file, backend):
+        """The open_manager method creates the leaderboard manager on the worker thread."""
+        self.manager = create_leaderboard_manager(scores_file, backend)
+
+    def close_manager(self):
+        """The close_manager method closes the leaderboard manager on the worker thread."""
+        if self.manager is not None:
+            self.manager.close()
+
+    def submit(self, request, callback=None):
+        """The submit method runs a request on the worker thread and hands its result to the callback."""
+        self.pending += 1
+        self.executor.submit(self.run, request, callback)
+
+        if self.after_id is None:
+            self.after_id = self.master.after(self.poll_interval, self.poll)
+
+    def run(self, request, callback):
+        """The run method runs a request on the worker thread and queues its result."""
+        try:
+            result = request()
+        except Exception as error: # Storage errors must not stop the game
+            print(f"Leaderboard error: {error}", file=sys.stderr)
+            result = None
+
+        self.results.put((callback, result))
+
+    def poll(self):
+        """The poll method delivers the queued results on the Tk thread."""
+        self.after_id = None
+
+        while True:
+            try:
+                callback, result = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            self.pending -= 1
+            if callback is not None:
+                callback(result)
+
+        # Keep polling while results are still expected
+        if self.pending > 0:
+            self.after_id = self.master.after(self.poll_interval, self.poll)
+
+    def submit_score(self, player_name, score, callback=None):
+        """The submit_score method keeps the score of a player if it is the best score of the player."""
+        self.submit(lambda: self.manager.add_score(player_name, score), callback)
+
+    def top_leaderboard(self, callback):
+        """The top_leaderboard method hands the top entries of the leaderboard to the callback."""
+        self.submit(lambda: self.manager.top(), callback)
+
+    def close(self):
+        """The close method stops delivering results and closes the manager once the submitted requests are done."""
+        if self.after_id is not None:
+            self.master.after_cancel(self.after_id)
+            self.after_id = None
+
+        # The submitted requests and the close run on the worker thread without the Tk thread waiting,
+        # and the interpreter waits for the worker thread before it exits
+        self.executor.submit(self.close_manager)
+        self.executor.shutdown(wait=False)
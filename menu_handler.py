@@ -21,7 +21,8 @@ menu class is also used to retrieve the chosen playing keys and player name.
 
 # Import modules
 import constants
-from tkinter import Canvas, PhotoImage, Entry, Button, StringVar, Radiobutton
+from tkinter import Canvas, Entry, Button, StringVar, Radiobutton
+from sprite_registry import sprites
 
 class StartMenu:
     """
@@ -29,7 +30,7 @@ class StartMenu:
     which contains the main menu, game instructions, and game credits.
     """
 
-    def __init__(self, master, start_game_callback):
+    def __init__(self, master, start_game_callback, quit_callback=None):
         # Store the root window as an instance variable
         self.master = master
 
@@ -40,6 +41,9 @@ class StartMenu:
 
         self.start_game_callback = start_game_callback
 
+        # The Quit button closes the window unless the caller closes the game itself
+        self.quit_callback = quit_callback if quit_callback is not None else self.master.destroy
+
         # Calculate the center of the canvas and store it as instance variables
         center_x = constants.GAME_WIDTH // 2
         center_y = constants.GAME_HEIGHT // 2
@@ -56,13 +60,13 @@ class StartMenu:
 
         self.start_menu_canvas.pack()
 
-        # Load and store the button images as instance variables
-        self.keys_image = PhotoImage(file="")
-        self.keys_sel_image = PhotoImage(file="")
-        self.button_image = PhotoImage(file="")
+        # Store the button images as instance variables
+        self.keys_image = None
+        self.keys_sel_image = None
+        self.button_image = None
 
-        # Load and store the background image for the start menu
-        self.background_image = PhotoImage(file="assets/img/bg/background-dark.png")
+        # Get the shared background image for the start menu
+        self.background_image = sprites.get("assets/img/bg/background-dark.png")
         # Background graphic made by me (Jean Paul Fernandez) using Canva's image editor [https://www.canva.com].
         # Additional graphics made by Rostik Solonenko, retrieved from Canva's free media library [https://www.canva.com/features/free-stock-photos/].
         # Editable file available as view-only at https://www.canva.com/design/DAF0EFDjc3g/cApy-RMGI9pTI6kQi9Xrmg/edit.
@@ -103,7 +107,7 @@ class StartMenu:
             center_x + 200,
             center_y - 190,
             "Quit",
-            self.master.destroy,
+            self.quit_callback,
             "e",
             "quit-button")
         # Button images made by PixelChoice, retrieved from Canva's free media library [https://www.canva.com/features/free-stock-photos/].
@@ -205,7 +209,7 @@ class StartMenu:
 
     def create_button(self, x, y, text, command, anchor="center", image=""):
         """Create a button on the canvas."""
-        self.button_image = PhotoImage(file=f"assets/img/btn/{image}.png")
+        self.button_image = sprites.get(f"assets/img/btn/{image}.png")
 
         button = Button(
             self.start_menu_canvas,
@@ -227,8 +231,8 @@ class StartMenu:
 
     def create_radio_button(self, x, y, text, value, image):
         """Create a radio button on the canvas."""
-        self.keys_image = PhotoImage(file=f"assets/img/btn/{image}.png")
-        self.keys_sel_image = PhotoImage(file=f"assets/img/btn/{image}-sel.png")
+        self.keys_image = sprites.get(f"assets/img/btn/{image}.png")
+        self.keys_sel_image = sprites.get(f"assets/img/btn/{image}-sel.png")
 
         radiobutton = Radiobutton(
             self.start_menu_canvas,
@@ -0,0 +1,126 @@
+"""
+Galactic Onslaught - PNG Reader Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains a small PNG reader written with the standard library only. It decodes
+the 8-bit RGB and RGBA images used by the game without a Tk window, so the collision masks
+of the sprites can be built by the headless simulation.
+
+Implementation:
+This module is imported by the collision module. The read_png function returns the width,
+the height and the RGBA bytes of every row of an image.
+"""
+
+# Import modules
+import struct
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Bytes per pixel of the supported colour types (2 is RGB, 6 is RGBA)
+BYTES_PER_PIXEL = {2: 3, 6: 4}
+
+def read_png(file):
+    """The read_png function returns the width, height and RGBA rows of an 8-bit PNG file."""
+    with open(file, "rb") as png_file:
+        data = png_file.read()
+
+    return read_png_data(data, file)
+
+def read_png_data(data, file="PNG data"):
+    """The read_png_data function returns the width, height and RGBA rows of 8-bit PNG data."""
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError(f"{file} is not a PNG file")
+
+    # Read the header and the compressed image data chunks
+    position = 8
+    compressed = []
+    while position < len(data):
+        length, chunk_type = struct.unpack(">I4s", data[position:position + 8])
+        chunk = data[position + 8:position + 8 + length]
+        position += length + 12
+
+        if chunk_type == b"IHDR":
+            width, height, bit_depth, colour_type, _, _, interlace = struct.unpack(">IIBBBBB", chunk)
+        elif chunk_type == b"IDAT":
+            compressed.append(chunk)
+        elif chunk_type == b"IEND":
+            break
+
+    if bit_depth != 8 or colour_type not in BYTES_PER_PIXEL or interlace != 0:
+        raise ValueError(f"{file} is not an 8-bit non-interlaced RGB or RGBA PNG file")
+
+    raw = zlib.decompress(b"".join(compressed))
+    bpp = BYTES_PER_PIXEL[colour_type]
+    stride = width * bpp
+
+    rows = []
+    previous = bytearray(stride)
+    offset = 0
+    for _ in range(height):
+        filter_type = raw[offset]
+        row = bytearray(raw[offset + 1:offset + 1 + stride])
+        offset += stride + 1
+
+        unfilter_row(filter_type, row, previous, bpp)
+
+        # Add an opaque alpha channel to RGB images
+        if bpp == 3:
+            rgba = bytearray(width * 4)
+            for x in range(width):
+                rgba[x * 4:x * 4 + 3] = row[x * 3:x * 3 + 3]
+                rgba[x * 4 + 3] = 255
+            rows.append(bytes(rgba))
+        else:
+            rows.append(bytes(row))
+
+        previous = row
+
+    return width, height, rows
+
+def unfilter_row(filter_type, row, previous, bpp):
+    """The unfilter_row function reverses the PNG filter of a row in place."""
+    if filter_type == 0: # None
+        return
+
+    if filter_type == 1: # Sub
+        for i in range(bpp, len(row)):
+            row[i] = (row[i] + row[i - bpp]) & 0xFF
+
+    elif filter_type == 2: # Up
+        for i in range(len(row)):
+            row[i] = (row[i] + previous[i]) & 0xFF
+
+    elif filter_type == 3: # Average
+        for i in range(len(row)):
+            left = row[i - bpp] if i >= bpp else 0
+            row[i] = (row[i] + (left + previous[i]) // 2) & 0xFF
+
+    elif filter_type == 4: # Paeth
+        for i in range(len(row)):
+            left = row[i - bpp] if i >= bpp else 0
+            up = previous[i]
+            up_left = previous[i - bpp] if i >= bpp else 0
+
+            estimate = left + up - up_left
+            distance_left = abs(estimate - left)
+            distance_up = abs(estimate - up)
+            distance_up_left = abs(estimate - up_left)
+
+            if distance_left <= distance_up and distance_left <= distance_up_left:
+                predictor = left
+            elif distance_up <= distance_up_left:
+                predictor = up
+            else:
+                predictor = up_left
+
+            row[i] = (row[i] + predictor) & 0xFF
+
+    else:
+        raise ValueError(f"Unknown PNG filter type {filter_type}")
@@ -0,0 +1,238 @@
+"""
+Galactic Onslaught - Profiler Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the frame profiler class, which measures how the 16 ms budget of a
+frame is spent. It keeps the frame times of the last few seconds, the time spent drawing
+the frame (update_screen) and the time the simulation spent in each phase of its ticks
+(moving the entities, level_up and check_collisions), along with the frames the game loop
+ran late and the ticks it dropped. The profiler can show these numbers in an overlay on the
+game canvas, and it can stream every sample to a CSV file.
+
+The startup timer class measures how long the game takes to show its first frames: the
+time from launch to the first frame of the start menu, and the time from pressing New Game
+to the first frame of the game.
+
+Implementation:
+This module is imported by the main game module. The Game class records every tick and
+frame in a FrameProfiler, and binds Ctrl+Shift+O to toggle the overlay and Ctrl+Shift+C to
+start or stop streaming the samples to a CSV file. The GameSession class reports the
+startup times of a StartupTimer.
+"""
+
+# Import modules
+import csv
+import time
+from collections import deque
+import constants
+
+# Number of frames kept for the percentiles (five seconds of frames)
+PROFILER_WINDOW = 5 * constants.GAME_SPEED
+
+# Number of frames between two refreshes of the overlay text
+PROFILER_REFRESH_FRAMES = constants.GAME_SPEED // 4
+
+# Columns of the CSV file
+CSV_COLUMNS = (
+    "frame", "time", "frame_ms", "ticks", "update_screen_ms",
+    "update_entities_ms", "level_up_ms", "check_collisions_ms",
+    "alien_ships", "debris", "lasers", "alien_lasers", "animations", "canvas_items", "canvas_calls",
+    "pooled_items", "pool_overflow", "late_frames", "dropped_ticks")
+
+def percentile(sorted_values, fraction):
+    """The percentile function returns the value at a fraction (0.0 to 1.0) of a sorted list."""
+    if not sorted_values:
+        return 0.0
+
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+class FrameProfiler:
+    """
+    The FrameProfiler class records frame and tick timings and shows them in an overlay.
+
+    Parameters:
+    - canvas: The Tkinter canvas widget the overlay is drawn on.
+    - window: The number of frames kept for the percentiles (default is PROFILER_WINDOW).
+
+    Attributes:
+    - canvas: The Tkinter canvas widget the overlay is drawn on.
+    - frame_times: The durations of the last frames in milliseconds.
+    - frames: The number of frames recorded.
+    - tick_phase_times: The milliseconds spent in each simulation phase since the last frame.
+    - ticks: The number of ticks run since the last frame.
+    - last_frame: A dictionary with the timings and counts of the last frame.
+    - overlay: The canvas text item of the overlay, or None if it is hidden.
+    - csv_file: The file the samples are streamed to, or None if streaming is off.
+    """
+
+    def __init__(self, canvas, window=PROFILER_WINDOW):
+        self.canvas = canvas
+        self.frame_times = deque(maxlen=window)
+        self.frames = 0
+        self.tick_phase_times = {}
+        self.ticks = 0
+        self.last_frame = {}
+        self.previous_frame_start = None
+
+        self.overlay = None
+        self.csv_file = None
+        self.csv_writer = None
+
+    def record_tick(self, phase_times):
+        """The record_tick method adds the phase times (in seconds) of a simulation tick."""
+        self.ticks += 1
+        for phase, seconds in phase_times.items():
+            self.tick_phase_times[phase] = self.tick_phase_times.get(phase, 0.0) + seconds * 1000
+
+    def record_frame(self, frame_start, update_screen_time, count_entities):
+        """
+        The record_frame method records a frame that started at frame_start (perf_counter seconds).
+        The count_entities function is only called while the overlay or the CSV file is on.
+        """
+        if self.previous_frame_start is not None:
+            self.frame_times.append((frame_start - self.previous_frame_start) * 1000)
+        self.previous_frame_start = frame_start
+        self.frames += 1
+
+        # Nothing else is measured while the overlay and the CSV file are off
+        if self.overlay is None and self.csv_writer is None:
+            self.reset_ticks()
+            return
+
+        self.last_frame = {
+            "frame": self.frames,
+            "time": round(frame_start, 6),
+            "frame_ms": round(self.frame_times[-1], 3) if self.frame_times else 0.0,
+            "ticks": self.ticks,
+            "update_screen_ms": round(update_screen_time * 1000, 3),
+            "update_entities_ms": round(self.tick_phase_times.get("update_entities", 0.0), 3),
+            "level_up_ms": round(self.tick_phase_times.get("level_up", 0.0), 3),
+            "check_collisions_ms": round(self.tick_phase_times.get("check_collisions", 0.0), 3),
+            "canvas_items": len(self.canvas.find_all())
+        }
+        self.last_frame.update(count_entities())
+        self.reset_ticks()
+
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(self.last_frame)
+
+        if self.overlay is not None and self.frames % PROFILER_REFRESH_FRAMES == 0:
+            self.refresh_overlay()
+
+    def reset_ticks(self):
+        """The reset_ticks method clears the tick timings for the next frame."""
+        self.ticks = 0
+        self.tick_phase_times.clear()
+
+    def summary(self):
+        """The summary method returns the FPS and the frame time percentiles of the window."""
+        frame_times = sorted(self.frame_times)
+        average = sum(frame_times) / len(frame_times) if frame_times else 0.0
+
+        return {
+            "fps": 1000 / average if average else 0.0,
+            "p50": percentile(frame_times, 0.50),
+            "p95": percentile(frame_times, 0.95),
+            "p99": percentile(frame_times, 0.99)
+        }
+
+    def overlay_text(self):
+        """The overlay_text method returns the text shown in the overlay."""
+        summary = self.summary()
+        frame = self.last_frame
+
+        return "\n".join((
+            f"FPS: {summary['fps']:.1f}",
+            f"Frame ms p50/p95/p99: {summary['p50']:.1f} / {summary['p95']:.1f} / {summary['p99']:.1f}",
+            f"update_screen: {frame.get('update_screen_ms', 0.0):.2f} ms",
+            f"move entities: {frame.get('update_entities_ms', 0.0):.2f} ms",
+            f"check_collisions: {frame.get('check_collisions_ms', 0.0):.2f} ms",
+            f"level_up: {frame.get('level_up_ms', 0.0):.2f} ms",
+            f"Ticks this frame: {frame.get('ticks', 0)}",
+            f"Late frames: {frame.get('late_frames', 0)} ({frame.get('dropped_ticks', 0)} ticks dropped)",
+            f"Alien ships: {frame.get('alien_ships', 0)} (+{frame.get('debris', 0)} exploding)",
+            f"Lasers: {frame.get('lasers', 0)} player, {frame.get('alien_lasers', 0)} alien",
+            f"Animations: {frame.get('animations', 0)}",
+            f"Canvas items: {frame.get('canvas_items', 0)}",
+            f"Canvas calls this frame: {frame.get('canvas_calls', 0)}",
+            f"Pooled canvas items: {frame.get('pooled_items', 0)} ({frame.get('pool_overflow', 0)} overflowed)"))
+
+    def refresh_overlay(self):
+        """The refresh_overlay method updates the overlay text and keeps it above the sprites."""
+        self.canvas.itemconfig(self.overlay, text=self.overlay_text())
+        self.canvas.tag_raise(self.overlay)
+
+    def toggle(self, _=None):
+        """The toggle method shows or hides the overlay."""
+        if self.overlay is None:
+            self.overlay = self.canvas.create_text(
+                20,
+                110,
+                text=self.overlay_text(),
+                fill=constants.GAME_FONT_COLOR_SUCCESS,
+                font=(constants.GAME_SMALLEST_FONT),
+                anchor="nw",
+                tag="profiler")
+        else:
+            self.canvas.delete(self.overlay)
+            self.overlay = None
+
+    def toggle_csv(self, _=None, file_name=None):
+        """The toggle_csv method starts or stops streaming the samples to a CSV file."""
+        if self.csv_file is None:
+            file_name = file_name or time.strftime("frame-profile-%Y%m%d-%H%M%S.csv")
+            self.csv_file = open(file_name, "w", newline="", encoding="utf-8")
+            self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+            self.csv_writer.writeheader()
+        else:
+            self.close()
+
+    def close(self):
+        """The close method stops streaming the samples and closes the CSV file."""
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+
+class StartupTimer:
+    """
+    The StartupTimer class measures the time it takes to show the first frames of each screen.
+
+    Parameters:
+    - launch_time: The perf_counter time the game was launched.
+    - timer: The function returning the current time in seconds (default is time.perf_counter).
+
+    Attributes:
+    - launch_time: The perf_counter time the game was launched.
+    - marks: A dictionary mapping each mark name to its milliseconds since its start time.
+    """
+
+    def __init__(self, launch_time, timer=time.perf_counter):
+        self.launch_time = launch_time
+        self.timer = timer
+        self.marks = {}
+
+    def mark_first_frame(self, master, name, start_time=None):
+        """
+        The mark_first_frame method records the time of the next frame drawn by Tk.
+        Tk draws the screen in idle callbacks that are already queued, so an idle callback
+        queued now runs once the frame is on screen.
+        """
+        start_time = self.launch_time if start_time is None else start_time
+        master.after_idle(self.mark, name, start_time)
+
+    def mark(self, name, start_time):
+        """The mark method records the milliseconds elapsed since start_time under a name."""
+        self.marks[name] = (self.timer() - start_time) * 1000
+
+    def report(self):
+        """The report method returns the recorded marks as a line of text."""
+        marks = ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.marks.items())
+        return f"Startup: {marks}"
@@ -0,0 +1,236 @@
+"""
+Galactic Onslaught - Replay Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the replay recorder and player, which record a game and play it back
+exactly as it was played. The simulation is deterministic: given the seed of its random
+number generator and the inputs of the player, each tagged with the tick it was applied
+on, it simulates the same game again, tick for tick. A session that was slow in the field
+can be played back on a development machine and profiled, with or without the display.
+
+A replay file starts with a header line followed by a JSON line with the seed, whether the
+game had horde waves, the control scheme and the name of the player. Every input after that is a record of 7 bytes: the tick,
+the input and the direction of a steer input. Steer inputs are only recorded when the
+direction changes. The records are streamed to the file while the game is played and read
+back a block at a time, so long sessions are never held in memory.
+
+Implementation:
+This module is imported by the main game module. The Game class records every game to
+REPLAY_FILE and plays a replay file back with "python game_solution.py --replay FILE".
+A replay file is played back headless, reporting its slowest ticks, with
+"python replay.py FILE" or "python game_solution.py --replay FILE --headless".
+"""
+
+# Import modules
+import argparse
+import json
+import struct
+import sys
+import time
+from simulation import Simulation, PHASES
+from entity_store import numpy_available
+
+# First line of a replay file
+REPLAY_MAGIC = b"GOREPLAY1\n"
+
+# Inputs of the player, stored as their index, and the end of the recording
+INPUTS = ("steer", "shoot", "pause", "cheat", "end")
+
+# Record of an input: the tick, the input and the dx and dy of a steer input
+RECORD = struct.Struct(">IBbb")
+
+# Number of records read from the file at a time
+READ_BLOCK_RECORDS = 4096
+
+class ReplayRecorder:
+    """
+    The ReplayRecorder class streams the seed and the inputs of a game to a replay file.
+
+    Parameters:
+    - replay_file: The path of the replay file, replaced if it exists.
+    - seed: The seed of the random number generator of the simulation.
+    - horde_waves: A boolean indicating whether the simulation has horde waves.
+    - playing_keys: The control scheme of the player.
+    - player_name: The name of the player.
+
+    Attributes:
+    - replay_file: The path of the replay file.
+    - output: The replay file, open for writing.
+    - direction: The direction of the last steer input recorded.
+    - records: The number of inputs recorded.
+    """
+
+    def __init__(self, replay_file, seed, horde_waves, playing_keys, player_name):
+        self.replay_file = replay_file
+        self.output = open(replay_file, "wb")
+        self.direction = (0, 0)
+        self.records = 0
+
+        header = {"seed": seed, "horde_waves": horde_waves, "playing_keys": playing_keys, "player_name": player_name}
+        self.output.write(REPLAY_MAGIC + json.dumps(header).encode("utf-8") + b"\n")
+
+    def record(self, tick, name, dx=0, dy=0):
+        """The record method writes an input applied before the given tick was simulated."""
+        if self.output is None:
+            return
+
+        # Held keys are steered on every tick, only the changes of direction are kept
+        if name == "steer":
+            if (dx, dy) == self.direction:
+                return
+            self.direction = (dx, dy)
+
+        self.output.write(RECORD.pack(tick, INPUTS.index(name), dx, dy))
+        self.records += 1
+
+    def close(self, tick):
+        """The close method records the tick the game ended on and closes the replay file."""
+        if self.output is None:
+            return
+
+        self.record(tick, "end")
+        self.output.close()
+        self.output = None
+
+class ReplayPlayer:
+    """
+    The ReplayPlayer class reads a replay file and hands its inputs back tick by tick.
+
+    Parameters:
+    - replay_file: The path of the replay file.
+
+    Attributes:
+    - replay_file: The path of the replay file.
+    - input_file: The replay file, open for reading.
+    - seed: The seed of the random number generator of the recorded game.
+    - horde_waves: A boolean indicating whether the recorded game had horde waves.
+    - playing_keys: The control scheme of the recorded player.
+    - player_name: The name of the recorded player.
+    - records: An iterator over the (tick, name, dx, dy) records of the file.
+    - next_record: The next record to play back, or None once the file is finished.
+    - end_tick: The tick the recording ended on, or None until it is reached.
+    """
+
+    def __init__(self, replay_file):
+        self.replay_file = replay_file
+        self.input_file = open(replay_file, "rb")
+
+        if self.input_file.readline() != REPLAY_MAGIC:
+            self.input_file.close()
+            raise ValueError(f"{replay_file} is not a replay file")
+
+        header = json.loads(self.input_file.readline())
+        self.seed = header["seed"]
+        # The replays recorded before the horde waves were added do not have any
+        self.horde_waves = header.get("horde_waves", False)
+        self.playing_keys = header["playing_keys"]
+        self.player_name = header["player_name"]
+
+        # The horde waves of the recorded game cannot be simulated without NumPy
+        if self.horde_waves and not numpy_available():
+            self.input_file.close()
+            raise ValueError(f"{replay_file} has horde waves, which need NumPy")
+
+        self.records = self.read_records()
+        self.next_record = next(self.records, None)
+        self.end_tick = None
+
+    def read_records(self):
+        """The read_records method reads the records of the file one block at a time."""
+        while True:
+            block = self.input_file.read(RECORD.size * READ_BLOCK_RECORDS)
+
+            # A game that crashed may have left a partial record at the end of the file
+            block = block[:len(block) - len(block) % RECORD.size]
+            if not block:
+                return
+
+            for tick, index, dx, dy in RECORD.iter_unpack(block):
+                yield tick, INPUTS[index], dx, dy
+
+    def inputs(self, tick):
+        """The inputs method returns the (name, dx, dy) inputs recorded before the given tick was simulated."""
+        inputs = []
+
+        while self.next_record is not None and self.next_record[0] <= tick:
+            _, name, dx, dy = self.next_record
+            if name == "end":
+                self.end_tick = self.next_record[0]
+            else:
+                inputs.append((name, dx, dy))
+
+            self.next_record = next(self.records, None)
+
+        return inputs
+
+    def finished(self, tick):
+        """The finished method checks if the recording has no inputs left for the given tick or later."""
+        return self.next_record is None and (self.end_tick is None or tick >= self.end_tick)
+
+    def close(self):
+        """The close method closes the replay file."""
+        self.input_file.close()
+
+def play_headless(replay_file, tick_time=None):
+    """
+    The play_headless function plays a replay file back on a headless simulation and returns it.
+    The optional tick_time function is called with the tick number and the seconds it took.
+    """
+    player = ReplayPlayer(replay_file)
+    simulation = Simulation(seed=player.seed, horde_waves=player.horde_waves)
+
+    try:
+        while not simulation.game_over_status:
+            for name, dx, dy in player.inputs(simulation.tick):
+                simulation.apply_input(name, dx, dy)
+
+            if player.finished(simulation.tick):
+                break
+
+            # Paused ticks are not counted, so a pause is resumed on the tick it started on or never
+            if simulation.paused:
+                break
+
+            start = time.perf_counter()
+            simulation.step()
+            if tick_time is not None and not simulation.paused:
+                tick_time(simulation.tick, time.perf_counter() - start, simulation.phase_times)
+    finally:
+        player.close()
+
+    return simulation
+
+def main(argv=None):
+    """The main function plays a replay file back headless and reports its slowest ticks."""
+    parser = argparse.ArgumentParser(description="Play a Galactic Onslaught replay back without the display.")
+    parser.add_argument("--replay", dest="replay_option", help=argparse.SUPPRESS)
+    parser.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--slowest", type=int, default=10, help="number of slowest ticks to report")
+    parser.add_argument("replay_file", nargs="?", help="replay file to play back")
+    args = parser.parse_args(argv)
+
+    replay_file = args.replay_file or args.replay_option
+    if replay_file is None:
+        parser.error("a replay file is required")
+
+    ticks = []
+    simulation = play_headless(replay_file, lambda tick, seconds, phase_times: ticks.append((seconds, tick, dict(phase_times))))
+
+    total = sum(seconds for seconds, _, _ in ticks)
+    print(f"Replayed {len(ticks)} ticks in {total:.3f} s, level {simulation.level}, score {simulation.score}")
+
+    # The slowest ticks point at the part of the session to profile
+    for seconds, tick, phase_times in sorted(ticks, key=lambda entry: entry[0], reverse=True)[:args.slowest]:
+        phases = ", ".join(f"{phase} {phase_times[phase] * 1000:.3f}" for phase in PHASES)
+        print(f"tick {tick:>7}: {seconds * 1000:7.3f} ms ({phases})")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,984 @@
+"""
+Galactic Onslaught - Simulation Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the game logic without any tkinter code. It holds the space fighter,
+the alien ships and the lasers, moves them, levels up the game and checks for collisions.
+Because nothing in this module needs a display, the game can be simulated headless for
+balancing and benchmarks, thousands of ticks at a time.
+
+Implementation:
+There are six classes in this module: Simulation, Entity, SpaceFighter, AlienShip, Laser,
+and HordeWave.
+
+    - The Simulation class represents the state of a game.
+        It advances the game by one tick every time its step method is called
+        and records the events (score, lives, level up, game over) of that tick,
+        so the Tk adapter in the main game module can render them.
+        The alien ships and the lasers are kept in arenas (entity_arena module),
+        which remove them at the end of each phase of the tick.
+
+    - The Entity class holds the sprite and animation timelines of an entity.
+        The animations are played on the simulation ticks by a single scheduler
+        (animation_scheduler module).
+
+    - The SpaceFighter, AlienShip and Laser classes represent the game entities.
+        They keep the position, speed and current sprite of each entity,
+        and the sprite animations run on the simulation ticks.
+
+    - The HordeWave class represents a wave of thousands of alien ships.
+        It keeps the alien ships and their lasers in NumPy arrays (entity_store module)
+        and applies the same movement, shooting and collision rules to all of them at once.
+        Every tenth wave of the game is a horde wave. Horde waves are optional and need NumPy.
+
+The main game module creates a Simulation and renders it on a Tk canvas.
+"""
+
+# Import modules
+import math
+import time
+import random
+import constants
+import collision
+from timer_wheel import TimerWheel
+from entity_arena import EntityArena
+from animation_scheduler import AnimationScheduler
+from entity_store import EntityArrays, numpy
+
+# Sprite files of the game entities
+SPACE_FIGHTER_SPRITES = {
+    "main": "assets/img/chr/space-fighter-main.png",
+    "super": "assets/img/chr/space-fighter-super.png",
+    "shot": "assets/img/chr/space-fighter-shot.png",
+    "destroyed": "assets/img/chr/space-fighter-destroyed.png",
+    "explosion": "assets/img/chr/space-fighter-explosion.png"
+    # Sprites generated using Canva's AI image generator Magic Media [https://www.canva.com/ai-image-generator/]
+    # Input prompt "3D 4K Animated and Futuristic Space Fighter. 2D view from the top of it. Place it on a black background."
+    # Background removed using Canva's Magic Studio [https://www.canva.com/magic/].
+    # Further modifications made using Canva's image editor [https://canva.com].
+    # Editable file available as view-only at https://www.canva.com/design/DAF0D65NA5U/6-y7e9e_xXZK_j7Iaaq5TQ/edit.
+}
+
+ALIEN_SHIP_SPRITES = {
+    "main": "assets/img/chr/alien-ship-main.png",
+    "destroyed": "assets/img/chr/alien-ship-destroyed.png",
+    "explosion": "assets/img/chr/alien-ship-explosion.png"
+    # Sprites generated using Canva's AI image generator Magic Media [https://www.canva.com/ai-image-generator/]
+    # Input prompt "3D Cartoon 4K Animated and Futuristic Alien UFO. 2D view from the top of it. Place it on a black background."
+    # Background removed using Canva's Magic Studio [https://www.canva.com/magic/].
+    # Additional graphic "Cosmic explosion orange" Anna Kuz on Canva's free media library [https://www.canva.com/features/free-stock-photos/].
+    # Further modifications made using Canva's image editor [https://canva.com].
+    # Editable file available as view-only at https://www.canva.com/design/DAF0GJfd7jU/PrEOAQ9Z_rp3vRWcLYkN3Q/edit
+}
+
+LASER_SPRITES = {
+    "main": "assets/img/clt/laser-beam.png",
+    "alt": "assets/img/clt/laser-beam-alt.png"
+    # Laser graphic made by me (Jean Paul Fernandez) using Adobe Photoshop [https://adobe.com/products/photoshop/].
+}
+
+# Number of ticks each animation frame is shown for (200 milliseconds)
+ANIMATION_TICKS = 200 * constants.GAME_SPEED // 1000
+
+# Timelines of the sprite animations of the space fighter, as (ticks after the start, sprite)
+# keyframes. A keyframe without a sprite removes the entity from the game.
+SPACE_FIGHTER_TIMELINES = {
+    "shot": ((0, "shot"), (ANIMATION_TICKS, "main")),
+    "destroyed": ((0, "destroyed"), (ANIMATION_TICKS, "explosion"), (2 * ANIMATION_TICKS, None))
+}
+
+# Timelines of the sprite animations of the alien ships
+ALIEN_SHIP_TIMELINES = {
+    "destroyed": ((0, "destroyed"), (ANIMATION_TICKS, "explosion"), (2 * ANIMATION_TICKS, None))
+}
+
+# Number of ticks between two shots of an alien ship (5000 milliseconds)
+SHOOT_DELAY_TICKS = 5000 * constants.GAME_SPEED // 1000
+
+# Number of moves per second of the space fighter while a movement key is held,
+# the key repeat rate its speed was tuned for
+MOVES_PER_SECOND = 30
+
+# Sprite states of the alien ships of a horde wave, stored as their index
+HORDE_SPRITES = ("main", "destroyed", "explosion")
+
+# Phases of a tick timed by the simulation
+PHASES = ("update_entities", "level_up", "check_collisions")
+
+class Simulation:
+    """
+    The Simulation class represents the state of a game and advances it tick by tick.
+
+    Parameters:
+    - seed: The seed of the random number generator (default is None, a random seed).
+    - horde_waves: A boolean indicating whether every tenth wave is a horde wave (default is None, when NumPy is installed).
+
+    Attributes:
+    - seed: The seed of the random number generator, kept so the game can be replayed.
+    - horde_waves: A boolean indicating whether every tenth wave is a horde wave.
+    - random: The random number generator used to spawn the alien ships.
+    - tick: The number of ticks simulated so far.
+    - score: The player's score.
+    - lives: The number of lives remaining.
+    - paused: A boolean indicating whether the game is paused.
+    - level: The current level of the game.
+    - game_over_status: A boolean indicating whether the game is over.
+    - scroll_speed: The speed at which the background scrolls.
+    - alien_ships: An instance of EntityArena containing the AlienShip instances representing enemy ships.
+    - alien_lasers: An instance of EntityArena containing the Laser instances shot by the alien ships.
+    - debris: A list containing the destroyed alien ships that are still animating.
+    - horde: An instance of HordeWave, or None if there is no horde wave.
+    - wave_length: The number of alien ships in a wave.
+    - alien_ship_speed: The speed of alien ships.
+    - alien_shots: An instance of TimerWheel holding the handle of every alien ship on the tick of its next shot.
+    - animations: An instance of AnimationScheduler playing the sprite animations of the entities.
+    - space_fighter: An instance of SpaceFighter representing the player's spaceship.
+    - collision_grid: An instance of SpatialHash used as the broad phase of the collision checks.
+    - events: A list of the (name, value) events recorded during the last tick.
+    - phase_times: A dictionary with the seconds spent in each phase of the last tick.
+    """
+
+    def __init__(self, seed=None, horde_waves=None):
+        # A random seed is drawn when none is given, so every game can be replayed from its seed
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.horde_waves = horde_waves if horde_waves is not None else numpy is not None
+        self.random = random.Random(self.seed)
+        self.tick = 0
+
+        # Define game variables
+        self.score = 0
+        self.lives = 3
+        self.paused = False
+        self.level = 0
+        self.game_over_status = False
+        self.scroll_speed = 0
+
+        # Store the alien ships in an arena
+        self.alien_ships = EntityArena()
+        self.debris = []
+
+        # The lasers of the alien ships belong to the game, so they outlive the alien ship that shot them
+        self.alien_lasers = EntityArena()
+        self.horde = None
+        self.wave_length = 0
+        self.alien_ship_speed = 0
+
+        # The alien ships shoot on the ticks scheduled in the timer wheel
+        self.alien_shots = TimerWheel()
+
+        # The sprite animations of every entity are played by a single scheduler
+        self.animations = AnimationScheduler()
+
+        # Create the space fighter
+        self.space_fighter = SpaceFighter(self)
+
+        # Create the spatial hash used as the broad phase of the collision checks
+        self.collision_grid = collision.SpatialHash()
+
+        self.events = []
+        self.phase_times = dict.fromkeys(PHASES, 0.0)
+
+    def step(self):
+        """The step method advances the game by one tick."""
+        self.events = []
+        phase_times = self.phase_times
+        phase_times.update(dict.fromkeys(PHASES, 0.0))
+
+        # Nothing moves or animates while the game is paused
+        if self.paused:
+            return
+
+        self.tick += 1
+        self.remember_positions()
+        self.advance_animations()
+
+        # Check if the game is not yet over
+        if not self.game_over_status:
+            start = time.perf_counter()
+
+            self.scroll_speed = self.alien_ship_speed // 2
+            self.update_entities()
+            self.flush_removals()
+            updated = time.perf_counter()
+
+            # Check if the player has destroyed an alien ship wave
+            if len(self.alien_ships) == 0 and not self.horde_alive() and not self.game_over_status:
+                self.level_up()
+            levelled_up = time.perf_counter()
+
+            self.check_collisions()
+            self.flush_removals()
+            checked = time.perf_counter()
+
+            phase_times["update_entities"] = updated - start
+            phase_times["level_up"] = levelled_up - updated
+            phase_times["check_collisions"] = checked - levelled_up
+
+    def entity_counts(self):
+        """The entity_counts method returns the number of entities of each type in the game."""
+        counts = {
+            "alien_ships": len(self.alien_ships),
+            "debris": len(self.debris),
+            "lasers": len(self.space_fighter.lasers),
+            "alien_lasers": len(self.alien_lasers),
+            "animations": len(self.animations)
+        }
+
+        # Add the entities of the horde wave
+        if self.horde is not None:
+            counts["alien_ships"] += len(self.horde.alien_ships)
+            counts["alien_lasers"] += len(self.horde.alien_lasers)
+            counts["animations"] += self.horde.animation_count()
+
+        return counts
+
+    def run(self, ticks):
+        """The run method simulates up to the given number of ticks or until the game is over."""
+        for _ in range(ticks):
+            if self.game_over_status:
+                break
+            self.step()
+
+    def remember_positions(self):
+        """The remember_positions method stores the position of every entity before the tick moves it."""
+        self.space_fighter.remember_position()
+
+        for laser in self.space_fighter.lasers:
+            laser.remember_position()
+
+        for alien_ship in self.alien_ships:
+            alien_ship.remember_position()
+
+        # The destroyed alien ships stand still, so their explosion is drawn where they were hit
+        for alien_ship in self.debris:
+            alien_ship.remember_position()
+
+        for alien_laser in self.alien_lasers:
+            alien_laser.remember_position()
+
+    def flush_removals(self):
+        """The flush_removals method drops the entities removed during a phase of the tick from their arenas."""
+        self.space_fighter.lasers.flush()
+        self.alien_ships.flush()
+        self.alien_lasers.flush()
+
+    def advance_animations(self):
+        """The advance_animations method shows the animation keyframes due on the current tick."""
+        removed = self.animations.advance(self.tick)
+
+        # Forget the destroyed alien ships once their animation has finished
+        if removed:
+            self.debris = [alien_ship for alien_ship in self.debris if not alien_ship.removed]
+
+    def update_entities(self):
+        """The update_entities method moves the space fighter, the lasers and the alien ships."""
+        # Move the space fighter in the direction of the held keys
+        self.space_fighter.move()
+
+        # Move the lasers
+        self.space_fighter.move_lasers()
+
+        # Move the alien ships
+        for alien_ship in self.alien_ships:
+            alien_ship.move()
+
+        # Move the alien lasers, removing those that went beyond the bottom of the canvas
+        for alien_laser in self.alien_lasers:
+            alien_laser.move()
+
+            if alien_laser.off_screen(constants.GAME_HEIGHT):
+                self.alien_lasers.remove(alien_laser)
+
+        # Shoot with the alien ships whose shot is due, without visiting the others.
+        # The handles of the alien ships destroyed since their shot was scheduled find nothing.
+        for handle in self.alien_shots.pop_due(self.tick):
+            alien_ship = self.alien_ships.get(handle)
+            if alien_ship is not None:
+                alien_ship.fire(self.tick)
+
+        # Move the horde wave, forgetting it once all its entities are gone
+        if self.horde is not None:
+            self.horde.step()
+
+            if self.horde.finished():
+                self.horde = None
+
+    def spawn_horde(self, count):
+        """The spawn_horde method spawns a horde wave of alien ships stored in NumPy arrays."""
+        self.horde = HordeWave(self, count, max(self.alien_ship_speed, 1))
+
+    def horde_alive(self):
+        """The horde_alive method checks if the horde wave still has alien ships to destroy."""
+        return self.horde is not None and self.horde.alive_count() > 0
+
+    def apply_input(self, name, dx=0, dy=0):
+        """The apply_input method applies an input of the player before the next tick."""
+        match name:
+            case "steer":
+                self.space_fighter.steer(dx, dy)
+            case "shoot":
+                self.space_fighter.shoot()
+            case "pause":
+                self.toggle_pause()
+            case "cheat":
+                self.space_fighter.update_sprite()
+
+    def toggle_pause(self):
+        """The toggle_pause method pauses or resumes the game."""
+        self.paused = not self.paused
+
+    def update_score(self):
+        """The update_score method updates the score of the player."""
+        self.score += 1 # Increment the score by 1
+        self.events.append(("score", self.score))
+
+    def update_lives(self):
+        """The update_lives method records the lives of the player and checks for game over."""
+        self.events.append(("lives", self.lives))
+
+        # Check if the player has no more lives
+        if self.lives <= 0 and not self.game_over_status:
+            self.game_over() # End the game
+
+    def destroy_alien_ship(self, alien_ship):
+        """The destroy_alien_ship method starts the destroyed animation of an alien ship."""
+        alien_ship.destroyed_animation()
+
+        # Remove the alien ship from the alien_ships arena
+        if alien_ship in self.alien_ships:
+            self.alien_ships.remove(alien_ship)
+            self.debris.append(alien_ship)
+
+    def level_up(self):
+        """The level_up method levels up the game and spawns more alien ships."""
+        self.level += 1 # Increment the level by 1
+        self.wave_length = int(self.level**0.7) + 2 # Calculate the wave length
+        self.alien_ship_speed = int(self.level**0.6) + 1 # Calculate the alien ship speed
+        self.space_fighter.speed = int(self.level**0.6)+14 # Calculate the space fighter speed
+
+        if self.lives < 3:
+            self.lives += 1 # Increment the lives by 1
+            self.update_lives()
+
+        self.events.append(("level_up", self.level))
+
+        # Every tenth wave is a horde wave
+        if self.horde_waves and self.level % constants.HORDE_WAVE_INTERVAL == 0:
+            self.spawn_horde(constants.HORDE_WAVE_SIZE)
+            return
+
+        # Spawn the alien ships for the next wave
+        for _ in range(self.wave_length):
+            new_alien_ship = AlienShip(self, self.alien_ship_speed)
+            self.alien_ships.add(new_alien_ship)
+
+            # The alien ships shoot as soon as they are on the screen
+            new_alien_ship.schedule_shot(self.tick + 1)
+
+    def game_over(self):
+        """The game_over method ends the game."""
+        self.game_over_status = True
+        self.events.append(("game_over", self.score))
+
+    def stop_game(self):
+        """The stop_game method stops and removes every entity of the game."""
+        # Set the paused status to True
+        self.paused = True
+
+        # Stop and remove the space fighter
+        self.space_fighter.speed = 0
+        self.space_fighter.remove_space_fighter()
+        self.space_fighter.lasers.clear()
+
+        # Stop and remove the alien ships and their lasers
+        for alien_ship in [*self.alien_ships, *self.debris]:
+            alien_ship.speed = 0
+            alien_ship.remove_alien_ship()
+
+        self.alien_ships.clear()
+        self.alien_lasers.clear()
+        self.debris = []
+        self.horde = None
+        self.animations.clear()
+
+    def hit_space_fighter(self):
+        """The hit_space_fighter method takes a life from the player unless the space fighter is protected."""
+        if self.space_fighter.current_sprite == "main":
+            self.lives -= 1 # Decrement the lives by 1
+            self.update_lives()
+            self.space_fighter.shot_animation() # Play the shot animation
+
+    def check_collisions(self):
+        """The check_collisions method checks for collisions between game elements."""
+        grid = self.collision_grid
+        grid.clear()
+
+        space_fighter = self.space_fighter
+
+        # Insert the alien ships, alien lasers and player lasers into the spatial hash,
+        # each with the box it swept during the tick
+        for alien_ship in self.alien_ships:
+            grid.insert("alien_ships", alien_ship, *self.swept_box(alien_ship))
+
+        for alien_laser in self.alien_lasers:
+            grid.insert("alien_lasers", alien_laser, *self.swept_box(alien_laser))
+
+        for laser in space_fighter.lasers:
+            grid.insert("lasers", laser, *self.swept_box(laser))
+
+        # The hit entities leave their arenas at once, so the later checks skip them,
+        # and are dropped from the lists of the arenas at the end of the tick
+        space_fighter_box = self.swept_box(space_fighter)
+
+        # Check if the player has been hit by an alien laser
+        for alien_laser in grid.query("alien_lasers", *space_fighter_box):
+            if self.swept_collision(space_fighter, alien_laser):
+                self.hit_space_fighter()
+                self.alien_lasers.remove(alien_laser) # Remove the alien laser
+
+        # Check if the player has been hit by an alien ship
+        for alien_ship in grid.query("alien_ships", *space_fighter_box):
+            if self.swept_collision(space_fighter, alien_ship):
+                self.hit_space_fighter()
+
+                if space_fighter.current_sprite == "super":
+                    self.update_score()
+
+                self.destroy_alien_ship(alien_ship) # Remove the alien ship
+
+        # Check if the alien ship has been hit by a laser
+        for alien_ship in self.alien_ships:
+            if alien_ship not in self.alien_ships:
+                continue
+
+            for laser in grid.query("lasers", *self.swept_box(alien_ship)):
+                if laser in space_fighter.lasers and self.swept_collision(alien_ship, laser):
+                    self.update_score()
+
+                    self.destroy_alien_ship(alien_ship) # Remove the alien ship
+                    space_fighter.lasers.remove(laser) # Remove the laser
+                    break
+
+        if self.horde is not None:
+            self.horde.check_collisions()
+
+    def swept_box(self, entity):
+        """The swept_box method returns the box covering an entity at its previous and current positions."""
+        mask = entity.mask()
+        x, y = int(entity.x), int(entity.y)
+        dx = int(entity.previous_x) - x
+        dy = int(entity.previous_y) - y
+
+        # Grow the box towards the previous position
+        if dx < 0:
+            x, dx = x + dx, -dx
+        if dy < 0:
+            y, dy = y + dy, -dy
+        return x, y, mask.width + dx, mask.height + dy
+
+    def swept_collision(self, entity1, entity2):
+        """The swept_collision method checks if two entities collided anywhere along the paths they moved during the tick."""
+        x1, y1 = int(entity1.previous_x), int(entity1.previous_y)
+        x2, y2 = int(entity2.previous_x), int(entity2.previous_y)
+
+        return entity1.mask().sweep(
+            x1, y1, int(entity1.x) - x1, int(entity1.y) - y1,
+            entity2.mask(),
+            x2, y2, int(entity2.x) - x2, int(entity2.y) - y2)
+
+class Entity:
+    """
+    The Entity class holds the sprite and animation timelines shared by the game entities.
+
+    Attributes:
+    - sprite_files: A dictionary containing the sprite files of the entity.
+    - timelines: A dictionary containing the animation timelines of the entity.
+    - current_sprite: The current sprite of the entity.
+    - removed: A boolean indicating whether the entity has been removed from the game.
+    - previous_x, previous_y: The position of the entity before the last tick, used to
+        interpolate the rendered position between two ticks.
+    - handle: The (slot, generation) handle of the entity in its EntityArena, or None.
+    """
+
+    sprite_files = {}
+    timelines = {}
+
+    def __init__(self, current_sprite):
+        self.current_sprite = current_sprite
+        self.removed = False
+        self.handle = None
+
+        # Build the collision masks of the sprites once, they are shared by every entity
+        collision.build_masks(self.sprite_files)
+
+    def mask(self):
+        """The mask method returns the collision mask of the current sprite."""
+        return collision.get_mask(self.sprite_files[self.current_sprite])
+
+    def remember_position(self):
+        """The remember_position method stores the current position as the previous position."""
+        self.previous_x = self.x
+        self.previous_y = self.y
+
+    def interpolate(self, alpha):
+        """The interpolate method returns the position between the previous and current position."""
+        return (
+            self.previous_x + (self.x - self.previous_x) * alpha,
+            self.previous_y + (self.y - self.previous_y) * alpha)
+
+class SpaceFighter(Entity):
+    """
+    The SpaceFighter class represents the space fighter in the game.
+    It manages the movement and shooting of the space fighter.
+
+    Parameters:
+    - simulation: The Simulation the space fighter belongs to.
+
+    Attributes:
+    - simulation: The Simulation the space fighter belongs to.
+    - x: The x-coordinate of the space fighter.
+    - y: The y-coordinate of the space fighter.
+    - current_sprite: The current sprite of the space fighter.
+    - speed: The speed of the space fighter.
+    - width: The width of the space fighter.
+    - height: The height of the space fighter.
+    - lasers: An instance of EntityArena containing the Laser instances shot by the space fighter.
+    - direction: The (dx, dy) direction the space fighter is steered in, each -1, 0 or 1.
+    """
+
+    sprite_files = SPACE_FIGHTER_SPRITES
+    timelines = SPACE_FIGHTER_TIMELINES
+
+    def __init__(self, simulation):
+        super().__init__("main")
+        self.simulation = simulation
+
+        # Set the initial position of the space fighter
+        self.x = constants.GAME_WIDTH // 2
+        self.y = constants.GAME_HEIGHT - 90
+        self.remember_position()
+
+        # Properties of the space fighter
+        self.speed = 0
+        self.width = 150
+        self.height = 150
+
+        # Create an arena to store the lasers
+        self.lasers = EntityArena()
+
+        # The space fighter stands still until it is steered
+        self.direction = (0, 0)
+
+    def update_sprite(self, _=None):
+        """The update_sprite method toggles the space fighter between its main and super sprites."""
+        if self.current_sprite == "main":
+            self.current_sprite = "super"
+
+        elif self.current_sprite == "super":
+            self.current_sprite = "main"
+
+    def steer(self, dx, dy):
+        """The steer method sets the direction the space fighter moves in on the next ticks."""
+        self.direction = (dx, dy)
+
+    def move(self):
+        """The move method moves the space fighter one tick in its direction, diagonally in a single update."""
+        dx, dy = self.direction
+        if not dx and not dy:
+            return
+
+        distance = self.speed * MOVES_PER_SECOND / constants.GAME_SPEED
+        half_width = self.width / 2 + 15
+
+        # Keep the space fighter between the edges of the canvas and below the top limit of the game
+        x = min(max(self.x + dx * distance, half_width), constants.GAME_WIDTH - half_width)
+        y = min(max(self.y + dy * distance, self.height / 2 + 400), constants.GAME_HEIGHT - (self.height / 2 + 15))
+
+        # Only move along the axes that are steered, so a space fighter past a limit is not pulled back
+        if dx:
+            self.x = x
+        if dy:
+            self.y = y
+
+    def shoot(self, _=None):
+        """The shoot method shoots a laser from the space fighter."""
+
+        # Create a laser at the current position of the space fighter
+        laser = Laser(self.x, self.y - 40, self.speed - 5, "up", "main")
+
+        # Add the laser to the arena of lasers
+        self.lasers.add(laser)
+
+    def move_lasers(self):
+        """The move_lasers method moves the lasers in the arena of lasers."""
+        for laser in self.lasers:
+            laser.move()
+
+            # Remove the lasers that went beyond the top of the canvas
+            if laser.off_screen(0):
+                self.lasers.remove(laser)
+
+    def shot_animation(self):
+        """The shot_animation method animates the space fighter when it gets hit by a laser."""
+        self.simulation.animations.start(self, "shot", self.simulation.tick)
+
+    def destroyed_animation(self):
+        """The destroyed_animation method animates the space fighter when it gets destroyed and explodes."""
+        self.simulation.animations.start(self, "destroyed", self.simulation.tick)
+
+    def remove_space_fighter(self):
+        """The remove_space_fighter method removes the space fighter from the game."""
+        self.removed = True
+
+class AlienShip(Entity):
+    """
+    The AlienShip class represents the alien ship in the game.
+    It manages the movement and shooting of the alien ship.
+    A new wave of alien ships is created every time the player
+    destroys an alien ship wave.
+
+    Parameters:
+    - simulation: The Simulation the alien ship belongs to.
+    - speed: The speed of the alien ship.
+
+    Attributes:
+    - simulation: The Simulation the alien ship belongs to.
+    - x: The x-coordinate of the alien ship.
+    - y: The y-coordinate of the alien ship.
+    - current_sprite: The current sprite of the alien ship.
+    - speed: The speed of the alien ship.
+    - width: The width of the alien ship.
+    - height: The height of the alien ship.
+    """
+
+    sprite_files = ALIEN_SHIP_SPRITES
+    timelines = ALIEN_SHIP_TIMELINES
+
+    def __init__(self, simulation, speed):
+        super().__init__("main")
+        self.simulation = simulation
+
+        # Set the initial position of the alien ship
+        self.x = 0
+        self.y = 0
+
+        # Properties of the alien ship
+        self.speed = speed
+        self.width = 100
+        self.height = 100
+
+        # Create the alien ship
+        self.create_alien_ship()
+
+    def create_alien_ship(self):
+        """The create_alien_ship method places the alien ship randomly above the screen."""
+        self.x = self.simulation.random.randint(75, constants.GAME_WIDTH - 75)
+        self.y = self.simulation.random.randint(-900, 0)
+        self.remember_position()
+
+    def move(self):
+        """The move method moves the alien ship downwards."""
+
+        # Move the alien ship downwards
+        self.y += self.speed
+        self.x += 2 * math.sin(self.y / 50)
+
+        # Remove the alien ship if it goes beyond the bottom of the canvas
+        if self.off_screen(constants.GAME_HEIGHT):
+            self.simulation.destroy_alien_ship(self)
+
+            # Update the lives of the player
+            self.simulation.lives -= 1
+            self.simulation.update_lives()
+
+    def schedule_shot(self, tick):
+        """The schedule_shot method schedules the next shot of the alien ship on a tick, by its handle."""
+        self.simulation.alien_shots.schedule(tick, self.handle)
+
+    def fire(self, tick):
+        """The fire method shoots the shot scheduled on this tick, or delays it until the alien ship is on the screen."""
+        # An alien ship above the screen shoots on the first tick it is on the screen
+        if self.y <= 0:
+            self.schedule_shot(tick + math.floor(-self.y / self.speed) + 1)
+            return
+
+        alien_laser = self.shoot()
+
+        # The laser moves on the tick it is shot, like the lasers already on the way
+        alien_laser.move()
+
+        self.schedule_shot(tick + SHOOT_DELAY_TICKS)
+
+    def shoot(self):
+        """The shoot method shoots a laser from the alien ship and returns it."""
+
+        # Create a laser at the current position of the alien ship
+        alien_laser = Laser(self.x, self.y + 40, self.speed + 3, "down", "alt")
+
+        # The laser belongs to the game, so it keeps going once the alien ship is destroyed
+        self.simulation.alien_lasers.add(alien_laser)
+        return alien_laser
+
+    def off_screen(self, height):
+        """The off_screen method checks if the alien ship is off the screen."""
+        return self.y >= height
+
+    def destroyed_animation(self):
+        """The destroyed_animation method animates the explosion of the alien ship."""
+
+        # Stop the alien ship from moving
+        self.speed = 0
+
+        self.simulation.animations.start(self, "destroyed", self.simulation.tick)
+
+    def remove_alien_ship(self):
+        """The remove_alien_ship method removes the alien ship from the game."""
+        self.removed = True
+
+class Laser(Entity):
+    """
+    The Laser class represents a laser beam in the game.
+    It manages the movement of the laser.
+
+    Parameters:
+    - x: The initial x-coordinate of the laser.
+    - y: The initial y-coordinate of the laser.
+    - speed: The speed of the laser beam (default is 10).
+    - direction: The direction of the laser ("up" or "down", default is "up").
+    - sprite: The sprite of the laser ("main" or "alt", default is "main").
+
+    Attributes:
+    - x: The current x-coordinate of the laser.
+    - y: The current y-coordinate of the laser.
+    - speed: The speed of the laser beam.
+    - direction: The direction of the laser ("up" or "down").
+    - current_sprite: The current sprite of the laser.
+    """
+
+    sprite_files = LASER_SPRITES
+
+    def __init__(self, x, y, speed = 10, direction = "up", sprite = "main"):
+        super().__init__(sprite)
+
+        # Set the initial position of the laser
+        self.x = x
+        self.y = y
+        self.remember_position()
+
+        # Speed and direction of the laser
+        self.speed = speed
+        self.direction = direction
+
+    def move(self):
+        """The move method moves the laser beam upwards or downwards."""
+
+        # Move the laser beam upwards or downwards according to its direction
+        if self.direction == "up":
+            self.y -= self.speed
+        elif self.direction == "down":
+            self.y += self.speed
+
+    def off_screen(self, height):
+        """The off_screen method checks if the laser is off the screen."""
+        # Check if the laser is off the screen according to its direction
+        if self.direction == "up":
+            # Return True if the laser is above the canvas
+            return self.y <= height
+
+        if self.direction == "down":
+            # Return True if the laser is below the canvas
+            return self.y >= height
+
+        # If the direction is not up or down, return none
+        return None
+
+class HordeWave:
+    """
+    The HordeWave class represents a wave of thousands of alien ships stored in NumPy arrays.
+    The alien ships follow the rules of the AlienShip class, but every tick moves, animates,
+    culls and prefilters all of them with vectorized operations.
+
+    Parameters:
+    - simulation: The Simulation the horde wave belongs to.
+    - count: The number of alien ships in the wave.
+    - speed: The speed of the alien ships.
+
+    Attributes:
+    - simulation: The Simulation the horde wave belongs to.
+    - alien_ships: An instance of EntityArrays holding the alien ships.
+    - alien_lasers: An instance of EntityArrays holding the lasers shot by the alien ships.
+    """
+
+    def __init__(self, simulation, count, speed):
+        if numpy is None:
+            raise ImportError("NumPy is required for horde waves")
+
+        self.simulation = simulation
+
+        alien_ship_mask = collision.get_mask(ALIEN_SHIP_SPRITES["main"])
+        alien_laser_mask = collision.get_mask(LASER_SPRITES["alt"])
+
+        self.alien_ships = EntityArrays(alien_ship_mask.width, alien_ship_mask.height, count)
+        self.alien_lasers = EntityArrays(alien_laser_mask.width, alien_laser_mask.height, count)
+
+        # Place the alien ships randomly above the screen, as AlienShip does
+        x = [simulation.random.randint(75, constants.GAME_WIDTH - 75) for _ in range(count)]
+        y = [simulation.random.randint(-900, 0) for _ in range(count)]
+        self.alien_ships.extend(numpy.array(x, dtype="float64"), numpy.array(y, dtype="float64"), speed, 1)
+
+    def alive_count(self):
+        """The alive_count method returns the number of alien ships that are not destroyed."""
+        return int(numpy.count_nonzero(self.alien_ships.view("sprite") == 0))
+
+    def finished(self):
+        """The finished method checks if every alien ship and laser of the wave is gone."""
+        return len(self.alien_ships) == 0 and len(self.alien_lasers) == 0
+
+    def step(self):
+        """The step method moves, animates and culls the alien ships and lasers of the wave."""
+        alien_ships = self.alien_ships
+        alien_lasers = self.alien_lasers
+
+        alien_ships.remember_positions()
+        alien_lasers.remember_positions()
+
+        self.advance_animations()
+
+        # Move the alien lasers and remove the ones below the canvas
+        alien_lasers.move()
+        alien_lasers.keep(alien_lasers.view("y") < constants.GAME_HEIGHT)
+
+        # Move the alien ships that are not destroyed downwards along their sine path
+        alive = alien_ships.view("sprite") == 0
+        alien_ships.move()
+        alien_ships.sway(alive)
+
+        # Destroy the alien ships that went beyond the bottom of the canvas
+        escaped = alive & (alien_ships.view("y") >= constants.GAME_HEIGHT)
+        escaped_count = int(numpy.count_nonzero(escaped))
+        if escaped_count:
+            self.destroy(escaped)
+            alive &= ~escaped
+
+            # Update the lives of the player
+            self.simulation.lives -= escaped_count
+            self.simulation.update_lives()
+
+        # Shoot a laser from every alien ship whose shoot delay has passed
+        cooldown = alien_ships.view("cooldown")
+        cooldown -= 1
+        shooting = numpy.flatnonzero(alive & (cooldown <= 0) & (alien_ships.view("y") > 0))
+        if len(shooting):
+            alien_lasers.extend(
+                alien_ships.x[shooting],
+                alien_ships.y[shooting] + 40,
+                alien_ships.speed[shooting] + 3,
+                1)
+            cooldown[shooting] = SHOOT_DELAY_TICKS
+
+    def advance_animations(self):
+        """The advance_animations method advances the destroyed and explosion animations."""
+        sprite = self.alien_ships.view("sprite")
+        timer = self.alien_ships.view("timer")
+
+        animating = sprite != 0
+        timer[animating] -= 1
+        expired = animating & (timer <= 0)
+
+        # Exploded alien ships are removed, destroyed alien ships start exploding
+        finished = expired & (sprite == 2)
+        exploding = expired & (sprite == 1)
+        sprite[exploding] = 2
+        timer[exploding] = ANIMATION_TICKS
+
+        if finished.any():
+            self.alien_ships.keep(~finished)
+
+    def animation_count(self):
+        """The animation_count method returns the number of alien ships of the wave playing an animation."""
+        return int(numpy.count_nonzero(self.alien_ships.view("sprite")))
+
+    def destroy(self, mask):
+        """The destroy method starts the destroyed animation of the masked alien ships."""
+        self.alien_ships.view("sprite")[mask] = 1
+        self.alien_ships.view("speed")[mask] = 0
+        self.alien_ships.view("timer")[mask] = ANIMATION_TICKS
+
+    def check_collisions(self):
+        """The check_collisions method checks for collisions between the wave and the space fighter."""
+        simulation = self.simulation
+        space_fighter = simulation.space_fighter
+        alien_ships = self.alien_ships
+        alien_lasers = self.alien_lasers
+
+        space_fighter_box = simulation.swept_box(space_fighter)
+        alien_laser_mask = collision.get_mask(LASER_SPRITES["alt"])
+
+        # Check if the player has been hit by an alien laser, prefiltered by swept bounding box
+        candidates = alien_lasers.swept_overlapping(*space_fighter_box)
+
+        hit_alien_lasers = []
+        for index in candidates:
+            if self.swept_collision(alien_lasers, index, alien_laser_mask, space_fighter):
+                simulation.hit_space_fighter()
+                hit_alien_lasers.append(index)
+
+        if hit_alien_lasers:
+            kept = numpy.ones(len(alien_lasers), dtype=bool)
+            kept[hit_alien_lasers] = False
+            alien_lasers.keep(kept)
+
+        # Check if the player has been hit by an alien ship, with the swept boxes of the alien ships computed once
+        alive = alien_ships.view("sprite") == 0
+        alien_ship_boxes = alien_ships.swept_boxes()
+        candidates = alien_ships.swept_overlapping(*space_fighter_box, alien_ship_boxes)
+        candidates = candidates[alive[candidates]]
+
+        for index in candidates:
+            if self.alien_ship_collision(index, space_fighter):
+                simulation.hit_space_fighter()
+
+                if space_fighter.current_sprite == "super":
+                    simulation.update_score()
+
+                alive[index] = False
+                self.destroy(index)
+
+        # Check if the alien ships have been hit by a laser
+        for laser in space_fighter.lasers:
+            # The lasers that hit an alien ship of the regular wave this tick are already removed
+            if laser not in space_fighter.lasers:
+                continue
+
+            candidates = alien_ships.swept_overlapping(*simulation.swept_box(laser), alien_ship_boxes)
+            candidates = candidates[alive[candidates]]
+
+            for index in candidates:
+                if self.alien_ship_collision(index, laser):
+                    simulation.update_score()
+
+                    alive[index] = False
+                    self.destroy(index)
+                    space_fighter.lasers.remove(laser) # Remove the laser
+                    break
+
+    def alien_ship_collision(self, index, entity):
+        """The alien_ship_collision method checks if an alien ship of the wave collided with an entity during the tick."""
+        alien_ship_mask = collision.get_mask(ALIEN_SHIP_SPRITES[HORDE_SPRITES[self.alien_ships.sprite[index]]])
+        return self.swept_collision(self.alien_ships, index, alien_ship_mask, entity)
+
+    def swept_collision(self, arrays, index, mask, entity):
+        """The swept_collision method checks if an entity of the wave collided with an entity along their paths during the tick."""
+        x1, y1 = int(arrays.previous_x[index]), int(arrays.previous_y[index])
+        x2, y2 = int(entity.previous_x), int(entity.previous_y)
+
+        return mask.sweep(
+            x1, y1, int(arrays.x[index]) - x1, int(arrays.y[index]) - y1,
+            entity.mask(),
+            x2, y2, int(entity.x) - x2, int(entity.y) - y2)
@@ -0,0 +1,107 @@
+"""
+Galactic Onslaught - Sprite Registry Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the sprite registry class, which loads each image under assets/img
+once, the first time it is requested, and hands out shared PhotoImage references. Every
+laser, alien ship and menu button that uses the same file draws from the same decoded image
+instead of reading and decoding the PNG file again.
+
+Implementation:
+This module is imported by the main game module and the menu handler module. A single
+process-wide registry is created in this module as sprites, and images are requested from
+it with their file path, for example sprites.get("assets/img/clt/laser-beam.png"). The asset
+preloader module reads files ahead of time and hands their contents to load_data, and the
+images are read from the asset bundle instead of the PNG files when use_bundle was called.
+"""
+
+# Import modules
+import os
+from tkinter import PhotoImage, TclError
+
+# Directory containing every image asset of the game
+ASSETS_DIRECTORY = "assets/img"
+
+class SpriteRegistry:
+    """
+    The SpriteRegistry class loads each image file once and shares it across the game.
+
+    Parameters:
+    - directory: The directory containing the image assets (default is assets/img).
+
+    Attributes:
+    - directory: The directory containing the image assets.
+    - images: A dictionary mapping file paths to their loaded PhotoImage.
+    - bundle: The asset bundle the images are loaded from, or None to load the PNG files.
+    """
+
+    def __init__(self, directory=ASSETS_DIRECTORY):
+        self.directory = directory
+        self.images = {}
+        self.bundle = None
+
+    def get(self, file):
+        """The get method returns the shared image of a file, loading it on first use."""
+        image = self.images.get(file)
+
+        if image is None:
+            image = self.add_image(file, self.load_image(file))
+
+        return image
+
+    def load_image(self, file):
+        """The load_image method loads the image of a file from the asset bundle, or from the file itself."""
+        if self.bundle is not None and file in self.bundle:
+            try:
+                return PhotoImage(data=self.bundle.image_data(file))
+            except TclError:
+                pass # Fall back to the PNG file if Tk cannot read the bundled image
+
+        return PhotoImage(file=file)
+
+    def bundle_data(self, file):
+        """The bundle_data method returns the bundled data of a file, or None if it is not bundled."""
+        if self.bundle is not None and file in self.bundle:
+            return self.bundle.image_data(file)
+
+        return None
+
+    def use_bundle(self, bundle):
+        """The use_bundle method loads the images that are not loaded yet from an asset bundle."""
+        self.bundle = bundle
+
+    def load_data(self, file, data):
+        """The load_data method loads the image of a file from its already read (base64 or bundled) contents."""
+        image = self.images.get(file)
+
+        if image is None:
+            try:
+                image = self.add_image(file, PhotoImage(data=data))
+            except TclError:
+                image = self.add_image(file, PhotoImage(file=file))
+
+        return image
+
+    def add_image(self, file, image):
+        """The add_image method stores the loaded image of a file."""
+        self.images[file] = image
+        return image
+
+    def asset_files(self):
+        """The asset_files method returns the paths of every image under the assets directory."""
+        files = []
+        for directory, _, file_names in os.walk(self.directory):
+            for file_name in sorted(file_names):
+                if file_name.endswith(".png"):
+                    files.append(f"{directory}/{file_name}")
+
+        return sorted(files)
+
+# Process-wide sprite registry shared by every module of the game
+sprites = SpriteRegistry()
@@ -0,0 +1,74 @@
+"""
+Galactic Onslaught - Timer Wheel Module
+Author: Jean Paul Fernandez
+Date: 2023-11-24
+Version: 1.0
+Language: Python 3.11.2
+IDE: Visual Studio Code 1.84.2
+Development Platform: MacOs Sonoma 14.1
+
+Description:
+This module contains the timer wheel class, a hashed timer wheel that schedules timers on
+the ticks of the simulation. The wheel is a ring of slots, one per tick, and a timer due on
+a given tick is kept in the slot of that tick modulo the number of slots. Advancing to a tick
+only looks at the slot of that tick, so the cost of a tick grows with the number of timers
+that are due, not with the number of timers scheduled. Timers further away than one turn of
+the wheel stay in their slot until the turn they are due on. A slot is only created when a
+timer is scheduled in it and dropped once it is empty, so an idle wheel takes no memory.
+
+The wheel is driven by the simulation ticks, which stop while the game is paused, so the
+timers pause with the game.
+
+Implementation:
+This module is imported by the simulation module, which schedules the shots of the alien
+ships on a TimerWheel.
+"""
+
+class TimerWheel:
+    """
+    The TimerWheel class schedules items on ticks and hands back the items due on each tick.
+
+    Parameters:
+    - size: The number of slots of the wheel, one tick each (default is 512).
+
+    Attributes:
+    - size: The number of slots of the wheel.
+    - slots: A dictionary mapping tick modulo size to the list of (tick, item) timers of that slot.
+    - count: The number of timers scheduled.
+    """
+
+    def __init__(self, size=512):
+        self.size = size
+        self.slots = {}
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def schedule(self, tick, item):
+        """The schedule method schedules an item on a tick that has not been popped yet."""
+        self.slots.setdefault(tick % self.size, []).append((tick, item))
+        self.count += 1
+
+    def pop_due(self, tick):
+        """The pop_due method removes and returns the items due on a tick, in the order they were scheduled."""
+        index = tick % self.size
+        slot = self.slots.get(index)
+        if slot is None:
+            return []
+
+        due = [item for due_tick, item in slot if due_tick <= tick]
+
+        # Timers of a later turn of the wheel stay in the slot, an empty slot is dropped
+        if len(due) == len(slot):
+            del self.slots[index]
+        else:
+            slot[:] = [(due_tick, item) for due_tick, item in slot if due_tick > tick]
+
+        self.count -= len(due)
+        return due
+
+    def clear(self):
+        """The clear method removes every timer from the wheel."""
+        self.slots.clear()
+        self.count = 0